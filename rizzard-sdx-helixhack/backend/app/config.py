@@ -63,10 +63,74 @@ class Settings(BaseSettings):
         "sentence-transformers/all-MiniLM-L6-v2",
         env="EMBEDDING_MODEL_NAME",
     )
+    # "torch" (reference), "torch-int8" (dynamic int8 quantisation) or "onnx"
+    # (ONNX Runtime; EMBEDDING_ONNX_FILE selects e.g. a quantised export).
+    embedding_backend: str = Field("torch", env="EMBEDDING_BACKEND")
+    # Texts per model.encode call; batches are formed from texts of similar length.
+    embedding_batch_size: int = Field(32, env="EMBEDDING_BATCH_SIZE")
+    embedding_onnx_file: Optional[str] = Field(None, env="EMBEDDING_ONNX_FILE")
+    # Texts embedded per batch by /embed/stream; bounds its memory per request.
+    embed_stream_batch_size: int = Field(256, env="EMBED_STREAM_BATCH_SIZE")
+    # Load the embedding model in the background at startup so the first
+    # /embed or /profiles/search request does not pay for it.
+    embedding_warmup: bool = Field(True, env="EMBEDDING_WARMUP")
     helixdb_local: bool = Field(True, env="HELIXDB_LOCAL")
     helixdb_verbose: bool = Field(False, env="HELIXDB_VERBOSE")
     helixdb_endpoint: Optional[str] = Field(None, env="HELIXDB_ENDPOINT")
     helixdb_api_key: Optional[str] = Field(None, env="HELIXDB_API_KEY")
+    helixdb_backend: str = Field("helix", env="HELIXDB_BACKEND")
+    helix_memory_latency_ms: float = Field(0.0, env="HELIX_MEMORY_LATENCY_MS")
+    helix_memory_jitter_ms: float = Field(0.0, env="HELIX_MEMORY_JITTER_MS")
+    helix_memory_seed_from_artifact: bool = Field(False, env="HELIX_MEMORY_SEED_FROM_ARTIFACT")
+    corpus_artifact_path: Optional[str] = Field(None, env="CORPUS_ARTIFACT_PATH")
+    firecrawl_connect_timeout_seconds: float = Field(5.0, env="FIRECRAWL_CONNECT_TIMEOUT_SECONDS")
+    firecrawl_read_timeout_seconds: float = Field(30.0, env="FIRECRAWL_READ_TIMEOUT_SECONDS")
+    resilience_max_attempts: int = Field(3, env="RESILIENCE_MAX_ATTEMPTS")
+    resilience_base_delay_seconds: float = Field(0.5, env="RESILIENCE_BASE_DELAY_SECONDS")
+    resilience_max_delay_seconds: float = Field(10.0, env="RESILIENCE_MAX_DELAY_SECONDS")
+    resilience_retry_budget_ratio: float = Field(0.2, env="RESILIENCE_RETRY_BUDGET_RATIO")
+    circuit_failure_threshold: int = Field(5, env="CIRCUIT_FAILURE_THRESHOLD")
+    circuit_reset_timeout_seconds: float = Field(30.0, env="CIRCUIT_RESET_TIMEOUT_SECONDS")
+    url_force_https: bool = Field(True, env="URL_FORCE_HTTPS")
+    scraper_default_backend: str = Field("firecrawl", env="SCRAPER_DEFAULT_BACKEND")
+    scraper_direct_domains: str = Field("profiles.ucsd.edu", env="SCRAPER_DIRECT_DOMAINS")
+    direct_fetch_pool_size: int = Field(10, env="DIRECT_FETCH_POOL_SIZE")
+    direct_fetch_connect_timeout_seconds: float = Field(5.0, env="DIRECT_FETCH_CONNECT_TIMEOUT_SECONDS")
+    direct_fetch_read_timeout_seconds: float = Field(15.0, env="DIRECT_FETCH_READ_TIMEOUT_SECONDS")
+    crawl_min_host_interval_seconds: float = Field(1.0, env="CRAWL_MIN_HOST_INTERVAL_SECONDS")
+    crawl_max_concurrency: int = Field(4, env="CRAWL_MAX_CONCURRENCY")
+    crawl_profile_url_pattern: str = Field(
+        r"^https?://profiles\.ucsd\.edu/[A-Za-z0-9._-]+/?$",
+        env="CRAWL_PROFILE_URL_PATTERN",
+    )
+    direct_fetch_user_agent: str = Field("RizzardProfileBot/0.1", env="DIRECT_FETCH_USER_AGENT")
+    raw_archive_dir: Optional[str] = Field(None, env="RAW_ARCHIVE_DIR")
+    raw_archive_codec: str = Field("auto", env="RAW_ARCHIVE_CODEC")
+    raw_archive_segment_bytes: int = Field(64 * 1024 * 1024, env="RAW_ARCHIVE_SEGMENT_BYTES")
+    search_cache_max_entries: int = Field(256, env="SEARCH_CACHE_MAX_ENTRIES")
+    search_cache_ttl_seconds: float = Field(300.0, env="SEARCH_CACHE_TTL_SECONDS")
+    # Every process that writes professors grows this file by one byte, and
+    # cached searches are keyed on its size, so writes from other workers and
+    # scripts on the host invalidate them too. Empty: this process only.
+    corpus_version_file: Optional[str] = Field(
+        str(BACKEND_DIR / "data" / ".corpus_version"), env="CORPUS_VERSION_FILE"
+    )
+    # Multi-vector profiles: each profile is also stored as up to
+    # PROFILE_MAX_CHUNKS chunk vectors (summary, page sections, publications).
+    profile_chunking: bool = Field(True, env="PROFILE_CHUNKING")
+    profile_chunk_chars: int = Field(800, env="PROFILE_CHUNK_CHARS")
+    profile_max_chunks: int = Field(24, env="PROFILE_MAX_CHUNKS")
+    # Search chunks as well as summaries and aggregate chunk hits per professor:
+    # "max" ranks by the best chunk, "top-m" sums the best CHUNK_AGGREGATION_M.
+    chunk_search: bool = Field(True, env="CHUNK_SEARCH")
+    chunk_search_oversample: int = Field(4, env="CHUNK_SEARCH_OVERSAMPLE")
+    chunk_aggregation: str = Field("max", env="CHUNK_AGGREGATION")
+    chunk_aggregation_m: int = Field(3, env="CHUNK_AGGREGATION_M")
+    # Keep per-profile scoring features (tokens, department, seniority,
+    # recency) in columnar arrays, filled at ingest and on first scoring. The
+    # store starts over once it holds FEATURE_STORE_MAX_ROWS rows.
+    feature_store: bool = Field(True, env="FEATURE_STORE")
+    feature_store_max_rows: int = Field(200_000, env="FEATURE_STORE_MAX_ROWS")
 
     class Config:
         env_file = str(ENV_FILE) if ENV_FILE.exists() else ".env"
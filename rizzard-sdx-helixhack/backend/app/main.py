@@ -1,12 +1,42 @@
 """Application entrypoint for the Rizzard AI FastAPI microservice."""
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from .config import Settings, get_settings
-from .routers import email, embed, process_profile, profiles, project, score, scrape
+from .routers import email, embed, health, metrics, process_profile, profiles, project, score, scrape
+from .services.embedding import warm_up
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up_embeddings(settings: Settings) -> None:
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, warm_up, settings)
+    except Exception as exc:  # pragma: no cover - readiness reports the failure
+        logger.error("Embedding model warm-up failed: %s", exc, exc_info=True)
+
+
+def _lifespan(app_settings: Settings):
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Warm up in the background: the server starts accepting requests
+        # (and answering /health) immediately; /health/ready flips when done.
+        task = None
+        if app_settings.embedding_warmup:
+            task = asyncio.create_task(_warm_up_embeddings(app_settings))
+        app.state.warmup_task = task
+        yield
+        if task is not None and not task.done():
+            task.cancel()
+
+    return lifespan
 
 
 def create_app(settings: Optional[Settings] = None) -> FastAPI:
@@ -17,6 +47,7 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         title="Rizzard AI Microservice",
         description="FastAPI microservice powering AI/ML features for Rizzard",
         version="0.1.0",
+        lifespan=_lifespan(app_settings),
     )
 
     # Add CORS middleware to allow frontend to call backend
@@ -39,6 +70,8 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
     app.include_router(process_profile.router)
     app.include_router(profiles.router)
     app.include_router(scrape.router)
+    app.include_router(metrics.router)
+    app.include_router(health.router)
 
     return app
 
@@ -12,13 +12,31 @@ class EmbedRequest(BaseModel):
 
     texts: list[str] = Field(..., description="Text inputs to embed")
     normalize: bool = Field(True, description="Whether to L2-normalize the embeddings")
+    encoding: Literal["float", "float32", "float16", "int8"] = Field(
+        "float",
+        description=(
+            "'float' returns JSON float lists; 'float32', 'float16' and 'int8' return the "
+            "little-endian matrix base64-encoded in 'data' (or as the raw body when the "
+            "request sends Accept: application/octet-stream)"
+        ),
+    )
 
 
 class EmbedResponse(BaseModel):
     """Response payload containing generated embeddings."""
 
-    embeddings: list[list[float]] = Field(..., description="Embedding vectors matching the order of input texts")
+    embeddings: Optional[list[list[float]]] = Field(
+        None, description="Embedding vectors matching the order of input texts ('float' encoding)"
+    )
     model: str = Field(..., description="Identifier of the embedding model used")
+    encoding: str = Field("float", description="Encoding of the returned vectors")
+    data: Optional[str] = Field(
+        None, description="Base64 of the row-major little-endian matrix (binary encodings)"
+    )
+    shape: Optional[list[int]] = Field(None, description="[rows, dimensions] of 'data'")
+    scales: Optional[list[float]] = Field(
+        None, description="Per-row int8 scale factors: vector[i] = data[i] * scales[i]"
+    )
 
 
 class ProfileActivitySignals(BaseModel):
@@ -97,6 +115,14 @@ class ScoreRequest(BaseModel):
     rerank_strategy: Literal["semantic", "hybrid"] = Field(
         "hybrid", description="Optional rerank hint for the scoring pipeline"
     )
+    top_k: Optional[int] = Field(
+        None,
+        ge=1,
+        description=(
+            "Return only the top_k best-scoring profiles, best first; all profiles in "
+            "request order when omitted"
+        ),
+    )
 
 
 class ScoreResponse(BaseModel):
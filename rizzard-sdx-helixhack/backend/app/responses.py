@@ -0,0 +1,56 @@
+"""JSON responses rendered straight from already-validated models.
+
+When an endpoint returns a model, FastAPI validates it again against
+``response_model``, converts it to plain Python data and then ``json.dumps``
+it. For large nested responses (``ScoreResponse`` with 100 results) that work
+costs more than the scoring itself. Returning :class:`ModelJSONResponse`
+skips all of it: pydantic-core serialises the model to bytes in one pass.
+Other content goes through ``orjson`` when it is installed and pydantic-core
+otherwise. Keep ``response_model`` on the route for the OpenAPI schema.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+try:  # pragma: no cover - optional speed-up
+    import orjson
+except ImportError:  # pragma: no cover - pydantic-core handles everything
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def dump_json(content: Any, *, exclude_none: bool = False) -> bytes:
+    """Serialise a model (without re-validating it) or plain data to JSON bytes.
+
+    ``exclude_none`` applies to models only.
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content, exclude_none=exclude_none)
+    if orjson is not None:
+        return orjson.dumps(content, default=to_jsonable_python, option=_ORJSON_OPTIONS)
+    return to_json(content)
+
+
+class ModelJSONResponse(JSONResponse):
+    """``JSONResponse`` that renders with :func:`dump_json`."""
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        *,
+        exclude_none: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        self.exclude_none = exclude_none
+        super().__init__(content, status_code=status_code, headers=headers, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content, exclude_none=self.exclude_none)
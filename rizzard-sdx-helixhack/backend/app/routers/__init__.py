@@ -1,10 +1,12 @@
 """Router modules for the Rizzard AI microservice."""
 
-from . import email, embed, process_profile, profiles, project, score, scrape
+from . import email, embed, health, metrics, process_profile, profiles, project, score, scrape
 
 __all__ = [
     "email",
     "embed",
+    "health",
+    "metrics",
     "process_profile",
     "profiles",
     "project",
@@ -1,30 +1,258 @@
 """Embedding endpoints for the Rizzard AI microservice."""
 
-from fastapi import APIRouter, Depends, status
+import base64
+import json
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from ..config import Settings, get_settings
 from ..models.schemas import EmbedRequest, EmbedResponse
-from ..services.embedding import embed_texts
+from ..responses import ModelJSONResponse
+from ..services.embedding import embed_texts, embed_texts_array
+from ..services.vectors import EncodedEmbeddings, encode_embeddings, float32_to_list
 
 router = APIRouter(prefix="/embed", tags=["Embedding"])
 
+OCTET_STREAM = "application/octet-stream"
+NDJSON = "application/x-ndjson"
+# Longest accepted input line; bounds the read buffer of /embed/stream.
+MAX_STREAM_LINE_BYTES = 1024 * 1024
+
 
-@router.post("", response_model=EmbedResponse, status_code=status.HTTP_200_OK)
+@router.post(
+    "",
+    response_model=EmbedResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={200: {"content": {OCTET_STREAM: {}}}},
+)
 async def generate_embeddings(
     payload: EmbedRequest,
+    request: Request,
     settings: Settings = Depends(get_settings),
-) -> EmbedResponse:
+):
     """Generate embeddings for the supplied texts.
 
-    The implementation will load a SentenceTransformers model and return normalized
-    vector representations for each input string. This stub exists so the endpoint
-    is wired into the app before the ML logic is implemented.
+    ``encoding`` picks the wire format: JSON float lists (``float``, the
+    default) or a base64 little-endian ``float32``/``float16``/``int8`` matrix.
+    With ``Accept: application/octet-stream`` the matrix is returned as the raw
+    body instead (``float`` then means float32), described by the
+    ``X-Embedding-*`` headers; int8 bodies end with one float32 scale per row.
     """
 
-    embeddings, model_name = embed_texts(
+    raw = prefers_octet_stream(request.headers.get("accept", ""))
+    if payload.encoding == "float" and not raw:
+        # Off the event loop: during warm-up this waits for the model to load.
+        embeddings, model_name = await run_in_threadpool(
+            embed_texts,
+            payload.texts,
+            normalize=payload.normalize,
+            settings=settings,
+        )
+        return ModelJSONResponse(
+            EmbedResponse(embeddings=embeddings, model=model_name), exclude_none=True
+        )
+
+    matrix, model_name = await run_in_threadpool(
+        embed_texts_array,
         payload.texts,
         normalize=payload.normalize,
         settings=settings,
     )
+    encoded = encode_embeddings(matrix, payload.encoding)
+    if raw:
+        return Response(
+            content=encoded.to_bytes(),
+            media_type=OCTET_STREAM,
+            headers=encoding_headers(encoded, model_name),
+        )
+    return ModelJSONResponse(
+        EmbedResponse(
+            model=model_name,
+            encoding=encoded.encoding,
+            data=base64.b64encode(encoded.data).decode("ascii"),
+            shape=list(encoded.shape),
+            scales=encoded.scales.tolist() if encoded.scales is not None else None,
+        ),
+        exclude_none=True,
+    )
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """A streaming response whose body iterator still reads the request body.
+
+    On ASGI servers older than spec 2.4 (uvicorn included) Starlette's
+    ``StreamingResponse`` listens for disconnects by calling ``receive``
+    itself, which would swallow the request body chunks. This class skips
+    that listener; a client that drops mid-upload still ends the stream through
+    ``Request.stream()``.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+@router.post(
+    "/stream",
+    response_class=DuplexStreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={200: {"content": {NDJSON: {}}}},
+)
+async def stream_embeddings(
+    request: Request,
+    normalize: bool = Query(True, description="Whether to L2-normalize the embeddings"),
+    encoding: Literal["float", "float32", "float16", "int8"] = Query(
+        "float", description="'float' lists, or base64 little-endian rows"
+    ),
+    batch_size: Optional[int] = Query(
+        None, ge=1, le=4096, description="Texts per batch (default: EMBED_STREAM_BATCH_SIZE)"
+    ),
+    settings: Settings = Depends(get_settings),
+) -> DuplexStreamingResponse:
+    """Embed an NDJSON body of texts, streaming NDJSON vectors batch by batch.
+
+    Each input line is a JSON string or an object ``{"text": ..., "id": ...}``.
+    Each output line is ``{"index", "id"?, "embedding"}`` for ``float`` or
+    ``{"index", "id"?, "data", "scale"?}`` for the binary encodings; unreadable
+    lines yield ``{"index", "error"}``. A final ``{"done": true, ...}`` line
+    marks a complete stream. Only one batch is held in memory at a time.
+    """
+
+    size = batch_size or settings.embed_stream_batch_size
+
+    async def produce() -> AsyncIterator[bytes]:
+        batch: List[Tuple[int, Any, str]] = []
+        count = failed = 0
+        async for index, line in _enumerate_lines(request.stream()):
+            if line is None:
+                failed += 1
+                yield _ndjson({"index": index, "error": "Line too long"})
+                break
+            try:
+                item_id, text = _parse_stream_item(line)
+            except ValueError as exc:
+                failed += 1
+                yield _ndjson({"index": index, "error": str(exc)})
+                continue
+            batch.append((index, item_id, text))
+            if len(batch) >= size:
+                yield await _embed_stream_batch(batch, normalize, encoding, settings)
+                count += len(batch)
+                batch = []
+        if batch:
+            yield await _embed_stream_batch(batch, normalize, encoding, settings)
+            count += len(batch)
+        yield _ndjson({"done": True, "count": count, "failed": failed})
+
+    return DuplexStreamingResponse(
+        produce(),
+        media_type=NDJSON,
+        headers={"X-Embedding-Model": settings.embedding_model_name},
+    )
+
+
+async def _enumerate_lines(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """Yield ``(index, line)`` for non-blank lines as the body arrives.
+
+    ``line`` is ``None`` (and iteration stops) once a line exceeds
+    :data:`MAX_STREAM_LINE_BYTES`.
+    """
+
+    buffer = b""
+    index = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield index, line
+                index += 1
+        if len(buffer) > MAX_STREAM_LINE_BYTES:
+            yield index, None
+            return
+    if buffer.strip():
+        yield index, buffer
+
+
+def _parse_stream_item(line: bytes) -> Tuple[Any, str]:
+    try:
+        item = json.loads(line)
+    except ValueError as exc:
+        raise ValueError(f"Invalid JSON: {exc}") from exc
+    if isinstance(item, str):
+        return None, item
+    if isinstance(item, dict) and isinstance(item.get("text"), str):
+        return item.get("id"), item["text"]
+    raise ValueError('Expected a JSON string or an object with a "text" string')
+
+
+async def _embed_stream_batch(
+    batch: List[Tuple[int, Any, str]],
+    normalize: bool,
+    encoding: str,
+    settings: Settings,
+) -> bytes:
+    matrix, _ = await run_in_threadpool(
+        embed_texts_array,
+        [text for _, _, text in batch],
+        normalize=normalize,
+        settings=settings,
+    )
+    rows: List[Dict[str, Any]] = [
+        {"index": index} if item_id is None else {"index": index, "id": item_id}
+        for index, item_id, _ in batch
+    ]
+    if encoding == "float":
+        for row, vector in zip(rows, float32_to_list(matrix)):
+            row["embedding"] = vector
+    else:
+        encoded = encode_embeddings(matrix, encoding)
+        width = len(encoded.data) // max(1, len(rows))
+        data = memoryview(encoded.data)
+        for position, row in enumerate(rows):
+            row["data"] = base64.b64encode(data[position * width : (position + 1) * width]).decode(
+                "ascii"
+            )
+            if encoded.scales is not None:
+                row["scale"] = float(encoded.scales[position])
+    return b"".join(_ndjson(row) for row in rows)
+
+
+def _ndjson(record: Dict[str, Any]) -> bytes:
+    return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def prefers_octet_stream(accept: str) -> bool:
+    """Whether ``accept`` ranks application/octet-stream above JSON."""
+
+    ranks = {}
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        ranks[media_type.strip().lower()] = quality
+    octet = ranks.get(OCTET_STREAM, 0.0)
+    return octet > 0.0 and octet >= ranks.get("application/json", 0.0)
+
 
-    return EmbedResponse(embeddings=embeddings, model=model_name)
+def encoding_headers(encoded: EncodedEmbeddings, model_name: str) -> dict:
+    rows, dimensions = encoded.shape
+    return {
+        "X-Embedding-Model": model_name,
+        "X-Embedding-Encoding": "float32" if encoded.encoding == "float" else encoded.encoding,
+        "X-Embedding-Dtype": encoded.dtype,
+        "X-Embedding-Shape": f"{rows},{dimensions}",
+    }
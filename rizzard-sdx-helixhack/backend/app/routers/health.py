@@ -0,0 +1,35 @@
+"""Liveness and readiness probes for the Rizzard AI microservice."""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Response, status
+
+from ..config import Settings, get_settings
+from ..services.embedding import model_ready, model_status
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+async def liveness() -> Dict[str, Any]:
+    """Report that the process is up; never touches the model or HelixDB."""
+
+    return {"status": "ok"}
+
+
+@router.get("/ready", status_code=status.HTTP_200_OK)
+async def readiness(
+    response: Response,
+    settings: Settings = Depends(get_settings),
+) -> Dict[str, Any]:
+    """Return 200 once the embedding model is loaded, 503 while it is still warming up.
+
+    With warm-up disabled the model loads on first use, so the service is
+    reported ready immediately.
+    """
+
+    embedding = model_status(settings)
+    ready = model_ready(settings) or not settings.embedding_warmup
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"status": "ready" if ready else "starting", "embedding_model": embedding}
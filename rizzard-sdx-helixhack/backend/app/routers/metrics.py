@@ -0,0 +1,16 @@
+"""Operational metrics endpoints for the Rizzard AI microservice."""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, status
+
+from ..services.metrics import collect_metrics
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+async def get_metrics() -> Dict[str, Any]:
+    """Return in-process metrics such as dependency circuit breaker state."""
+
+    return collect_metrics()
@@ -4,16 +4,24 @@ from __future__ import annotations
 
 import logging
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Hashable, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter, ValidationError
 
 from ..config import Settings, get_settings
-from ..models.schemas import ProfileInput, ScoreRequest, ScoreResponse
-from ..services.embedding import embed_texts
-from ..services.helixdb_service import HelixDBService
+from ..models.schemas import ProfileActivitySignals, ProfileInput, ScoreRequest, ScoreResponse
+from ..responses import ModelJSONResponse
+from ..services.chunk_search import search_professors_multi_vector
+from ..services.embedding import embed_query
+from ..services.helixdb_service import HelixDBService, SearchFilters
 from ..services.match import score_profiles as score_profiles_service
+from ..services.resilience import CircuitOpenError
 from ..services.scrape_orchestrator import ScrapeOrchestrator
+from ..services.search_cache import get_search_cache, search_cache_key
+from ..services.singleflight import get_async_singleflight
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +40,35 @@ async def search_profiles(
         False,
         description="If true, apply the Helix schema before inserting missing professors",
     ),
+    department: Optional[str] = Query(
+        None, description="Only return professors in this department (exact match)"
+    ),
+    hiring: bool = Query(False, description="Only return professors marked as hiring"),
+    updated_after: Optional[str] = Query(
+        None, description="Only return profiles updated on or after this ISO-8601 date/time"
+    ),
+    updated_before: Optional[str] = Query(
+        None, description="Only return profiles updated on or before this ISO-8601 date/time"
+    ),
     settings: Settings = Depends(get_settings),
-) -> ScoreResponse:
+) -> ModelJSONResponse:
     """Search HelixDB for relevant professors, scraping new URLs on-demand."""
 
+    for label, value in (("updated_after", updated_after), ("updated_before", updated_before)):
+        if value:
+            try:
+                datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError as exc:
+                raise HTTPException(
+                    status_code=400, detail=f"{label} must be an ISO-8601 date or datetime"
+                ) from exc
+    filters = SearchFilters(
+        department=(department or "").strip() or None,
+        hiring=hiring,
+        updated_after=updated_after or None,
+        updated_before=updated_before or None,
+    )
+
     try:
         helix_service = HelixDBService(settings=settings)
     except Exception as exc:  # pragma: no cover - Helix env issues
@@ -49,7 +82,8 @@ async def search_profiles(
     if urls:
         try:
             orchestrator = ScrapeOrchestrator(settings=settings, helix_service=helix_service)
-            scrape_summary = orchestrator.run(
+            scrape_summary = await run_in_threadpool(
+                orchestrator.run,
                 urls,
                 initialize_schema=initialize_schema,
             )
@@ -62,14 +96,72 @@ async def search_profiles(
                 detail="Failed to scrape one or more URLs. Check logs for details.",
             ) from exc
 
-    query_embeddings, _ = embed_texts([query], settings=settings)
-    if not query_embeddings:
+    # Keyed after any scrape above so its inserts already bumped the corpus version.
+    cache_key = search_cache_key(query, limit, filters, settings=settings)
+    try:
+        # Duplicates await the leader on the event loop instead of each holding a
+        # threadpool worker while it runs.
+        response = await get_async_singleflight("search").do(
+            cache_key,
+            run_in_threadpool,
+            _search_and_score,
+            cache_key,
+            query,
+            limit,
+            filters,
+            helix_service,
+            settings,
+        )
+    except CircuitOpenError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="HelixDB is temporarily unavailable. Try again shortly.",
+            headers={"Retry-After": str(max(1, int(exc.retry_in)))},
+        ) from exc
+
+    if scrape_summary:
+        logger.info(
+            "Scraped %s/%s URLs prior to search",
+            scrape_summary.success_count,
+            scrape_summary.total,
+        )
+
+    return ModelJSONResponse(response)
+
+
+def _search_and_score(
+    cache_key: Hashable,
+    query: str,
+    limit: int,
+    filters: SearchFilters,
+    helix_service: HelixDBService,
+    settings: Settings,
+) -> ScoreResponse:
+    """Embed, search, and score one query; concurrent duplicates share the result."""
+
+    cache = get_search_cache(settings)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    query_embedding, _ = embed_query(query, settings=settings)
+    if not query_embedding:
         return ScoreResponse(results=[])
 
-    search_records = helix_service.search_similar_professors(
-        query_embeddings[0],
-        limit=limit,
-    )
+    if settings.chunk_search:
+        search_records = search_professors_multi_vector(
+            helix_service,
+            query_embedding,
+            limit=limit,
+            filters=filters,
+            settings=settings,
+        )
+    else:
+        search_records = helix_service.search_similar_professors(
+            query_embedding,
+            limit=limit,
+            filters=filters,
+        )
     if not search_records:
         return ScoreResponse(results=[])
 
@@ -84,73 +176,74 @@ async def search_profiles(
     )
 
     response = score_profiles_service(score_request, settings=settings)
-
-    if scrape_summary:
-        logger.info(
-            "Scraped %s/%s URLs prior to search",
-            scrape_summary.success_count,
-            scrape_summary.total,
-        )
-
+    cache.set(cache_key, response)
     return response
 
 
 def _records_to_profiles(records: List[dict]) -> List[ProfileInput]:
+    """Build profiles from Helix records, validating them all in one pydantic-core call.
+
+    Store records already carry the declared types, so the cost is per-model
+    overhead rather than validation proper. One ``TypeAdapter`` call over the
+    whole list avoids that overhead; on pydantic 2 ``model_construct`` loops
+    over the fields in Python and is slower than either. If the batch fails,
+    records are validated one by one and a malformed legacy vertex (say a
+    non-string ``title``) is dropped rather than failing the whole search.
+    """
+    rows = [row for row in map(_profile_fields, records) if row is not None]
+    try:
+        return _PROFILE_LIST.validate_python(rows)
+    except ValidationError:
+        pass
     profiles: List[ProfileInput] = []
-    for record in records:
-        props = record if isinstance(record, dict) else {}
-        if not props:
-            continue
-        keywords = props.get("keywords") or []
-        if isinstance(keywords, str):
-            keywords = [part.strip() for part in keywords.split(",") if part.strip()]
-        elif not isinstance(keywords, list):
-            keywords = [str(keywords)]
-
-        profile_id = (
-            props.get("profile_id")
-            or props.get("id")
-            or props.get("_id")
-            or props.get("profile_url")
-            or str(uuid.uuid4())
-        )
-        name = props.get("name") or props.get("profile_url") or "Unknown Professor"
-        summary = props.get("summary") or ""
+    for row in rows:
+        try:
+            profiles.append(ProfileInput.model_validate(row))
+        except ValidationError as exc:
+            logger.debug("Skipping malformed Helix record %s: %s", row, exc)
+    return profiles
 
-        # Extract activity_signals from flattened fields or nested object
-        from ..models.schemas import ProfileActivitySignals
 
-        activity_signals = None
-        if props.get("activity_signals"):
-            signals_data = props.get("activity_signals")
-            if isinstance(signals_data, dict):
-                activity_signals = ProfileActivitySignals(**signals_data)
-            elif isinstance(signals_data, ProfileActivitySignals):
-                activity_signals = signals_data
-        elif any(
-            props.get(key)
-            for key in ["recent_publications", "news_mentions", "hiring", "last_updated"]
-        ):
-            activity_signals = ProfileActivitySignals(
-                recent_publications=props.get("recent_publications") or [],
-                news_mentions=props.get("news_mentions") or [],
-                hiring=props.get("hiring", False),
-                last_updated=props.get("last_updated") or "",
-            )
+_PROFILE_LIST = TypeAdapter(List[ProfileInput])
 
-        try:
-            profile = ProfileInput(
-                profile_id=str(profile_id),
-                name=str(name),
-                title=props.get("title"),
-                department=props.get("department"),
-                summary=str(summary),
-                keywords=[str(keyword) for keyword in keywords if keyword],
-                activity_signals=activity_signals,
-            )
-        except Exception as exc:
-            logger.debug("Skipping malformed Helix record %s: %s", props, exc)
-            continue
-        profiles.append(profile)
 
-    return profiles
+def _profile_fields(props: object) -> Optional[dict]:
+    """``ProfileInput`` fields of one Helix record, or None for an empty one."""
+    if not props or not isinstance(props, dict):
+        return None
+    get = props.get
+    keywords = get("keywords") or []
+    if isinstance(keywords, str):
+        keywords = [part.strip() for part in keywords.split(",") if part.strip()]
+    elif not isinstance(keywords, list):
+        keywords = [str(keywords)]
+
+    profile_id = (
+        get("profile_id") or get("id") or get("_id") or get("profile_url") or str(uuid.uuid4())
+    )
+
+    # Extract activity_signals from the nested object or flattened fields
+    signals = get("activity_signals")
+    if isinstance(signals, (dict, ProfileActivitySignals)) and signals:
+        activity_signals = signals
+    elif not signals and (
+        get("recent_publications") or get("news_mentions") or get("hiring") or get("last_updated")
+    ):
+        activity_signals = {
+            "recent_publications": get("recent_publications") or [],
+            "news_mentions": get("news_mentions") or [],
+            "hiring": get("hiring", False),
+            "last_updated": get("last_updated") or "",
+        }
+    else:
+        activity_signals = None
+
+    return {
+        "profile_id": str(profile_id),
+        "name": str(get("name") or get("profile_url") or "Unknown Professor"),
+        "title": get("title"),
+        "department": get("department"),
+        "summary": str(get("summary") or ""),
+        "keywords": [str(keyword) for keyword in keywords if keyword],
+        "activity_signals": activity_signals,
+    }
@@ -1,9 +1,11 @@
 """Scoring endpoints for the Rizzard AI microservice."""
 
 from fastapi import APIRouter, Depends, status
+from fastapi.concurrency import run_in_threadpool
 
 from ..config import Settings, get_settings
 from ..models.schemas import ScoreRequest, ScoreResponse
+from ..responses import ModelJSONResponse
 from ..services.match import score_profiles as score_profiles_service
 
 router = APIRouter(prefix="/score", tags=["Scoring"])
@@ -13,7 +15,9 @@ router = APIRouter(prefix="/score", tags=["Scoring"])
 async def score_profiles(
     payload: ScoreRequest,
     settings: Settings = Depends(get_settings),
-) -> ScoreResponse:
+) -> ModelJSONResponse:
     """Calculate semantic, compatibility, and feasibility scores for profiles."""
 
-    return score_profiles_service(payload, settings=settings)
+    # Off the event loop: embedding may wait for the model to load during warm-up.
+    response = await run_in_threadpool(score_profiles_service, payload, settings=settings)
+    return ModelJSONResponse(response)
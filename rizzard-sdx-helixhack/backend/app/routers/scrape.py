@@ -1,6 +1,7 @@
 """API endpoints for professor scraping orchestration."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from ..config import Settings, get_settings
 from ..models.schemas import ScrapeProfessorsRequest, ScrapeProfessorsResponse
@@ -26,7 +27,9 @@ async def scrape_professors(
     if not payload.urls:
         raise HTTPException(status_code=400, detail="At least one URL is required.")
 
-    summary = orchestrator.run(
+    # Scraping, embedding and Helix writes all block; keep them off the event loop.
+    summary = await run_in_threadpool(
+        orchestrator.run,
         payload.urls,
         initialize_schema=payload.initialize_schema,
     )
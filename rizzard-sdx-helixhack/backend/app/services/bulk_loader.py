@@ -0,0 +1,325 @@
+"""Parallel, idempotent bulk loading of professor records into HelixDB.
+
+The seeding scripts hand :class:`BulkLoader` a list of records and their
+embeddings. Records are keyed on their canonical ``profile_url``: new ones
+are inserted in batches through ``InsertProfessors``, changed ones are
+replaced (the new vertex is inserted, then the old one deleted by id) and
+identical ones are left alone, so re-running
+a seed is cheap and never creates duplicates. ``dry_run`` stops after the
+lookups and reports what would have happened.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .helixdb_service import (
+    HelixDBService,
+    _extract_professor_properties,
+    _extract_vertex_id,
+    build_professor_payload,
+)
+from .vectors import VectorLike
+
+logger = logging.getLogger(__name__)
+
+ProgressFn = Callable[[str, int, int], None]
+
+# Payload fields compared against the stored vertex to decide whether a record
+# changed. The vector is left out: Helix does not return it from lookups, and
+# it is derived from the summary, which is compared.
+COMPARED_FIELDS = (
+    "profile_id",
+    "name",
+    "title",
+    "department",
+    "summary",
+    "keywords",
+    "recent_publications",
+    "news_mentions",
+    "hiring",
+    "last_updated",
+    "rerank_strategy",
+)
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a bulk load. In a dry run the counts are what would happen."""
+
+    total: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+    dry_run: bool = False
+    elapsed_seconds: float = 0.0
+
+    def fail(self, label: str, exc: Any, count: int = 1) -> None:
+        self.failed += count
+        self.errors.append(f"{label}: {exc}")
+
+    def summary_lines(self) -> List[str]:
+        suffix = " (dry run)" if self.dry_run else ""
+        lines = [
+            f"  Inserted{suffix}: {self.inserted}",
+            f"  Updated{suffix}: {self.updated}",
+            f"  Unchanged: {self.unchanged}",
+        ]
+        if self.skipped:
+            lines.append(f"  Changed but not updated: {self.skipped}")
+        if self.duplicates:
+            lines.append(f"  Duplicate URLs in input: {self.duplicates}")
+        lines.append(f"  Failed: {self.failed}")
+        lines.extend(f"    {error}" for error in self.errors[:20])
+        if len(self.errors) > 20:
+            lines.append(f"    ... {len(self.errors) - 20} more")
+        lines.append(f"  Total: {self.total} in {self.elapsed_seconds:.2f}s")
+        return lines
+
+
+def console_progress(stage: str, done: int, total: int) -> None:
+    """Progress callback that redraws a single line on stderr."""
+    end = "\n" if done >= total else ""
+    sys.stderr.write(f"\r  {stage:<8} {done}/{total}{end}")
+    sys.stderr.flush()
+
+
+def add_loader_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the flags shared by the seeding scripts."""
+    group = parser.add_argument_group("loading")
+    group.add_argument("--dry-run", action="store_true", help="Report what would change; write nothing")
+    group.add_argument("--concurrency", type=int, default=8, help="Parallel Helix requests")
+    group.add_argument("--batch-size", type=int, default=100, help="Professors per bulk insert")
+    group.add_argument(
+        "--no-update", action="store_true", help="Leave changed professors as they are"
+    )
+    group.add_argument(
+        "--force-update", action="store_true", help="Replace existing professors even if unchanged"
+    )
+    group.add_argument(
+        "--no-bulk-query",
+        action="store_true",
+        help="Insert one professor per query (for Helix deployments without InsertProfessors)",
+    )
+    group.add_argument("--quiet", action="store_true", help="Hide progress output")
+
+
+def loader_from_args(helix: HelixDBService, args: argparse.Namespace) -> "BulkLoader":
+    return BulkLoader(
+        helix,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        update_existing=not args.no_update,
+        force_update=args.force_update,
+        use_bulk_query=not args.no_bulk_query,
+        dry_run=args.dry_run,
+        progress=None if args.quiet else console_progress,
+    )
+
+
+def _same(stored: Any, wanted: Any) -> bool:
+    # Helix may hand back None for empty lists/strings and False for unset booleans.
+    return stored == wanted or (not stored and not wanted)
+
+
+def record_changed(existing: Dict[str, Any], payload: Dict[str, Any]) -> bool:
+    # Flatten first: Helix may nest the stored fields under "properties".
+    stored = _extract_professor_properties(existing)
+    return any(not _same(stored.get(key), payload.get(key)) for key in COMPARED_FIELDS)
+
+
+class BulkLoader:
+    """Load professor records with upsert semantics and bounded concurrency."""
+
+    def __init__(
+        self,
+        helix: HelixDBService,
+        *,
+        concurrency: int = 8,
+        batch_size: int = 100,
+        update_existing: bool = True,
+        force_update: bool = False,
+        use_bulk_query: bool = True,
+        dry_run: bool = False,
+        progress: Optional[ProgressFn] = None,
+    ) -> None:
+        self.helix = helix
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.update_existing = update_existing
+        self.force_update = force_update
+        self.use_bulk_query = use_bulk_query
+        self.dry_run = dry_run
+        self.progress = progress
+
+    def load(
+        self, records: Sequence[Dict[str, Any]], embeddings: Sequence[VectorLike]
+    ) -> LoadReport:
+        """Upsert ``records`` (row-aligned with ``embeddings``) and report the outcome."""
+        started = time.perf_counter()
+        report = LoadReport(total=len(records), dry_run=self.dry_run)
+        payloads, source_urls = self._prepare(records, embeddings, report)
+
+        existing = self._lookup(source_urls, report)
+        to_insert: List[Dict[str, Any]] = []
+        to_replace: List[Tuple[str, Dict[str, Any]]] = []
+        for url, payload in payloads.items():
+            if url not in existing:
+                continue  # lookup failed; already counted
+            current = existing[url]
+            if current is None:
+                to_insert.append(payload)
+            elif not (self.force_update or record_changed(current, payload)):
+                report.unchanged += 1
+            elif not self.update_existing:
+                report.skipped += 1
+            else:
+                to_replace.append((_extract_vertex_id(current), payload))
+
+        if self.dry_run:
+            report.inserted = len(to_insert)
+            report.updated = len(to_replace)
+        else:
+            report.inserted = len(self._insert(to_insert, report))
+            report.updated = self._replace(to_replace, report)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def _prepare(
+        self,
+        records: Sequence[Dict[str, Any]],
+        embeddings: Sequence[VectorLike],
+        report: LoadReport,
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """Build payloads keyed on canonical URL; the first record for a URL wins.
+
+        Also returns each canonical URL's original record URL, which the
+        existence lookup needs to find vertices stored before canonicalisation.
+        """
+        force_https = self.helix.settings.url_force_https
+        payloads: Dict[str, Dict[str, Any]] = {}
+        source_urls: Dict[str, str] = {}
+        for idx, record in enumerate(records):
+            label = record.get("name") or record.get("profile_url") or f"record {idx}"
+            embedding = embeddings[idx] if idx < len(embeddings) else None
+            if embedding is None or not len(embedding):
+                report.fail(label, "no embedding")
+                continue
+            if not record.get("profile_url"):
+                report.fail(label, "no profile_url to key the record on")
+                continue
+            payload = build_professor_payload(record, embedding, force_https=force_https)
+            if payload["profile_url"] in payloads:
+                report.duplicates += 1
+                continue
+            payloads[payload["profile_url"]] = payload
+            source_urls[payload["profile_url"]] = record["profile_url"]
+        return payloads, source_urls
+
+    def _run(
+        self,
+        stage: str,
+        fn: Callable[[Any], Any],
+        items: Sequence[Any],
+        sizes: Optional[Sequence[int]] = None,
+    ):
+        """Yield ``(item, result, error)`` for ``fn`` over ``items`` in completion order."""
+        if not items:
+            return
+        total = sum(sizes) if sizes is not None else len(items)
+        done = 0
+        if self.progress is not None:
+            self.progress(stage, done, total)
+        with ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(items)), thread_name_prefix="bulk-load"
+        ) as pool:
+            futures = {pool.submit(fn, item): idx for idx, item in enumerate(items)}
+            for future in as_completed(futures):
+                idx = futures[future]
+                result, error = None, None
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    error = exc
+                yield items[idx], result, error
+                done += sizes[idx] if sizes is not None else 1
+                if self.progress is not None:
+                    self.progress(stage, done, total)
+
+    def _lookup(
+        self, source_urls: Dict[str, str], report: LoadReport
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Find the stored vertex for each canonical URL, searching by the record's URL."""
+        existing: Dict[str, Optional[Dict[str, Any]]] = {}
+        lookups = list(source_urls.items())
+        for (url, _), record, exc in self._run(
+            "lookup", lambda item: self.helix.get_professor_by_url(item[1]), lookups
+        ):
+            if exc is not None:
+                report.fail(url, exc)
+            else:
+                existing[url] = record
+        return existing
+
+    def _replace(self, to_replace: List[Tuple[str, Dict[str, Any]]], report: LoadReport) -> int:
+        """Insert the new vertices of changed records, then delete the old ones by id.
+
+        A record whose insert fails keeps its old vertex, so a failed batch
+        never loses professors. A failed delete leaves the old vertex beside
+        the new one and is reported as a failure.
+        """
+        old_ids = {payload["profile_url"]: vertex_id for vertex_id, payload in to_replace}
+        inserted = self._insert([payload for _, payload in to_replace], report)
+        stale = [(old_ids[payload["profile_url"]], payload) for payload in inserted]
+        for (vertex_id, payload), _, exc in self._run(
+            "delete",
+            lambda item: self.helix.delete_professor(
+                item[0], profile_url=item[1]["profile_url"]
+            ),
+            stale,
+        ):
+            if exc is not None:
+                report.fail(
+                    payload["profile_url"], f"updated, but old vertex {vertex_id} remains: {exc}"
+                )
+        return len(inserted)
+
+    def _insert(
+        self, payloads: List[Dict[str, Any]], report: LoadReport
+    ) -> List[Dict[str, Any]]:
+        """Insert ``payloads`` without existence checks; return those that were stored."""
+        inserted: List[Dict[str, Any]] = []
+        if not self.use_bulk_query:
+            for payload, _, exc in self._run(
+                "insert", self.helix.insert_professor_payload, payloads
+            ):
+                if exc is not None:
+                    report.fail(payload["profile_url"], exc)
+                else:
+                    inserted.append(payload)
+            return inserted
+
+        batches = [
+            payloads[start : start + self.batch_size]
+            for start in range(0, len(payloads), self.batch_size)
+        ]
+        for batch, _, exc in self._run(
+            "insert", self.helix.insert_professors_bulk, batches, [len(batch) for batch in batches]
+        ):
+            if exc is not None:
+                logger.error("Bulk insert of %s professors failed: %s", len(batch), exc)
+                report.fail(f"batch starting {batch[0]['profile_url']}", exc, count=len(batch))
+            else:
+                inserted.extend(batch)
+        return inserted
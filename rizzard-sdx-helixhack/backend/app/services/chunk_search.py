@@ -0,0 +1,158 @@
+"""Multi-vector professor search: aggregate chunk hits per professor.
+
+Each profile is stored as a ``Professor`` vector plus several
+``ProfessorChunk`` vectors (see :mod:`.profile_chunks`). A search asks Helix
+for the nearest professors and, separately, for the nearest
+``limit * chunk_search_oversample`` chunks, then ranks professors by fusing
+the two lists.
+
+Helix's ``SearchV`` returns hits in similarity order but without a score, so
+aggregation works on ranks: a hit at rank ``r`` contributes ``1 / (K + r)``
+(reciprocal rank fusion). ``max`` aggregation keeps each professor's best
+chunk; ``top-m`` sums its best ``m``. The aggregation is vectorised so it stays
+cheap when the oversampled chunk list is long.
+
+Metadata filters run inside the professor query; professors reached only
+through a chunk are fetched by URL (at most ``limit`` of them per search) and
+checked with :meth:`SearchFilters.matches`. Summary chunks of professors the
+professor-level search already returned are ignored, since they repeat the
+professor vector.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import Settings
+from .helixdb_service import (
+    DEFAULT_LIMIT,
+    HelixDBService,
+    SearchFilters,
+    _extract_professor_properties,
+)
+from .profile_chunks import SUMMARY_KIND
+from .vectors import VectorLike
+
+logger = logging.getLogger(__name__)
+
+CHUNK_AGGREGATIONS = ("max", "top-m")
+# The usual RRF constant: damps the gap between the first few ranks.
+RRF_K = 60
+
+
+def aggregate_chunk_ranks(
+    profile_urls: Sequence[str],
+    *,
+    mode: str = "max",
+    m: int = 3,
+    k: int = RRF_K,
+) -> Dict[str, float]:
+    """Score professors from a best-first list of chunk hits (one URL per hit)."""
+    if mode not in CHUNK_AGGREGATIONS:
+        raise ValueError(
+            f"Unknown chunk aggregation {mode!r}; expected one of {', '.join(CHUNK_AGGREGATIONS)}"
+        )
+    if not len(profile_urls):
+        return {}
+    # Interning through a dict is several times faster than np.unique on strings.
+    index: Dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(url, len(index)) for url in profile_urls),
+        dtype=np.intp,
+        count=len(profile_urls),
+    )
+    contributions = 1.0 / (k + 1.0 + np.arange(len(codes), dtype=np.float64))
+    limit = 1 if mode == "max" else max(1, int(m))
+
+    # A stable sort by professor keeps each professor's hits in rank order, so
+    # the first ``limit`` entries of every group are its best chunks.
+    order = np.argsort(codes, kind="stable")
+    grouped = codes[order]
+    starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+    within = np.arange(len(grouped)) - np.repeat(starts, np.diff(np.r_[starts, len(grouped)]))
+    keep = order[within < limit]
+    scores = np.bincount(codes[keep], weights=contributions[keep], minlength=len(index))
+    return dict(zip(index, scores.tolist()))
+
+
+def fuse_rankings(
+    professor_urls: Sequence[str],
+    chunk_urls: Sequence[str],
+    *,
+    mode: str = "max",
+    m: int = 3,
+    k: int = RRF_K,
+) -> List[Tuple[str, float]]:
+    """Combine the professor-level ranking with aggregated chunk hits, best first."""
+    scores = aggregate_chunk_ranks(chunk_urls, mode=mode, m=m, k=k)
+    for rank, url in enumerate(professor_urls):
+        scores[url] = scores.get(url, 0.0) + 1.0 / (k + 1.0 + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def search_professors_multi_vector(
+    helix: HelixDBService,
+    embedding: VectorLike,
+    *,
+    limit: int = DEFAULT_LIMIT,
+    filters: Optional[SearchFilters] = None,
+    settings: Optional[Settings] = None,
+) -> List[Dict[str, Any]]:
+    """Return up to ``limit`` professor records ranked over summaries and chunks.
+
+    Falls back to the plain professor search when the chunk query fails (for
+    example against a database whose schema predates chunks).
+    """
+    settings = settings or helix.settings
+    filters = filters or SearchFilters()
+    records = helix.search_similar_professors(embedding, limit=limit, filters=filters)
+    try:
+        hits = helix.search_professor_chunks(
+            embedding, limit=limit * max(1, settings.chunk_search_oversample)
+        )
+    except Exception as exc:
+        logger.warning("Chunk search failed; using professor vectors only: %s", exc)
+        return records
+    by_url = {record.get("profile_url"): record for record in records}
+    # A summary chunk embeds the same text as the professor vector; counting it
+    # for a professor the professor-level list already ranks would score that
+    # text twice and favour profiles that have chunks over those that do not.
+    chunk_urls = [
+        hit["profile_url"]
+        for hit in hits
+        if hit.get("profile_url")
+        and not (hit.get("kind") == SUMMARY_KIND and hit["profile_url"] in by_url)
+    ]
+    if not chunk_urls:
+        return records
+
+    ranked = fuse_rankings(
+        list(by_url),
+        chunk_urls,
+        mode=settings.chunk_aggregation,
+        m=settings.chunk_aggregation_m,
+    )
+    results: List[Dict[str, Any]] = []
+    # Each professor reached only through a chunk costs a lookup; bound them so
+    # a filter that rejects most of them cannot turn one search into hundreds
+    # of queries.
+    lookups_left = limit
+    for url, _ in ranked:
+        record = by_url.get(url)
+        if record is None:
+            if lookups_left <= 0:
+                continue
+            lookups_left -= 1
+            raw = helix.get_professor_by_url(url)
+            if not raw:
+                continue
+            record = _extract_professor_properties(raw)
+            if not filters.matches(record):
+                continue
+        results.append(record)
+        if len(results) >= limit:
+            break
+    return results
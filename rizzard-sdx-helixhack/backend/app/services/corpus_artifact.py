@@ -0,0 +1,212 @@
+"""Precompiled professor corpus: records plus float32 embeddings in one ``.npz``.
+
+``scripts/build_corpus_artifact.py`` encodes a professor dataset once and
+writes it here; loaders and the in-memory Helix index then read vectors from
+the artifact instead of loading the embedding model. Each record carries a
+content hash so rebuilds only re-encode records that changed and loaders can
+tell when an artifact has gone stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT_VERSION = 1
+ARTIFACT_DIR = Path(__file__).resolve().parents[2] / "data"
+
+EmbedFn = Callable[[List[str]], Tuple[np.ndarray, str]]
+
+
+class CorpusArtifactError(RuntimeError):
+    """The artifact is missing, unreadable, or built for another format/model."""
+
+
+def embedding_text(record: Dict[str, Any]) -> str:
+    """Return the text a professor record is embedded from."""
+    return record.get("summary") or record.get("name") or ""
+
+
+def content_hash(record: Dict[str, Any]) -> str:
+    """Stable hash of a record's contents, independent of key order."""
+    encoded = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CorpusArtifact:
+    """Professor records with row-aligned embeddings and provenance."""
+
+    records: List[Dict[str, Any]]
+    embeddings: np.ndarray
+    model_name: str
+    content_hashes: List[str]
+    format_version: int = ARTIFACT_FORMAT_VERSION
+    built_at: float = field(default_factory=time.time)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def corpus_hash(self) -> str:
+        return hashlib.sha256("".join(self.content_hashes).encode("ascii")).hexdigest()
+
+    def is_current(self, records: Sequence[Dict[str, Any]], model_name: Optional[str] = None) -> bool:
+        """True when the artifact was built from exactly ``records`` (and ``model_name``)."""
+        if model_name is not None and model_name != self.model_name:
+            return False
+        return [content_hash(record) for record in records] == self.content_hashes
+
+
+def build_corpus_artifact(
+    records: Sequence[Dict[str, Any]],
+    embed: EmbedFn,
+    *,
+    model_name: str,
+    previous: Optional[CorpusArtifact] = None,
+) -> Tuple[CorpusArtifact, int]:
+    """Embed ``records`` into a new artifact, reusing unchanged rows of ``previous``.
+
+    Returns the artifact and the number of records that had to be encoded.
+    """
+    hashes = [content_hash(record) for record in records]
+    reusable: Dict[str, np.ndarray] = {}
+    if previous is not None and previous.model_name == model_name:
+        reusable = dict(zip(previous.content_hashes, previous.embeddings))
+
+    pending = [idx for idx, digest in enumerate(hashes) if digest not in reusable]
+    encoded: Dict[int, np.ndarray] = {}
+    if pending:
+        vectors, encoded_model = embed([embedding_text(records[idx]) for idx in pending])
+        if encoded_model != model_name:
+            raise CorpusArtifactError(
+                f"Encoder returned {encoded_model!r} vectors; expected {model_name!r}"
+            )
+        encoded = dict(zip(pending, np.asarray(vectors, dtype=np.float32)))
+
+    rows = [encoded[idx] if idx in encoded else reusable[hashes[idx]] for idx in range(len(records))]
+    embeddings = (
+        np.vstack(rows).astype(np.float32, copy=False)
+        if rows
+        else np.zeros((0, 0), dtype=np.float32)
+    )
+    artifact = CorpusArtifact(
+        records=[dict(record) for record in records],
+        embeddings=embeddings,
+        model_name=model_name,
+        content_hashes=hashes,
+    )
+    return artifact, len(pending)
+
+
+def save_corpus_artifact(artifact: CorpusArtifact, path: Path) -> None:
+    """Write ``artifact`` atomically; nothing in the file needs pickle to load."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    metadata = {
+        "format_version": artifact.format_version,
+        "model_name": artifact.model_name,
+        "built_at": artifact.built_at,
+        "count": len(artifact),
+        "corpus_hash": artifact.corpus_hash,
+    }
+    records = json.dumps(artifact.records, ensure_ascii=False).encode("utf-8")
+    temporary = path.with_name(path.name + ".tmp")
+    with temporary.open("wb") as handle:
+        np.savez(
+            handle,
+            embeddings=artifact.embeddings,
+            content_hashes=np.array(artifact.content_hashes, dtype="U64"),
+            records=np.frombuffer(records, dtype=np.uint8),
+            metadata=np.frombuffer(json.dumps(metadata).encode("utf-8"), dtype=np.uint8),
+        )
+    temporary.replace(path)
+
+
+def load_corpus_artifact(path: Path, *, model_name: Optional[str] = None) -> CorpusArtifact:
+    """Read an artifact written by :func:`save_corpus_artifact`.
+
+    Raises :class:`CorpusArtifactError` when the file is missing, was written
+    by a different format version, or was built with a model other than
+    ``model_name`` (when given).
+    """
+    path = Path(path)
+    if not path.exists():
+        raise CorpusArtifactError(f"Corpus artifact {path} does not exist")
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            metadata = json.loads(data["metadata"].tobytes().decode("utf-8"))
+            records = json.loads(data["records"].tobytes().decode("utf-8"))
+            embeddings = np.asarray(data["embeddings"], dtype=np.float32)
+            hashes = data["content_hashes"].tolist()
+    except (OSError, KeyError, ValueError) as exc:
+        raise CorpusArtifactError(f"Corpus artifact {path} is unreadable: {exc}") from exc
+
+    if metadata.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        raise CorpusArtifactError(
+            f"Corpus artifact {path} has format {metadata.get('format_version')}; "
+            f"expected {ARTIFACT_FORMAT_VERSION}. Rebuild it."
+        )
+    if model_name is not None and metadata.get("model_name") != model_name:
+        raise CorpusArtifactError(
+            f"Corpus artifact {path} was built with {metadata.get('model_name')!r}, "
+            f"not {model_name!r}. Rebuild it."
+        )
+    return CorpusArtifact(
+        records=records,
+        embeddings=embeddings,
+        model_name=metadata["model_name"],
+        content_hashes=hashes,
+        format_version=metadata["format_version"],
+        built_at=metadata.get("built_at", 0.0),
+    )
+
+
+def default_artifact_path(source: str) -> Path:
+    return ARTIFACT_DIR / f"{source}_professors.npz"
+
+
+def corpus_embeddings(
+    records: Sequence[Dict[str, Any]],
+    *,
+    path: Path,
+    settings: Any,
+) -> Tuple[np.ndarray, str, int]:
+    """Return row-aligned embeddings for ``records``, preferring the artifact at ``path``.
+
+    Only records missing from (or changed since) the artifact are encoded, and
+    the embedding model is loaded only in that case. Returns the embeddings,
+    the model name and how many records had to be encoded.
+    """
+    model_name = settings.embedding_model_name
+    previous: Optional[CorpusArtifact] = None
+    try:
+        previous = load_corpus_artifact(path, model_name=model_name)
+    except CorpusArtifactError as exc:
+        logger.warning("%s; encoding from scratch", exc)
+
+    def embed(texts: List[str]) -> Tuple[np.ndarray, str]:
+        from .embedding import embed_texts_array
+
+        return embed_texts_array(texts, settings=settings)
+
+    artifact, encoded = build_corpus_artifact(
+        records, embed, model_name=model_name, previous=previous
+    )
+    if previous is not None and encoded:
+        logger.warning(
+            "Corpus artifact %s is stale (%s of %s records re-encoded); rebuild it",
+            path,
+            encoded,
+            len(records),
+        )
+    return artifact.embeddings, model_name, encoded
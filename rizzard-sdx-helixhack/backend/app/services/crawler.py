@@ -0,0 +1,311 @@
+"""Department directory and sitemap crawling that feeds the scrape orchestrator."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from ..config import Settings, get_settings
+from .firecrawl_service import extract_professor
+from .scrape_orchestrator import ScrapeOrchestrator, ScrapeResult, ScrapeSummary
+from .scraper_backends import ScraperRouter
+from .urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+MARKDOWN_LINK_RE = re.compile(r"\]\((?P<url>https?://[^)\s]+)\)")
+SITEMAP_NS_RE = re.compile(r"^\{[^}]+\}")
+MAX_SITEMAP_DEPTH = 3
+
+# Frontier tiers: never-scraped pages first, then pages a sitemap says changed
+# since we last stored them, then everything else oldest-first.
+TIER_NEW = 0
+TIER_CHANGED = 1
+TIER_KNOWN = 2
+
+StalenessLookup = Callable[[str], Tuple[bool, Optional[str]]]
+
+
+@dataclass
+class FrontierEntry:
+    """A profile URL waiting to be scraped."""
+
+    url: str
+    department: Optional[str] = None
+    lastmod: Optional[str] = None
+    source: Optional[str] = None
+
+
+class CrawlFrontier:
+    """Deduplicated priority queue of profile URLs.
+
+    Entries are ordered by staleness tier, then by the stored ``last_updated``
+    timestamp (oldest first), then round-robin across departments so one large
+    department cannot starve the rest.
+    """
+
+    def __init__(
+        self,
+        *,
+        staleness_lookup: Optional[StalenessLookup] = None,
+        include_known: bool = False,
+        force_https: bool = True,
+    ) -> None:
+        self._heap: List[Tuple[Tuple[int, str, int, int], FrontierEntry]] = []
+        self._seen: Set[str] = set()
+        self._department_counts: Dict[str, int] = {}
+        self._sequence = 0
+        self._lookup = staleness_lookup
+        self._include_known = include_known
+        self._force_https = force_https
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, entry: FrontierEntry) -> bool:
+        """Queue ``entry`` unless its canonical URL was already seen.
+
+        ``entry.url`` itself is kept as given, for fetching and for finding
+        vertices stored before URLs were canonicalised.
+        """
+        canonical = canonicalize_url(entry.url, force_https=self._force_https)
+        with self._lock:
+            if canonical in self._seen:
+                return False
+            self._seen.add(canonical)
+
+        known, last_updated = (False, None)
+        if self._lookup is not None:
+            try:
+                known, last_updated = self._lookup(entry.url)
+            except Exception as exc:
+                logger.warning("Staleness lookup failed for %s: %s", entry.url, exc)
+        if known and not self._include_known:
+            return False
+
+        if not known:
+            tier = TIER_NEW
+        elif entry.lastmod and (not last_updated or entry.lastmod > last_updated):
+            tier = TIER_CHANGED
+        else:
+            tier = TIER_KNOWN
+
+        department_key = (entry.department or "").strip().lower()
+        with self._lock:
+            turn = self._department_counts.get(department_key, 0)
+            self._department_counts[department_key] = turn + 1
+            self._sequence += 1
+            priority = (tier, last_updated or "", turn, self._sequence)
+            heapq.heappush(self._heap, (priority, entry))
+        return True
+
+    def pop_batch(self, size: int) -> List[FrontierEntry]:
+        with self._lock:
+            batch: List[FrontierEntry] = []
+            while self._heap and len(batch) < size:
+                batch.append(heapq.heappop(self._heap)[1])
+            return batch
+
+
+class HostRateLimiter:
+    """Enforce a minimum interval between requests to the same host."""
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = max(0.0, min_interval)
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        if not self.min_interval:
+            return
+        host = (urlsplit(url).hostname or "").lower()
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_allowed.get(host, 0.0))
+            self._next_allowed[host] = scheduled + self.min_interval
+        delay = scheduled - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def extract_links(payload: Dict, *, pattern: Optional[re.Pattern] = None) -> List[str]:
+    """Return profile links from a scraped listing page payload.
+
+    Direct-fetch payloads carry a ``links`` list; Firecrawl payloads only have
+    links inline in the markdown, so both are consulted.
+    """
+    candidates: List[str] = list(payload.get("links") or [])
+    markdown = payload.get("markdown") or ""
+    candidates.extend(match.group("url") for match in MARKDOWN_LINK_RE.finditer(markdown))
+    if pattern is not None:
+        candidates = [url for url in candidates if pattern.search(url)]
+    return list(dict.fromkeys(candidates))
+
+
+def parse_sitemap(xml_text: str) -> Tuple[List[Tuple[str, Optional[str]]], List[str]]:
+    """Parse a sitemap, returning ``(url, lastmod)`` pairs and nested sitemap URLs."""
+    root = ET.fromstring(xml_text)
+    urls: List[Tuple[str, Optional[str]]] = []
+    nested: List[str] = []
+    for node in root:
+        tag = SITEMAP_NS_RE.sub("", node.tag)
+        values = {SITEMAP_NS_RE.sub("", child.tag): (child.text or "").strip() for child in node}
+        loc = values.get("loc")
+        if not loc:
+            continue
+        if tag == "sitemap":
+            nested.append(loc)
+        elif tag == "url":
+            urls.append((loc, values.get("lastmod") or None))
+    return urls, nested
+
+
+@dataclass
+class CrawlReport:
+    """Outcome of a crawl job."""
+
+    discovered: int = 0
+    queued: int = 0
+    summaries: List[ScrapeSummary] = field(default_factory=list)
+
+    @property
+    def results(self) -> List[ScrapeResult]:
+        return [result for summary in self.summaries for result in summary.results]
+
+
+class DirectoryCrawler:
+    """Discover profile pages from listings/sitemaps and scrape them in bounded batches."""
+
+    def __init__(
+        self,
+        *,
+        settings: Optional[Settings] = None,
+        orchestrator: Optional[ScrapeOrchestrator] = None,
+        profile_pattern: Optional[str] = None,
+        include_known: bool = False,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        self.settings = settings or get_settings()
+        self.rate_limiter = HostRateLimiter(self.settings.crawl_min_host_interval_seconds)
+        self.scraper = ScraperRouter(settings=self.settings, rate_limiter=self.rate_limiter)
+        self.orchestrator = orchestrator or ScrapeOrchestrator(
+            settings=self.settings,
+            scraper=self.scraper,
+        )
+        pattern = profile_pattern or self.settings.crawl_profile_url_pattern
+        self.profile_pattern = re.compile(pattern) if pattern else None
+        self.frontier = CrawlFrontier(
+            staleness_lookup=self._lookup_staleness,
+            include_known=include_known,
+            force_https=self.settings.url_force_https,
+        )
+        self._session = session or requests.Session()
+        self.report = CrawlReport()
+
+    def _lookup_staleness(self, url: str) -> Tuple[bool, Optional[str]]:
+        existing = self.orchestrator.helix.get_professor_by_url(url)
+        if not existing:
+            return False, None
+        props = existing.get("properties")
+        if not isinstance(props, dict):
+            props = existing
+        return True, props.get("last_updated") or None
+
+    def _enqueue(
+        self,
+        urls: Iterable[Tuple[str, Optional[str]]],
+        *,
+        department: Optional[str],
+        source: str,
+    ) -> None:
+        for url, lastmod in urls:
+            self.report.discovered += 1
+            if self.profile_pattern is not None and not self.profile_pattern.search(url):
+                continue
+            entry = FrontierEntry(url=url, department=department, lastmod=lastmod, source=source)
+            if self.frontier.push(entry):
+                self.report.queued += 1
+
+    def add_listing(self, url: str, *, department: Optional[str] = None) -> None:
+        """Scrape a department listing page and queue the profile links on it."""
+        payload = self.scraper.scrape_url(url)
+        if department is None:
+            listing = extract_professor(payload)
+            department = listing.department or listing.name
+        links = extract_links(payload)
+        logger.info("Listing %s yielded %s links", url, len(links))
+        self._enqueue(((link, None) for link in links), department=department, source=url)
+
+    def add_sitemap(self, url: str, *, department: Optional[str] = None, _depth: int = 0) -> None:
+        """Queue profile URLs from a sitemap (following sitemap indexes)."""
+        self.rate_limiter.wait(url)
+        response = self._session.get(
+            url,
+            timeout=(
+                self.settings.direct_fetch_connect_timeout_seconds,
+                self.settings.direct_fetch_read_timeout_seconds,
+            ),
+            headers={"User-Agent": self.settings.direct_fetch_user_agent},
+        )
+        response.raise_for_status()
+        entries, nested = parse_sitemap(response.text)
+        self._enqueue(entries, department=department, source=url)
+        if _depth < MAX_SITEMAP_DEPTH:
+            for child in nested:
+                try:
+                    self.add_sitemap(child, department=department, _depth=_depth + 1)
+                except Exception as exc:
+                    logger.error("Failed to read nested sitemap %s: %s", child, exc)
+
+    def run(
+        self,
+        *,
+        max_profiles: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        batch_size: int = 10,
+        initialize_schema: bool = False,
+        on_batch: Optional[Callable[[ScrapeSummary], None]] = None,
+    ) -> CrawlReport:
+        """Drain the frontier through the orchestrator with bounded concurrency."""
+        workers = max(1, concurrency or self.settings.crawl_max_concurrency)
+        remaining = max_profiles if max_profiles is not None else len(self.frontier)
+        in_flight: Set[Future] = set()
+
+        if initialize_schema:
+            self.orchestrator.helix.initialize_schema()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawl") as pool:
+            while True:
+                while len(in_flight) < workers and remaining > 0:
+                    batch = self.frontier.pop_batch(min(batch_size, remaining))
+                    if not batch:
+                        break
+                    remaining -= len(batch)
+                    in_flight.add(
+                        pool.submit(self.orchestrator.run, [entry.url for entry in batch])
+                    )
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        summary = future.result()
+                    except Exception as exc:
+                        logger.error("Crawl batch failed: %s", exc)
+                        continue
+                    self.report.summaries.append(summary)
+                    if on_batch is not None:
+                        on_batch(summary)
+
+        return self.report
@@ -3,21 +3,227 @@
 from __future__ import annotations
 
 import logging
-from functools import lru_cache
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
 from ..config import Settings, get_settings
+from .embedding_backends import REFERENCE_BACKEND, backend_label, load_sentence_transformer
+from .metrics import register_metrics_provider
+from .singleflight import get_singleflight
+from .vectors import float32_to_list
+
+if TYPE_CHECKING:  # pragma: no cover - sentence_transformers (and torch) load lazily
+    from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+WARMUP_TEXT = "warm-up"
+
+_models: Dict[str, "SentenceTransformer"] = {}
+_model_status: Dict[str, Dict[str, Any]] = {}
+_status_lock = threading.Lock()
+
+
+def _set_status(label: str, **status: Any) -> None:
+    with _status_lock:
+        _model_status.setdefault(label, {}).update(status)
+
+
+def _load_model(
+    label: str, model_name: str, backend: str, onnx_file: Optional[str]
+) -> "SentenceTransformer":
+    model = _models.get(label)
+    if model is not None:
+        return model
+
+    _set_status(label, state="loading", error=None)
+    started = time.perf_counter()
+    try:
+        logger.info("Loading SentenceTransformer model: %s", label)
+        model = load_sentence_transformer(model_name, backend, onnx_file=onnx_file)
+    except Exception as exc:
+        _set_status(label, state="failed", error=str(exc))
+        raise
+    _models[label] = model
+    _set_status(label, state="ready", load_seconds=round(time.perf_counter() - started, 3))
+    return model
+
+
+def get_model(
+    model_name: str,
+    backend: str = REFERENCE_BACKEND,
+    onnx_file: Optional[str] = None,
+) -> "SentenceTransformer":
+    """Return a cached SentenceTransformer, loading it once on first use.
+
+    Callers racing the first load (e.g. requests arriving during warm-up)
+    wait for that load instead of starting their own.
+    """
+    label = backend_label(model_name, backend, onnx_file)
+    model = _models.get(label)
+    if model is not None:
+        return model
+    return get_singleflight("model_load").do(
+        label, _load_model, label, model_name, backend, onnx_file
+    )
+
+
+def model_label(settings: Settings) -> str:
+    """Cache/status key of the configured model and backend."""
+    return backend_label(
+        settings.embedding_model_name, settings.embedding_backend, settings.embedding_onnx_file
+    )
+
+
+def get_configured_model(settings: Settings) -> "SentenceTransformer":
+    return get_model(
+        settings.embedding_model_name, settings.embedding_backend, settings.embedding_onnx_file
+    )
+
+
+def model_status(settings: Settings) -> Dict[str, Any]:
+    """Return ``{"state": "not_loaded" | "loading" | "ready" | "failed", ...}``."""
+    label = model_label(settings)
+    with _status_lock:
+        status = dict(_model_status.get(label) or {"state": "not_loaded"})
+    status["model"] = label
+    return status
+
+
+def model_ready(settings: Settings) -> bool:
+    return model_label(settings) in _models
+
+
+def warm_up(settings: Settings | None = None) -> float:
+    """Load the configured model and run one encode; return the seconds taken.
+
+    The first ``encode`` call initialises tokenizer and kernel state, so it is
+    paid here rather than by the first request.
+    """
+    app_settings = settings or get_settings()
+    started = time.perf_counter()
+    model = get_configured_model(app_settings)
+    model.encode([WARMUP_TEXT], convert_to_numpy=True)
+    elapsed = time.perf_counter() - started
+    label = model_label(app_settings)
+    _set_status(label, warmup_seconds=round(elapsed, 3))
+    logger.info("Embedding model %s warmed up in %.2fs", label, elapsed)
+    return elapsed
+
+
+@dataclass
+class EncodeStats:
+    """Running totals for :func:`encode_bucketed`, exposed under ``/metrics``.
+
+    ``padding_tokens`` counts the pad positions the model computed on;
+    ``tokens_dropped`` counts tokens cut off by ``max_seq_length``.
+    """
+
+    texts: int = 0
+    batches: int = 0
+    tokens: int = 0
+    padding_tokens: int = 0
+    texts_truncated: int = 0
+    tokens_dropped: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(
+        self, lengths: np.ndarray, effective: np.ndarray, buckets: List[np.ndarray]
+    ) -> None:
+        """``effective`` is ``lengths`` capped at the model's max length."""
+        padding = sum(
+            int(effective[bucket].max()) * len(bucket) - int(effective[bucket].sum())
+            for bucket in buckets
+        )
+        over = lengths - effective
+        with self._lock:
+            self.texts += len(lengths)
+            self.batches += len(buckets)
+            self.tokens += int(effective.sum())
+            self.padding_tokens += padding
+            self.texts_truncated += int(np.count_nonzero(over))
+            self.tokens_dropped += int(over.sum())
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            computed = self.tokens + self.padding_tokens
+            return {
+                "texts": self.texts,
+                "batches": self.batches,
+                "tokens": self.tokens,
+                "padding_tokens": self.padding_tokens,
+                "padding_ratio": round(self.padding_tokens / computed, 4) if computed else 0.0,
+                "texts_truncated": self.texts_truncated,
+                "tokens_dropped": self.tokens_dropped,
+            }
+
 
-@lru_cache(maxsize=1)
-def get_model(model_name: str) -> SentenceTransformer:
-    """Return a cached SentenceTransformer instance."""
-    logger.info("Loading SentenceTransformer model: %s", model_name)
-    return SentenceTransformer(model_name)
+encode_stats = EncodeStats()
+
+
+def _token_lengths(model: Any, texts: List[str]) -> Optional[np.ndarray]:
+    """Token count of each text including special tokens, or None without a tokenizer."""
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is None:
+        return None
+    encoded = tokenizer(
+        texts,
+        add_special_tokens=True,
+        truncation=False,
+        padding=False,
+        return_attention_mask=False,
+        return_token_type_ids=False,
+        verbose=False,
+    )
+    return np.fromiter((len(ids) for ids in encoded["input_ids"]), dtype=np.int64, count=len(texts))
+
+
+def encode_bucketed(model: Any, texts: List[str], *, batch_size: int = 32) -> np.ndarray:
+    """Encode ``texts`` in batches of similar token length; rows keep input order.
+
+    Sorting by length means each batch pads only to its own longest text
+    rather than to the longest text overall. Texts longer than the model's
+    ``max_seq_length`` are still truncated by the model, but are counted
+    in :data:`encode_stats` (and logged at debug level).
+    """
+    batch_size = max(1, batch_size)
+    lengths = _token_lengths(model, texts)
+    max_length = getattr(model, "max_seq_length", None)
+    if lengths is None:
+        # No tokenizer to count with; character length still groups similar texts.
+        effective = None
+        order = np.argsort([len(text) for text in texts], kind="stable")
+    else:
+        effective = np.minimum(lengths, max_length) if max_length else lengths
+        order = np.argsort(effective, kind="stable")
+
+    buckets = [order[start : start + batch_size] for start in range(0, len(texts), batch_size)]
+    embeddings: Optional[np.ndarray] = None
+    for bucket in buckets:
+        batch = [texts[idx] for idx in bucket]
+        vectors = np.asarray(
+            model.encode(batch, batch_size=batch_size, convert_to_numpy=True), dtype=np.float32
+        )
+        if embeddings is None:
+            embeddings = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+        embeddings[bucket] = vectors
+
+    if lengths is not None:
+        encode_stats.record(lengths, effective, buckets)
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx in np.flatnonzero(lengths > effective):
+                logger.debug(
+                    "Truncated text %s from %s to %s tokens: %.60r...",
+                    idx,
+                    lengths[idx],
+                    max_length,
+                    texts[idx],
+                )
+    return embeddings
 
 
 def normalize_embeddings(embeddings: np.ndarray) -> np.ndarray:
@@ -27,6 +233,29 @@ def normalize_embeddings(embeddings: np.ndarray) -> np.ndarray:
     return embeddings / norms
 
 
+def embed_texts_array(
+    texts: list[str],
+    *,
+    normalize: bool = True,
+    settings: Settings | None = None,
+) -> tuple[np.ndarray, str]:
+    """Generate embeddings as a float32 ``(len(texts), dim)`` array.
+
+    Returns a tuple of the embedding matrix and the model name used.
+    """
+    app_settings = settings or get_settings()
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32), app_settings.embedding_model_name
+
+    model = get_configured_model(app_settings)
+    embeddings = encode_bucketed(model, texts, batch_size=app_settings.embedding_batch_size)
+
+    if normalize:
+        embeddings = normalize_embeddings(embeddings)
+
+    return embeddings, app_settings.embedding_model_name
+
+
 def embed_texts(
     texts: list[str],
     *,
@@ -35,17 +264,37 @@ def embed_texts(
 ) -> tuple[list[list[float]], str]:
     """Generate embeddings for the provided texts.
 
-    Returns a tuple of embedding vectors and the model name used.
+    Returns a tuple of embedding vectors and the model name used. Vectors are
+    float32 values rendered as compact lists ready for JSON transport.
     """
     if not texts:
         return [], (settings.embedding_model_name if settings else "")
 
+    embeddings, model_name = embed_texts_array(texts, normalize=normalize, settings=settings)
+    return float32_to_list(embeddings), model_name
+
+
+def embed_query(
+    text: str,
+    *,
+    settings: Settings | None = None,
+) -> tuple[list[float], str]:
+    """Embed one query string, sharing the work with identical in-flight calls.
+
+    The vector is L2-normalised; it is empty when the model produced nothing.
+    """
     app_settings = settings or get_settings()
-    model = get_model(app_settings.embedding_model_name)
+    key = (app_settings.embedding_model_name, text)
+    embeddings, model_name = get_singleflight("query_embedding").do(
+        key, embed_texts, [text], normalize=True, settings=app_settings
+    )
+    return (embeddings[0] if embeddings else []), model_name
 
-    embeddings = model.encode(texts, convert_to_numpy=True)
 
-    if normalize:
-        embeddings = normalize_embeddings(embeddings)
+def embedding_model_snapshot() -> Dict[str, Any]:
+    with _status_lock:
+        return {name: dict(status) for name, status in _model_status.items()}
+
 
-    return embeddings.tolist(), app_settings.embedding_model_name
+register_metrics_provider("embedding_models", embedding_model_snapshot)
+register_metrics_provider("embedding_encode", encode_stats.snapshot)
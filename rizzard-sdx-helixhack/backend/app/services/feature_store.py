@@ -0,0 +1,400 @@
+"""Columnar per-profile scoring features, kept across requests.
+
+Compatibility and feasibility scoring need, for every candidate, its token
+set, normalised department, title seniority and activity recency. Recomputing
+them per request (regex tokenisation of every summary above all) dominated
+``score_profiles`` once the LLM was off. :class:`ProfileFeatureStore` computes
+them once per profile, when it is inserted into Helix or first scored, and
+keeps them as columns: numpy arrays for recency, seniority and department ids
+plus a CSR token matrix (``indptr``/``indices`` over a shared vocabulary).
+:meth:`ProfileFeatureStore.features_for` gathers the candidates' rows into a
+:class:`ProfileFeatures` table that scoring works on as arrays.
+
+Rows are keyed by ``profile_id`` and carry a fingerprint of the fields the
+features derive from, so a profile whose content changed under the same id is
+recomputed rather than served stale. Superseded rows are kept until the store
+reaches ``FEATURE_STORE_MAX_ROWS``, when it starts over.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import Settings, get_settings
+from ..models.schemas import ProfileActivitySignals, ProfileInput
+from .metrics import register_metrics_provider
+from .text import extract_tokens, merge_keywords
+
+SENIORITY_BONUS = 0.05
+SENIORITY_MARKERS = ("assistant", "associate")
+# Feasibility of a profile without activity signals.
+NO_SIGNALS_RECENCY = 0.5
+INITIAL_CAPACITY = 1024
+
+
+def profile_tokens(
+    keywords: Iterable[str], summary: Optional[str], department: Optional[str]
+) -> List[str]:
+    """Lower-cased, de-duplicated keywords plus summary and department tokens."""
+    tokens = list(keywords)
+    tokens.extend(extract_tokens(summary or ""))
+    if department:
+        tokens.extend(extract_tokens(department))
+    return merge_keywords(tokens)
+
+
+def seniority_bonus(title: Optional[str]) -> float:
+    lowered = (title or "").lower()
+    return SENIORITY_BONUS if any(marker in lowered for marker in SENIORITY_MARKERS) else 0.0
+
+
+def _signal_flags(signals: Optional[ProfileActivitySignals]) -> Tuple[bool, ...]:
+    if signals is None:
+        return (False,)
+    return (
+        True,
+        bool(signals.recent_publications),
+        bool(signals.news_mentions),
+        bool(signals.hiring),
+        bool(signals.last_updated),
+    )
+
+
+def _fingerprint(
+    summary: Optional[str],
+    keywords: Sequence[str],
+    department: Optional[str],
+    title: Optional[str],
+    signals: Optional[ProfileActivitySignals],
+) -> int:
+    return hash(
+        (summary or "", tuple(keywords), department or "", title or "", _signal_flags(signals))
+    )
+
+
+def profile_fingerprint(profile: ProfileInput) -> int:
+    """Hash of the fields the features of ``profile`` are computed from."""
+    return _fingerprint(
+        profile.summary,
+        profile.keywords,
+        profile.department,
+        profile.title,
+        profile.activity_signals,
+    )
+
+
+def record_signals(record: Mapping[str, Any]) -> ProfileActivitySignals:
+    """Activity signals of a flattened Helix record, as search will rebuild them.
+
+    ``_extract_professor_properties`` always supplies an ``activity_signals``
+    dict, so search builds signals for every stored profile, empty or not.
+    """
+    signals = record.get("activity_signals")
+    if not isinstance(signals, Mapping):
+        signals = record
+    return ProfileActivitySignals(
+        recent_publications=signals.get("recent_publications") or [],
+        news_mentions=signals.get("news_mentions") or [],
+        hiring=signals.get("hiring") or False,
+        last_updated=signals.get("last_updated") or "",
+    )
+
+
+@dataclass(frozen=True)
+class _Row:
+    tokens: List[str]
+    department: str
+    seniority: float
+    recency: float
+    has_signals: bool
+
+
+def _compute_row(
+    summary: Optional[str],
+    keywords: Sequence[str],
+    department: Optional[str],
+    title: Optional[str],
+    signals: Optional[ProfileActivitySignals],
+) -> _Row:
+    return _Row(
+        tokens=[token for token in profile_tokens(keywords, summary, department) if token],
+        department=(department or "").strip().lower(),
+        seniority=seniority_bonus(title),
+        recency=signals.recency_score() if signals is not None else NO_SIGNALS_RECENCY,
+        has_signals=signals is not None,
+    )
+
+
+def _profile_row(profile: ProfileInput) -> _Row:
+    return _compute_row(
+        profile.summary,
+        profile.keywords,
+        profile.department,
+        profile.title,
+        profile.activity_signals,
+    )
+
+
+@dataclass(frozen=True)
+class ProfileFeatures:
+    """Features of a candidate list, one row per candidate in request order.
+
+    ``token_ids[token_indptr[i]:token_indptr[i + 1]]`` are the vocabulary ids
+    of candidate ``i``'s tokens; ``department_ids`` is -1 for no department.
+    """
+
+    token_indptr: np.ndarray
+    token_ids: np.ndarray
+    department_ids: np.ndarray
+    seniority: np.ndarray
+    recency: np.ndarray
+    has_signals: np.ndarray
+    vocabulary: Mapping[str, int]
+    vocabulary_size: int
+
+    def __len__(self) -> int:
+        return len(self.department_ids)
+
+    def token_overlap(self, query_tokens: Iterable[str]) -> np.ndarray:
+        """Share of the distinct query tokens found in each candidate's tokens."""
+        query = {token.lower() for token in query_tokens if token}
+        overlap = np.zeros(len(self), dtype=np.float64)
+        if not query or not len(self):
+            return overlap
+        ids = [self.vocabulary.get(token, -1) for token in query]
+        # Tokens added to the vocabulary after the gather cannot occur here.
+        ids = [token_id for token_id in ids if 0 <= token_id < self.vocabulary_size]
+        if not ids:
+            return overlap
+        wanted = np.zeros(self.vocabulary_size, dtype=bool)
+        wanted[ids] = True
+        hits = np.zeros(len(self.token_ids) + 1, dtype=np.int64)
+        np.cumsum(wanted[self.token_ids], out=hits[1:])
+        counts = hits[self.token_indptr[1:]] - hits[self.token_indptr[:-1]]
+        return counts / len(query)
+
+    def department_first_seen(self) -> np.ndarray:
+        """Whether each candidate is the first of its (known) department in order."""
+        first = np.zeros(len(self), dtype=bool)
+        if len(self):
+            _, positions = np.unique(self.department_ids, return_index=True)
+            first[positions] = True
+        return first & (self.department_ids >= 0)
+
+
+def _grow(array: np.ndarray, needed: int) -> np.ndarray:
+    if needed <= len(array):
+        return array
+    grown = np.zeros(max(needed, 2 * len(array), INITIAL_CAPACITY), dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+class ProfileFeatureStore:
+    """Append-only feature columns keyed by ``profile_id`` (see the module docstring)."""
+
+    def __init__(self, *, max_rows: int = 0) -> None:
+        self.max_rows = max(0, max_rows)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.resets = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._rows: Dict[str, int] = {}
+        self._fingerprints: List[int] = []
+        self._vocabulary: Dict[str, int] = {}
+        self._departments: Dict[str, int] = {}
+        self._indptr = np.zeros(INITIAL_CAPACITY + 1, dtype=np.int64)
+        self._indices = np.zeros(INITIAL_CAPACITY, dtype=np.int32)
+        self._department_ids = np.zeros(INITIAL_CAPACITY, dtype=np.int32)
+        self._seniority = np.zeros(INITIAL_CAPACITY, dtype=np.float64)
+        self._recency = np.zeros(INITIAL_CAPACITY, dtype=np.float64)
+        self._has_signals = np.zeros(INITIAL_CAPACITY, dtype=bool)
+        self._size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def upsert_profile(self, profile: ProfileInput) -> None:
+        self._upsert(profile.profile_id, profile_fingerprint(profile), _profile_row(profile))
+
+    def upsert_record(self, profile_id: str, record: Mapping[str, Any]) -> None:
+        """Store the features of a record flattened by ``_extract_professor_properties``."""
+        if not profile_id:
+            return
+        fields = (
+            record.get("summary"),
+            [str(keyword) for keyword in record.get("keywords") or [] if keyword],
+            record.get("department"),
+            record.get("title"),
+            record_signals(record),
+        )
+        self._upsert(profile_id, _fingerprint(*fields), _compute_row(*fields))
+
+    def _upsert(self, profile_id: str, fingerprint: int, row: _Row) -> None:
+        with self._lock:
+            if self._lookup(profile_id, fingerprint) is None:
+                self._make_room(1)
+                self._append(profile_id, fingerprint, row)
+
+    def features_for(self, profiles: Sequence[ProfileInput]) -> ProfileFeatures:
+        """Gather the features of ``profiles``, computing and storing missing rows."""
+        keys = [profile.profile_id for profile in profiles]
+        prints = [profile_fingerprint(profile) for profile in profiles]
+        with self._lock:
+            rows = [self._lookup(key, fingerprint) for key, fingerprint in zip(keys, prints)]
+            missing = [idx for idx, row in enumerate(rows) if row is None]
+            if not missing:
+                self.hits += len(profiles)
+                return self._gather(np.asarray(rows, dtype=np.intp))
+        # Tokenising is the expensive part; keep it outside the lock.
+        computed = {idx: _profile_row(profiles[idx]) for idx in missing}
+        with self._lock:
+            self.misses += len(missing)
+            self.hits += len(profiles) - len(missing)
+            self._make_room(len(missing))
+            self._append_rows(
+                [
+                    (keys[idx], prints[idx], row)
+                    for idx, row in computed.items()
+                    if self._lookup(keys[idx], prints[idx]) is None
+                ]
+            )
+            resolved = np.empty(len(profiles), dtype=np.intp)
+            for idx, (key, fingerprint) in enumerate(zip(keys, prints)):
+                row_index = self._lookup(key, fingerprint)
+                if row_index is None:
+                    # Superseded by a duplicate id in this list or a concurrent reset.
+                    row_index = self._append(key, fingerprint, _profile_row(profiles[idx]))
+                resolved[idx] = row_index
+            return self._gather(resolved)
+
+    def _lookup(self, profile_id: str, fingerprint: int) -> Optional[int]:
+        row = self._rows.get(profile_id)
+        if row is None or self._fingerprints[row] != fingerprint:
+            return None
+        return row
+
+    def _make_room(self, rows: int) -> None:
+        """Start over if ``rows`` more would pass ``max_rows`` (caller holds the lock)."""
+        if self.max_rows and rows and self._size + rows > self.max_rows:
+            self._reset()
+            self.resets += 1
+
+    def _append(self, profile_id: str, fingerprint: int, row: _Row) -> int:
+        return self._append_rows([(profile_id, fingerprint, row)])
+
+    def _append_rows(self, entries: Sequence[Tuple[str, int, _Row]]) -> int:
+        """Add rows as the current features of their profiles; return the first row index.
+
+        The caller holds the lock.
+        """
+        first = self._size
+        count = len(entries)
+        vocabulary = self._vocabulary
+        departments = self._departments
+        token_ids: List[int] = []
+        lengths: List[int] = []
+        department_ids: List[int] = []
+        for profile_id, fingerprint, row in entries:
+            token_ids.extend(vocabulary.setdefault(token, len(vocabulary)) for token in row.tokens)
+            lengths.append(len(row.tokens))
+            department_ids.append(
+                departments.setdefault(row.department, len(departments)) if row.department else -1
+            )
+            self._rows[profile_id] = first + len(lengths) - 1
+            self._fingerprints.append(fingerprint)
+
+        start = int(self._indptr[first])
+        self._indptr = _grow(self._indptr, first + count + 1)
+        self._indices = _grow(self._indices, start + len(token_ids))
+        self._indices[start : start + len(token_ids)] = token_ids
+        np.cumsum(lengths, out=self._indptr[first + 1 : first + count + 1])
+        self._indptr[first + 1 : first + count + 1] += start
+
+        end = first + count
+        self._department_ids = _grow(self._department_ids, end)
+        self._seniority = _grow(self._seniority, end)
+        self._recency = _grow(self._recency, end)
+        self._has_signals = _grow(self._has_signals, end)
+        self._department_ids[first:end] = department_ids
+        self._seniority[first:end] = [row.seniority for _, _, row in entries]
+        self._recency[first:end] = [row.recency for _, _, row in entries]
+        self._has_signals[first:end] = [row.has_signals for _, _, row in entries]
+        self._size = end
+        return first
+
+    def _gather(self, rows: np.ndarray) -> ProfileFeatures:
+        starts = self._indptr[rows]
+        lengths = self._indptr[rows + 1] - starts
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        positions = np.arange(indptr[-1], dtype=np.int64) + np.repeat(starts - indptr[:-1], lengths)
+        return ProfileFeatures(
+            token_indptr=indptr,
+            token_ids=self._indices[positions],
+            department_ids=self._department_ids[rows],
+            seniority=self._seniority[rows],
+            recency=self._recency[rows],
+            has_signals=self._has_signals[rows],
+            vocabulary=self._vocabulary,
+            vocabulary_size=len(self._vocabulary),
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "profiles": len(self._rows),
+                "rows": self._size,
+                "max_rows": self.max_rows,
+                "vocabulary": len(self._vocabulary),
+                "tokens": int(self._indptr[self._size]),
+                "departments": len(self._departments),
+                "hits": self.hits,
+                "misses": self.misses,
+                "resets": self.resets,
+            }
+
+
+_shared_store: Optional[ProfileFeatureStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_feature_store(settings: Optional[Settings] = None) -> ProfileFeatureStore:
+    """Return the process-wide store that ingest fills and scoring reads."""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            settings = settings or get_settings()
+            _shared_store = ProfileFeatureStore(max_rows=settings.feature_store_max_rows)
+        return _shared_store
+
+
+def profile_features(
+    profiles: Sequence[ProfileInput], settings: Optional[Settings] = None
+) -> ProfileFeatures:
+    """Features of ``profiles`` from the shared store, or computed afresh when it is off."""
+    settings = settings or get_settings()
+    if settings.feature_store:
+        return get_feature_store(settings).features_for(profiles)
+    return ProfileFeatureStore().features_for(profiles)
+
+
+def feature_store_snapshot() -> Dict[str, Any]:
+    if _shared_store is None:
+        return {"profiles": 0, "rows": 0}
+    return _shared_store.snapshot()
+
+
+register_metrics_provider("feature_store", feature_store_snapshot)
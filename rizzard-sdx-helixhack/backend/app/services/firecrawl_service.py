@@ -3,30 +3,32 @@
 from __future__ import annotations
 
 import logging
-import re
-from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 
 import requests
 
 from ..config import Settings, get_settings
-from .text import extract_tokens, merge_keywords
-
-try:  # pragma: no cover - optional dependency during offline development
-    from firecrawl import FirecrawlApp
-except ImportError:  # pragma: no cover - handled gracefully at runtime
-    FirecrawlApp = None
+from .resilience import TransientDependencyError, get_dependency_guard, parse_retry_after
+from .markdown_extract import extract_markdown_profile
+from .text import merge_keywords
 
 
 logger = logging.getLogger(__name__)
 
 
-HEADING_RE = re.compile(r"^#{1,3}\s+(?P<title>[^\n#]+)$", re.MULTILINE)
-DEPARTMENT_RE = re.compile(
-    r"(?P<label>Department of|Dept\. of|School of)\s+(?P<value>[^\n\r]+)",
-    re.IGNORECASE,
-)
+@lru_cache(maxsize=1)
+def _firecrawl_app_class():
+    """Import firecrawl-py on first use; it is optional and slow to import."""
+    try:  # pragma: no cover - optional dependency during offline development
+        from firecrawl import FirecrawlApp
+    except ImportError:  # pragma: no cover - handled gracefully at runtime
+        return None
+    return FirecrawlApp
+
+
+KEYWORD_TOKEN_LIMIT = 12
 
 
 @dataclass
@@ -40,6 +42,9 @@ class ScrapedProfessor:
     keywords: List[str]
     markdown: str
     metadata: Dict[str, Any]
+    title: Optional[str] = None
+    email: Optional[str] = None
+    publications: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -50,13 +55,18 @@ class ScrapedProfessor:
             "keywords": self.keywords,
             "markdown": self.markdown,
             "metadata": self.metadata,
+            "title": self.title,
+            "email": self.email,
+            "publications": self.publications,
         }
 
 
 class FirecrawlService:
     """Wrapper around Firecrawl's API with lightweight extraction helpers."""
 
+    name = "firecrawl"
     API_BASE = "https://api.firecrawl.dev/v1"
+    RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
 
     def __init__(
         self,
@@ -71,8 +81,10 @@ class FirecrawlService:
             )
         self._session = session or requests.Session()
         self._client = self._initialize_client()
+        self._guard = get_dependency_guard("firecrawl", self.settings)
 
     def _initialize_client(self):  # pragma: no cover - depends on optional library
+        FirecrawlApp = _firecrawl_app_class()
         if FirecrawlApp is None:
             logger.debug("firecrawl-py not available; using HTTP fallback client")
             return None
@@ -92,8 +104,25 @@ class FirecrawlService:
             "formats": ["markdown", "metadata"],
         }
         headers = {"Authorization": f"Bearer {self.settings.firecrawl_api_key}"}
+        timeout = (
+            self.settings.firecrawl_connect_timeout_seconds,
+            self.settings.firecrawl_read_timeout_seconds,
+        )
+        try:
+            response = self._session.post(endpoint, json=payload, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            raise TransientDependencyError(
+                f"Firecrawl HTTP request failed for {url}: {exc}"
+            ) from exc
+        except requests.RequestException as exc:
+            raise RuntimeError(f"Firecrawl HTTP request failed for {url}: {exc}") from exc
+
+        if response.status_code in self.RETRYABLE_STATUS_CODES:
+            raise TransientDependencyError(
+                f"Firecrawl returned HTTP {response.status_code} for {url}",
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
         try:
-            response = self._session.post(endpoint, json=payload, headers=headers, timeout=60)
             response.raise_for_status()
         except requests.RequestException as exc:
             raise RuntimeError(f"Firecrawl HTTP request failed for {url}: {exc}") from exc
@@ -104,11 +133,18 @@ class FirecrawlService:
         return data
 
     def scrape_url(self, url: str) -> Dict[str, Any]:
-        """Scrape a single URL and normalize the payload."""
+        """Scrape a single URL and normalize the payload.
+
+        Transient failures are retried with backoff, and calls fail fast with
+        :class:`CircuitOpenError` while Firecrawl is considered down.
+        """
 
         if not url:
             raise ValueError("URL must be provided for scraping")
 
+        return self._guard.call(self._scrape_once, url)
+
+    def _scrape_once(self, url: str) -> Dict[str, Any]:
         if self._client is not None:  # pragma: no cover - requires firecrawl service
             scrape_fn = getattr(self._client, "scrape_url", None) or getattr(
                 self._client, "scrape", None
@@ -143,62 +179,42 @@ class FirecrawlService:
     def extract_professor(self, payload: Dict[str, Any]) -> ScrapedProfessor:
         """Convert a Firecrawl payload into a structured professor record."""
 
-        url = payload.get("url", "")
-        markdown = payload.get("markdown") or payload.get("markdown_content") or ""
-        metadata = payload.get("metadata") or {}
-
-        name = metadata.get("title") or _first_heading(markdown) or url
-        summary = metadata.get("description") or _first_paragraph(markdown) or name
-        department = _extract_department(markdown)
-        keyword_candidates: List[str] = []
-        meta_keywords = metadata.get("keywords")
-        if isinstance(meta_keywords, str):
-            keyword_candidates.extend([k.strip() for k in meta_keywords.split(",") if k.strip()])
-        elif isinstance(meta_keywords, list):
-            keyword_candidates.extend(str(k) for k in meta_keywords if k)
-
-        keywords = _derive_keywords(markdown, summary, keyword_candidates)
-
-        return ScrapedProfessor(
-            url=url,
-            name=name.strip() if isinstance(name, str) else str(name),
-            department=department.strip() if department else None,
-            summary=summary.strip(),
-            keywords=keywords,
-            markdown=markdown,
-            metadata=metadata,
-        )
-
-
-def _first_heading(markdown: str) -> Optional[str]:
-    match = HEADING_RE.search(markdown or "")
-    if match:
-        return match.group("title").strip()
-    return None
-
-
-def _first_paragraph(markdown: str) -> Optional[str]:
-    if not markdown:
-        return None
-    blocks = [block.strip() for block in markdown.split("\n\n")]
-    for block in blocks:
-        if len(block) >= 40:
-            return block.replace("\n", " ")
-    return blocks[0] if blocks else None
-
-
-def _extract_department(markdown: str) -> Optional[str]:
-    if not markdown:
-        return None
-    match = DEPARTMENT_RE.search(markdown)
-    if match:
-        return match.group("value").strip()
-    return None
-
-
-def _derive_keywords(markdown: str, summary: str, seed: Iterable[str]) -> List[str]:
-    tokens = extract_tokens((markdown or "") + " " + (summary or ""))
-    freq = Counter(tokens)
-    top_tokens = [token for token, _ in freq.most_common(12)]
-    return merge_keywords(seed, top_tokens)
-
+        return extract_professor(payload)
+
+
+def extract_professor(payload: Dict[str, Any]) -> ScrapedProfessor:
+    """Convert a scraped payload (``url``/``markdown``/``metadata``) into a record."""
+
+    url = payload.get("url", "")
+    markdown = payload.get("markdown") or payload.get("markdown_content") or ""
+    metadata = payload.get("metadata") or {}
+
+    extracted = extract_markdown_profile(markdown)
+    name = metadata.get("title") or extracted.heading or url
+    summary = metadata.get("description") or extracted.paragraph or name
+    department = extracted.department
+    keyword_candidates: List[str] = []
+    meta_keywords = metadata.get("keywords")
+    if isinstance(meta_keywords, str):
+        keyword_candidates.extend([k.strip() for k in meta_keywords.split(",") if k.strip()])
+    elif isinstance(meta_keywords, list):
+        keyword_candidates.extend(str(k) for k in meta_keywords if k)
+
+    extracted.count_tokens(summary)
+    top_tokens = [
+        token for token, _ in extracted.token_counts.most_common(KEYWORD_TOKEN_LIMIT)
+    ]
+    keywords = merge_keywords(keyword_candidates, top_tokens)
+
+    return ScrapedProfessor(
+        url=url,
+        name=name.strip() if isinstance(name, str) else str(name),
+        department=department.strip() if department else None,
+        summary=summary.strip(),
+        keywords=keywords,
+        markdown=markdown,
+        metadata=metadata,
+        title=extracted.title,
+        email=extracted.email,
+        publications=extracted.publications,
+    )
@@ -0,0 +1,444 @@
+"""In-memory stand-in for ``helix.Client`` used for tests, benchmarks and demos.
+
+:class:`MemoryHelixClient` answers the HelixQL queries in ``db/queries.hx`` from
+numpy-backed :class:`MemoryProfessorStore` and :class:`MemoryChunkStore` and
+returns the same response shapes the real client does, so :class:`HelixDBService` works unchanged when
+``HELIXDB_BACKEND=memory``. Optional latency injection approximates the round
+trip to a real instance.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+PROJECTED_FIELDS = (
+    "profile_id",
+    "name",
+    "title",
+    "department",
+    "profile_url",
+    "summary",
+    "keywords",
+    "recent_publications",
+    "news_mentions",
+    "hiring",
+    "last_updated",
+)
+PROPERTY_FIELDS = PROJECTED_FIELDS + ("rerank_strategy",)
+CHUNK_FIELDS = ("profile_url", "kind", "position", "text")
+CHUNK_RESULT_FIELDS = ("profile_url", "kind", "position")
+INITIAL_CAPACITY = 1024
+QUERY_NAME_RE = re.compile(r"^QUERY\s+(\w+)\s*\(", re.MULTILINE)
+
+
+class MemoryQueryError(RuntimeError):
+    """Raised for unknown queries or bad parameters, like a Helix query error."""
+
+
+def _unit_rows(vectors: Any, count: int, what: str) -> np.ndarray:
+    matrix = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    if matrix.shape[0] != count:
+        raise MemoryQueryError(f"Each {what} needs exactly one vector")
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return matrix / norms
+
+
+class _VectorRows:
+    """Append-only float32 matrix of unit vectors with a liveness mask.
+
+    Subclasses keep their own per-row records; search is a single
+    matrix-vector product. Deleted rows are masked out rather than compacted.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._alive[: self._size].sum())
+
+    @property
+    def dimensions(self) -> int:
+        return self._vectors.shape[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def _reserve(self, rows: int, dimensions: int) -> None:
+        if self._size == 0 and self._vectors.shape[1] != dimensions:
+            self._vectors = np.zeros((max(INITIAL_CAPACITY, rows), dimensions), dtype=np.float32)
+            self._alive = np.zeros(self._vectors.shape[0], dtype=bool)
+        if self._vectors.shape[1] != dimensions:
+            raise MemoryQueryError(
+                f"Vector has {dimensions} dimensions; the store holds {self._vectors.shape[1]}"
+            )
+        needed = self._size + rows
+        if needed > self._vectors.shape[0]:
+            capacity = max(needed, self._vectors.shape[0] * 2)
+            grown = np.zeros((capacity, dimensions), dtype=np.float32)
+            grown[: self._size] = self._vectors[: self._size]
+            alive = np.zeros(capacity, dtype=bool)
+            alive[: self._size] = self._alive[: self._size]
+            self._vectors, self._alive = grown, alive
+
+    def _append(self, matrix: np.ndarray) -> int:
+        """Write ``matrix`` after the last row (caller holds the lock); return its first row."""
+        self._reserve(matrix.shape[0], matrix.shape[1])
+        start = self._size
+        self._vectors[start : start + matrix.shape[0]] = matrix
+        self._alive[start : start + matrix.shape[0]] = True
+        self._size += matrix.shape[0]
+        return start
+
+    def _top_rows(self, vector: Any, limit: int, mask: Optional[np.ndarray] = None) -> List[int]:
+        """Rows of the ``limit`` best live (and ``mask``-ed) vectors, best first."""
+        query = np.asarray(vector, dtype=np.float32).reshape(-1)
+        with self._lock:
+            if not self._size or limit <= 0:
+                return []
+            if query.shape[0] != self.dimensions:
+                raise MemoryQueryError(
+                    f"Query has {query.shape[0]} dimensions; the store holds {self.dimensions}"
+                )
+            live = self._alive[: self._size]
+            mask = live.copy() if mask is None else mask & live
+            matches = int(mask.sum())
+            if not matches:
+                return []
+            # Score every row in place rather than gathering candidates, which
+            # would copy the matrix; masked rows sink to -inf.
+            scores = self._vectors[: self._size] @ query
+        scores[~mask] = -np.inf
+        top = min(limit, matches)
+        if top < scores.size:
+            best = np.argpartition(-scores, top - 1)[:top]
+        else:
+            best = np.arange(scores.size)
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return best.tolist()
+
+
+class MemoryProfessorStore(_VectorRows):
+    """Professor vertices, one vector each, looked up by vertex id or profile URL."""
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._records: List[Dict[str, Any]] = []
+        self._rows_by_id: Dict[str, int] = {}
+        self._rows_by_url: Dict[str, int] = {}
+
+    def insert_many(
+        self, properties: Sequence[Dict[str, Any]], vectors: Any
+    ) -> List[Dict[str, Any]]:
+        matrix = _unit_rows(vectors, len(properties), "professor")
+        with self._lock:
+            start = self._append(matrix)
+            created: List[Dict[str, Any]] = []
+            for offset, props in enumerate(properties):
+                row = start + offset
+                vertex_id = str(uuid.uuid4())
+                record = {key: props.get(key) for key in PROPERTY_FIELDS}
+                record["id"] = vertex_id
+                record["label"] = "Professor"
+                self._records.append(record)
+                self._rows_by_id[vertex_id] = row
+                if record.get("profile_url"):
+                    self._rows_by_url[record["profile_url"]] = row
+                created.append(record)
+            return created
+
+    def delete(self, vertex_id: str) -> bool:
+        with self._lock:
+            row = self._rows_by_id.pop(vertex_id, None)
+            if row is None:
+                return False
+            self._alive[row] = False
+            url = self._records[row].get("profile_url")
+            if url and self._rows_by_url.get(url) == row:
+                del self._rows_by_url[url]
+            return True
+
+    def get_by_url(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._rows_by_url.get(url)
+            return self._records[row] if row is not None else None
+
+    def vertex(self, row: int, *, fields: Optional[Sequence[str]] = None, vectors: bool = False):
+        record = self._records[row]
+        if fields is not None:
+            return {key: record.get(key) for key in fields}
+        vertex = dict(record)
+        if vectors:
+            vertex["data"] = self._vectors[row].tolist()
+        return vertex
+
+    def list_rows(self, start: int, end: int) -> List[int]:
+        with self._lock:
+            rows = np.flatnonzero(self._alive[: self._size])
+            return rows[max(0, start) : max(0, end)].tolist()
+
+    def search(
+        self,
+        vector: Any,
+        limit: int,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> List[int]:
+        with self._lock:
+            mask = None
+            if predicate is not None:
+                mask = np.fromiter(
+                    (predicate(record) for record in self._records),
+                    dtype=bool,
+                    count=self._size,
+                )
+            return self._top_rows(vector, limit, mask)
+
+
+class MemoryChunkStore(_VectorRows):
+    """``ProfessorChunk`` vertices: several vectors per professor, keyed by profile URL."""
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._records: List[Dict[str, Any]] = []
+        self._rows_by_url: Dict[str, List[int]] = {}
+
+    def insert_many(self, chunks: Sequence[Dict[str, Any]], vectors: Any) -> int:
+        matrix = _unit_rows(vectors, len(chunks), "chunk")
+        with self._lock:
+            start = self._append(matrix)
+            for offset, chunk in enumerate(chunks):
+                record = {key: chunk.get(key) for key in CHUNK_FIELDS}
+                self._records.append(record)
+                self._rows_by_url.setdefault(record["profile_url"], []).append(start + offset)
+            return len(chunks)
+
+    def delete_url(self, profile_url: str) -> int:
+        with self._lock:
+            rows = self._rows_by_url.pop(profile_url, [])
+            self._alive[rows] = False
+            return len(rows)
+
+    def search(self, vector: Any, limit: int) -> List[Dict[str, Any]]:
+        rows = self._top_rows(vector, limit)
+        return [
+            {key: self._records[row][key] for key in CHUNK_RESULT_FIELDS} for row in rows
+        ]
+
+
+def _range_predicate(payload: Dict[str, Any], *, department: bool, hiring: bool):
+    lower = payload.get("updated_after", "")
+    upper = payload.get("updated_before", "")
+    wanted_department = payload.get("department")
+
+    def predicate(record: Dict[str, Any]) -> bool:
+        if hiring and record.get("hiring") is not True:
+            return False
+        if department and record.get("department") != wanted_department:
+            return False
+        last_updated = record.get("last_updated") or ""
+        return lower <= last_updated <= upper
+
+    return predicate
+
+
+class MemoryHelixClient:
+    """Duck-typed ``helix.Client`` whose ``query`` runs against a memory store."""
+
+    def __init__(
+        self,
+        *,
+        store: Optional[MemoryProfessorStore] = None,
+        chunk_store: Optional[MemoryChunkStore] = None,
+        latency_seconds: float = 0.0,
+        jitter_seconds: float = 0.0,
+    ) -> None:
+        self.store = store if store is not None else MemoryProfessorStore()
+        self.chunk_store = chunk_store if chunk_store is not None else MemoryChunkStore()
+        self.latency_seconds = max(0.0, latency_seconds)
+        self.jitter_seconds = max(0.0, jitter_seconds)
+        self.deployed_queries: Optional[set] = None
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "InsertProfessor": self._insert_professor,
+            "InsertProfessors": self._insert_professors,
+            "GetProfessorByUrl": self._get_professor_by_url,
+            "ListProfessors": self._list_professors,
+            "DeleteProfessor": self._delete_professor,
+            "InsertProfessorChunks": self._insert_professor_chunks,
+            "SearchProfessorChunks": self._search_professor_chunks,
+            "DeleteProfessorChunks": self._delete_professor_chunks,
+        }
+        for base, department, hiring in (
+            ("SearchSimilarProfessors", False, False),
+            ("SearchSimilarProfessorsUpdatedBetween", False, False),
+            ("SearchSimilarProfessorsInDepartment", True, False),
+            ("SearchSimilarHiringProfessors", False, True),
+            ("SearchSimilarHiringProfessorsInDepartment", True, True),
+        ):
+            filtered = base != "SearchSimilarProfessors"
+            for vectors in (False, True):
+                name = base + ("WithVectors" if vectors else "")
+                self._handlers[name] = self._search_handler(
+                    filtered=filtered, department=department, hiring=hiring, vectors=vectors
+                )
+
+    def register_query(self, name: str, handler: Callable[[Dict[str, Any]], Any]) -> None:
+        """Add or replace the handler for a HelixQL query name."""
+        self._handlers[name] = handler
+
+    def apply_schema(self, schema_text: str) -> None:
+        """Record which queries the schema declares; unknown ones are rejected later."""
+        self.deployed_queries = set(QUERY_NAME_RE.findall(schema_text))
+
+    def _sleep(self) -> None:
+        delay = self.latency_seconds
+        if self.jitter_seconds:
+            delay += random.uniform(0.0, self.jitter_seconds)
+        if delay:
+            time.sleep(delay)
+
+    def query(self, name: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+        self._sleep()
+        handler = self._handlers.get(name)
+        if handler is None or (
+            self.deployed_queries is not None and name not in self.deployed_queries
+        ):
+            raise MemoryQueryError(f"Query {name!r} is not deployed")
+        try:
+            return handler(payload or {})
+        except KeyError as exc:
+            raise MemoryQueryError(f"Missing parameter {exc} for query {name!r}") from exc
+
+    def _insert_professor(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        (record,) = self.store.insert_many([payload], [payload["vector"]])
+        return {"professor": dict(record)}
+
+    def _insert_professors(self, payload: Dict[str, Any]) -> str:
+        professors = payload["professors"]
+        if professors:
+            self.store.insert_many(professors, [props["vector"] for props in professors])
+        return "inserted"
+
+    def _get_professor_by_url(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        record = self.store.get_by_url(payload["url"])
+        return {"professor": [dict(record)] if record else []}
+
+    def _list_professors(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        rows = self.store.list_rows(int(payload["start"]), int(payload["end"]))
+        return {"professors": [self.store.vertex(row, vectors=True) for row in rows]}
+
+    def _delete_professor(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.store.delete(str(payload["id"])):
+            raise MemoryQueryError(f"No professor with id {payload['id']!r}")
+        return {"deleted": "deleted"}
+
+    def _insert_professor_chunks(self, payload: Dict[str, Any]) -> str:
+        chunks = payload["chunks"]
+        if chunks:
+            self.chunk_store.insert_many(chunks, [chunk["vector"] for chunk in chunks])
+        return "inserted"
+
+    def _search_professor_chunks(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"chunks": self.chunk_store.search(payload["vector"], int(payload["limit"]))}
+
+    def _delete_professor_chunks(self, payload: Dict[str, Any]) -> str:
+        self.chunk_store.delete_url(payload["profile_url"])
+        return "deleted"
+
+    def _search_handler(self, *, filtered: bool, department: bool, hiring: bool, vectors: bool):
+        fields = None if vectors else PROJECTED_FIELDS
+
+        def handler(payload: Dict[str, Any]) -> Dict[str, Any]:
+            predicate = (
+                _range_predicate(payload, department=department, hiring=hiring)
+                if filtered
+                else None
+            )
+            rows = self.store.search(payload["vector"], int(payload["limit"]), predicate)
+            return {
+                "professors": [
+                    self.store.vertex(row, fields=fields, vectors=vectors) for row in rows
+                ]
+            }
+
+        return handler
+
+
+_shared_store: Optional[MemoryProfessorStore] = None
+_shared_chunk_store: Optional[MemoryChunkStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def seed_from_artifact(store: MemoryProfessorStore, settings: Settings) -> int:
+    """Load the corpus artifact's records and vectors straight into ``store``."""
+    from .corpus_artifact import default_artifact_path, load_corpus_artifact
+    from .urls import canonicalize_url
+
+    path = settings.corpus_artifact_path or default_artifact_path("ucsd")
+    artifact = load_corpus_artifact(path, model_name=settings.embedding_model_name)
+    records = []
+    for record in artifact.records:
+        record = dict(record)
+        if record.get("profile_url"):
+            record["profile_url"] = canonicalize_url(
+                record["profile_url"], force_https=settings.url_force_https
+            )
+        records.append(record)
+    if records:
+        store.insert_many(records, artifact.embeddings)
+    logger.info("Seeded in-memory Helix store with %s professors from %s", len(records), path)
+    return len(records)
+
+
+def get_memory_store(settings: Optional[Settings] = None) -> MemoryProfessorStore:
+    """Return the process-wide store so every service instance sees the same data.
+
+    With ``HELIX_MEMORY_SEED_FROM_ARTIFACT`` the store is filled from the corpus
+    artifact when first created, without loading the embedding model.
+    """
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = MemoryProfessorStore()
+            settings = settings or get_settings()
+            if settings.helix_memory_seed_from_artifact:
+                seed_from_artifact(_shared_store, settings)
+        return _shared_store
+
+
+def get_memory_chunk_store() -> MemoryChunkStore:
+    """Process-wide chunk store paired with :func:`get_memory_store`."""
+    global _shared_chunk_store
+    with _shared_store_lock:
+        if _shared_chunk_store is None:
+            _shared_chunk_store = MemoryChunkStore()
+        return _shared_chunk_store
+
+
+def create_memory_client(settings: Optional[Settings] = None) -> MemoryHelixClient:
+    settings = settings or get_settings()
+    return MemoryHelixClient(
+        store=get_memory_store(settings),
+        chunk_store=get_memory_chunk_store(),
+        latency_seconds=settings.helix_memory_latency_ms / 1000.0,
+        jitter_seconds=settings.helix_memory_jitter_ms / 1000.0,
+    )
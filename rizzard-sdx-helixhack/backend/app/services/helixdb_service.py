@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from ..config import Settings, get_settings
+from .feature_store import get_feature_store
+from .helix_memory import create_memory_client
+from .resilience import TransientDependencyError, get_dependency_guard
+from .search_cache import bump_corpus_version
+from .urls import canonicalize_url
+from .vectors import VectorLike, float32_to_list
 
 try:  # pragma: no cover - optional dependency until installed
     import helix
@@ -18,6 +25,67 @@ logger = logging.getLogger(__name__)
 
 SCHEMA_FILENAME = "schema.hql"
 DEFAULT_LIMIT = 20
+# Sorts after any ISO-8601 timestamp, so it works as an open upper bound.
+OPEN_UPPER_BOUND = "\uffff"
+DATE_ONLY_LENGTH = len("YYYY-MM-DD")
+
+
+@dataclass(frozen=True)
+class SearchFilters:
+    """Predicates applied inside the Helix vector search.
+
+    ``updated_after``/``updated_before`` are inclusive ISO-8601 bounds compared
+    against ``last_updated`` as strings; a date-only upper bound covers that
+    whole day. Professors with an empty ``last_updated`` match unless
+    ``updated_after`` is set.
+    """
+
+    department: Optional[str] = None
+    hiring: bool = False
+    updated_after: Optional[str] = None
+    updated_before: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self.department or self.hiring or self.updated_after or self.updated_before)
+
+    @property
+    def query_name(self) -> str:
+        if not self.active:
+            return "SearchSimilarProfessors"
+        if self.hiring and self.department:
+            return "SearchSimilarHiringProfessorsInDepartment"
+        if self.hiring:
+            return "SearchSimilarHiringProfessors"
+        if self.department:
+            return "SearchSimilarProfessorsInDepartment"
+        return "SearchSimilarProfessorsUpdatedBetween"
+
+    def query_params(self) -> Dict[str, Any]:
+        if not self.active:
+            return {}
+        upper = self.updated_before or OPEN_UPPER_BOUND
+        if len(upper) == DATE_ONLY_LENGTH:
+            upper += OPEN_UPPER_BOUND
+        params: Dict[str, Any] = {
+            "updated_after": self.updated_after or "",
+            "updated_before": upper,
+        }
+        if self.department:
+            params["department"] = self.department
+        return params
+
+    def matches(self, record: Dict[str, Any]) -> bool:
+        """Apply the same predicates in Python, for records found by other routes."""
+        if not self.active:
+            return True
+        if self.hiring and record.get("hiring") is not True:
+            return False
+        if self.department and record.get("department") != self.department:
+            return False
+        params = self.query_params()
+        last_updated = record.get("last_updated") or ""
+        return params["updated_after"] <= last_updated <= params["updated_before"]
 
 
 class HelixDBService:
@@ -27,6 +95,7 @@ class HelixDBService:
         self.settings = settings or get_settings()
         self.project_root = Path(__file__).resolve().parents[2]
         self._client = self._create_client()
+        self._guard = get_dependency_guard("helix", self.settings)
 
     @property
     def client(self):
@@ -37,6 +106,12 @@ class HelixDBService:
         return self._client
 
     def _create_client(self):  # pragma: no cover - requires helix runtime
+        if self.settings.helixdb_backend == "memory":
+            return create_memory_client(self.settings)
+        if self.settings.helixdb_backend != "helix":
+            raise ValueError(
+                f"Unknown HELIXDB_BACKEND {self.settings.helixdb_backend!r}; use 'helix' or 'memory'"
+            )
         if helix is None:
             logger.warning(
                 "helix-py is not installed; HelixDBService cannot be used until it is."
@@ -75,6 +150,16 @@ class HelixDBService:
                 logger.error("Unable to initialize HelixDB client: %s", exc)
                 raise
 
+    def _query(self, name: str, payload: Dict[str, Any], *, retry: bool = True) -> Any:
+        """Run a HelixQL query behind the shared retry/circuit-breaker guard."""
+        return self._guard.call(
+            self.client.query,
+            name,
+            payload,
+            retry=retry,
+            is_transient=_is_transient_helix_error,
+        )
+
     def initialize_schema(self, schema_path: Optional[Path] = None) -> bool:
         """Load the HelixQL schema/queries into the running HelixDB instance."""
 
@@ -103,59 +188,85 @@ class HelixDBService:
         return applied
 
     def get_professor_by_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """Look a professor up by canonical URL, falling back to the raw string.
+
+        The fallback keeps vertices written before URLs were canonicalised
+        discoverable.
+        """
         if not url:
             return None
-        payload = {"url": url}
-        result = self.client.query("GetProfessorByUrl", payload)
-        if isinstance(result, list) and result:
-            return result[0]
-        if isinstance(result, dict):
-            inner = result.get("professor") or result.get("result")
-            if isinstance(inner, list) and inner:
-                return inner[0]
+        canonical = canonicalize_url(url, force_https=self.settings.url_force_https)
+        for candidate in dict.fromkeys((canonical, url)):
+            result = self._query("GetProfessorByUrl", {"url": candidate})
+            if isinstance(result, list) and result:
+                return result[0]
+            if isinstance(result, dict):
+                inner = result.get("professor") or result.get("result")
+                if isinstance(inner, list) and inner:
+                    return inner[0]
         return None
 
     def insert_professor(
-        self, profile_data: Dict[str, Any], embedding: List[float]
+        self, profile_data: Dict[str, Any], embedding: VectorLike
     ) -> Tuple[str, bool]:
         profile_url = profile_data.get("profile_url")
         if profile_url:
+            # Look up the URL as given: get_professor_by_url tries the canonical
+            # form first and falls back to this raw string for older vertices.
             existing = self.get_professor_by_url(profile_url)
             if existing:
                 return _extract_vertex_id(existing), False
+            profile_url = canonicalize_url(profile_url, force_https=self.settings.url_force_https)
 
-        # Extract activity_signals if present
-        activity_signals = profile_data.get("activity_signals") or {}
-        if isinstance(activity_signals, dict):
-            recent_publications = activity_signals.get("recent_publications") or []
-            news_mentions = activity_signals.get("news_mentions") or []
-            hiring = activity_signals.get("hiring", False)
-            last_updated = activity_signals.get("last_updated") or ""
-        else:
-            recent_publications = []
-            news_mentions = []
-            hiring = False
-            last_updated = ""
+        payload = build_professor_payload(
+            {**profile_data, "profile_url": profile_url or ""},
+            embedding,
+            force_https=self.settings.url_force_https,
+        )
 
-        payload = {
-            "profile_id": profile_data.get("profile_id", ""),
-            "name": profile_data.get("name", ""),
-            "title": profile_data.get("title", ""),
-            "department": profile_data.get("department", ""),
-            "profile_url": profile_url or "",
-            "summary": profile_data.get("summary", ""),
-            "keywords": profile_data.get("keywords", []),
-            "recent_publications": recent_publications,
-            "news_mentions": news_mentions,
-            "hiring": hiring,
-            "last_updated": last_updated,
-            "rerank_strategy": profile_data.get("rerank_strategy", "hybrid"),
-            "vector": embedding,
-        }
+        return self.insert_professor_payload(payload), True
+
+    def insert_professor_payload(self, payload: Dict[str, Any]) -> str:
+        """Insert one prepared payload (see :func:`build_professor_payload`).
 
+        No existence check is made; returns the new vertex id.
+        """
         logger.debug("Inserting professor profile for %s", payload["profile_url"])
-        result = self.client.query("InsertProfessor", payload)
-        return _extract_vertex_id(result), True
+        # Inserts are not idempotent, so a timed-out attempt is never replayed.
+        try:
+            result = self._query("InsertProfessor", payload, retry=False)
+        finally:
+            # A failed insert may still have landed, so invalidate either way.
+            bump_corpus_version(self.settings)
+        self._store_features(payload)
+        return _extract_vertex_id(result)
+
+    def insert_professors_bulk(self, payloads: Sequence[Dict[str, Any]]) -> None:
+        """Insert prepared payloads (see :func:`build_professor_payload`) in one query.
+
+        No existence check is made; callers such as the bulk loader handle that.
+        """
+        if not payloads:
+            return
+        try:
+            self._query("InsertProfessors", {"professors": list(payloads)}, retry=False)
+        finally:
+            bump_corpus_version(self.settings)
+        for payload in payloads:
+            self._store_features(payload)
+
+    def _store_features(self, payload: Dict[str, Any]) -> None:
+        """Precompute scoring features so the first search scoring this profile skips it.
+
+        The row is built from the record as search reads it back and keyed the
+        same way: by ``profile_id``, else ``profile_url`` (search projections
+        carry no vertex id).
+        """
+        if not self.settings.feature_store:
+            return
+        record = _extract_professor_properties(payload)
+        key = record["profile_id"] or record["profile_url"] or ""
+        get_feature_store(self.settings).upsert_record(str(key), record)
 
     def batch_insert_professors(
         self, entries: Iterable[Dict[str, Any]]
@@ -175,15 +286,101 @@ class HelixDBService:
                 )
         return ids
 
+    def list_professors(self, *, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return whole professor vertices (vectors included) in storage order."""
+        raw = self._query("ListProfessors", {"start": int(offset), "end": int(offset + limit)})
+        return [
+            _extract_professor_properties(record, include_vector=True)
+            for record in _normalize_search_results(raw)
+        ]
+
+    def delete_professor(self, vertex_id: str, *, profile_url: Optional[str] = None) -> None:
+        """Drop a ``Professor`` vertex, and its ``ProfessorChunk`` vertices when
+        ``profile_url`` is given.
+
+        Callers that re-insert the same profile straight away (the vector
+        migration) leave ``profile_url`` out so the chunks survive.
+        """
+        self._query("DeleteProfessor", {"id": vertex_id}, retry=False)
+        bump_corpus_version(self.settings)
+        if profile_url:
+            self.delete_professor_chunks(profile_url)
+
+    def insert_professor_chunks(self, chunks: Sequence[Dict[str, Any]]) -> None:
+        """Insert ``ProfessorChunk`` vertices (``profile_url``, ``kind``, ``position``,
+        ``text``, ``vector``) in one query."""
+        if not chunks:
+            return
+        try:
+            self._query("InsertProfessorChunks", {"chunks": list(chunks)}, retry=False)
+        finally:
+            bump_corpus_version(self.settings)
+
+    def delete_professor_chunks(self, profile_url: str) -> None:
+        canonical = canonicalize_url(profile_url, force_https=self.settings.url_force_https)
+        self._query("DeleteProfessorChunks", {"profile_url": canonical}, retry=False)
+        bump_corpus_version(self.settings)
+
+    def replace_professor_chunks(
+        self,
+        profile_url: str,
+        chunks: Sequence[Any],
+        vectors: Sequence[VectorLike],
+    ) -> int:
+        """Swap a professor's chunk vectors for ``chunks`` (objects with ``kind``,
+        ``position`` and ``text``) embedded as ``vectors``."""
+        canonical = canonicalize_url(profile_url, force_https=self.settings.url_force_https)
+        self.delete_professor_chunks(canonical)
+        payloads = [
+            {
+                "profile_url": canonical,
+                "kind": chunk.kind,
+                "position": int(chunk.position),
+                "text": chunk.text,
+                "vector": float32_to_list(vector),
+            }
+            for chunk, vector in zip(chunks, vectors)
+        ]
+        self.insert_professor_chunks(payloads)
+        return len(payloads)
+
+    def search_professor_chunks(
+        self, embedding: VectorLike, *, limit: int = DEFAULT_LIMIT
+    ) -> List[Dict[str, Any]]:
+        """Return the ``limit`` nearest chunks, best first, as
+        ``profile_url``/``kind``/``position`` dicts."""
+        raw = self._query(
+            "SearchProfessorChunks",
+            {"vector": float32_to_list(embedding), "limit": int(limit)},
+        )
+        if isinstance(raw, list) and raw and isinstance(raw[0], dict) and "chunks" in raw[0]:
+            raw = raw[0]
+        if isinstance(raw, dict):
+            raw = raw.get("chunks") or []
+        return [record for record in raw or [] if isinstance(record, dict)]
+
     def search_similar_professors(
         self,
-        embedding: List[float],
+        embedding: VectorLike,
         *,
         limit: int = DEFAULT_LIMIT,
+        filters: Optional[SearchFilters] = None,
+        include_vectors: bool = False,
     ) -> List[Dict[str, Any]]:
-        payload = {"vector": embedding, "limit": int(limit)}
+        """Return the ``limit`` nearest professors, optionally filtered.
+
+        Only the fields scoring and the UI use come back unless
+        ``include_vectors`` is set, which fetches whole vertices instead.
+        """
+        filters = filters or SearchFilters()
+        query_name = filters.query_name + ("WithVectors" if include_vectors else "")
+        payload = {
+            "vector": float32_to_list(embedding),
+            "limit": int(limit),
+            **filters.query_params(),
+        }
         try:
-            raw = self.client.query("SearchSimilarProfessors", payload)
+            raw = self._query(query_name, payload)
         except Exception as exc:
             error_msg = str(exc).lower()
             # Check if it's a schema/index initialization error
@@ -205,7 +402,60 @@ class HelixDBService:
                 raise
         
         records = _normalize_search_results(raw)
-        return [_extract_professor_properties(record) for record in records]
+        return [
+            _extract_professor_properties(record, include_vector=include_vectors)
+            for record in records
+        ]
+
+
+def build_professor_payload(
+    profile_data: Dict[str, Any], embedding: VectorLike, *, force_https: bool = True
+) -> Dict[str, Any]:
+    """Build the InsertProfessor parameters for a profile.
+
+    Activity signals may be nested under ``activity_signals`` (API/scraper
+    shape) or given as top-level fields (``data/professors.py`` shape).
+    """
+    activity_signals = profile_data.get("activity_signals")
+    if not isinstance(activity_signals, dict):
+        activity_signals = profile_data
+
+    profile_url = profile_data.get("profile_url") or ""
+    if profile_url:
+        profile_url = canonicalize_url(profile_url, force_https=force_https)
+
+    return {
+        "profile_id": profile_data.get("profile_id", ""),
+        "name": profile_data.get("name", ""),
+        "title": profile_data.get("title", ""),
+        "department": profile_data.get("department", ""),
+        "profile_url": profile_url,
+        "summary": profile_data.get("summary", ""),
+        "keywords": profile_data.get("keywords", []),
+        "recent_publications": activity_signals.get("recent_publications") or [],
+        "news_mentions": activity_signals.get("news_mentions") or [],
+        "hiring": activity_signals.get("hiring", False),
+        "last_updated": activity_signals.get("last_updated") or "",
+        "rerank_strategy": profile_data.get("rerank_strategy", "hybrid"),
+        "vector": float32_to_list(embedding),
+    }
+
+
+def _is_transient_helix_error(exc: BaseException) -> bool:
+    """Treat transport-level failures as the dependency being unhealthy.
+
+    Query errors (bad params, missing index) come back from a healthy server and
+    must not trip the breaker or be retried.
+    """
+    if isinstance(exc, (TransientDependencyError, ConnectionError, TimeoutError)):
+        return True
+    status = getattr(exc, "code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None
+    )
+    if isinstance(status, int):
+        return status >= 500 or status == 429
+    # urllib/requests style errors raised by helix-py when the container is down.
+    return isinstance(exc, OSError)
 
 
 def _extract_vertex_id(result: Any) -> str:
@@ -243,53 +493,70 @@ def _normalize_search_results(raw: Any) -> List[Dict[str, Any]]:
     return []
 
 
-def _extract_professor_properties(record: Dict[str, Any]) -> Dict[str, Any]:
+def _coerce_keywords(value: Any) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [keyword.strip() for keyword in value.split(",") if keyword.strip()]
+    if isinstance(value, list):
+        return value
+    return [str(value)]
+
+
+def _extract_professor_properties(
+    record: Dict[str, Any], *, include_vector: bool = False
+) -> Dict[str, Any]:
+    """Flatten a Helix professor record into the fields search callers read.
+
+    Projected and whole-vertex records are handled alike: nested
+    ``properties`` win over top-level keys, and every field is read once.
+    """
     if not isinstance(record, dict):
         return {}
 
-    properties = dict(record)
     node_props = record.get("properties")
-    if isinstance(node_props, dict):
-        properties.update(node_props)
-
-    keywords = properties.get("keywords") or []
-    if isinstance(keywords, str):
-        keywords = [keyword.strip() for keyword in keywords.split(",") if keyword.strip()]
-    elif not isinstance(keywords, list):
-        keywords = [str(keywords)]
-
-    properties["keywords"] = keywords
-    
-    # Set default values for all fields
-    properties.setdefault("profile_id", record.get("profile_id", ""))
-    properties.setdefault("profile_url", record.get("profile_url"))
-    properties.setdefault("name", record.get("name"))
-    properties.setdefault("title", record.get("title", ""))
-    properties.setdefault("department", record.get("department"))
-    properties.setdefault("summary", record.get("summary"))
-    properties.setdefault("recent_publications", record.get("recent_publications", []))
-    properties.setdefault("news_mentions", record.get("news_mentions", []))
-    properties.setdefault("hiring", record.get("hiring", False))
-    properties.setdefault("last_updated", record.get("last_updated", ""))
-    properties.setdefault("rerank_strategy", record.get("rerank_strategy", "hybrid"))
-
-    # Reconstruct activity_signals if needed for API compatibility
-    if "activity_signals" not in properties:
-        properties["activity_signals"] = {
-            "recent_publications": properties.get("recent_publications", []),
-            "news_mentions": properties.get("news_mentions", []),
-            "hiring": properties.get("hiring", False),
-            "last_updated": properties.get("last_updated", ""),
-        }
+    source = {**record, **node_props} if isinstance(node_props, dict) else record
+    get = source.get
+
+    keywords = get("keywords")
+    if type(keywords) is not list:
+        keywords = _coerce_keywords(keywords)
+    recent_publications = get("recent_publications") or []
+    news_mentions = get("news_mentions") or []
+    hiring = get("hiring") or False
+    last_updated = get("last_updated") or ""
+    activity_signals = get("activity_signals") or {
+        "recent_publications": recent_publications,
+        "news_mentions": news_mentions,
+        "hiring": hiring,
+        "last_updated": last_updated,
+    }
+    properties: Dict[str, Any] = {
+        "profile_id": get("profile_id") or "",
+        "profile_url": get("profile_url"),
+        "name": get("name"),
+        "title": get("title") or "",
+        "department": get("department"),
+        "summary": get("summary"),
+        "keywords": keywords,
+        "recent_publications": recent_publications,
+        "news_mentions": news_mentions,
+        "hiring": hiring,
+        "last_updated": last_updated,
+        "rerank_strategy": get("rerank_strategy") or "hybrid",
+        # Kept for API compatibility with callers that read the nested form.
+        "activity_signals": activity_signals,
+    }
 
     identifier = (
-        properties.get("id")
-        or record.get("id")
-        or record.get("_id")
-        or properties.get("profile_id")
-        or properties.get("profile_url")
+        get("id") or record.get("_id") or properties["profile_id"] or properties["profile_url"]
     )
     if identifier:
         properties["id"] = str(identifier)
 
+    if include_vector:
+        vector = get("vector") or get("data")
+        if vector is not None:
+            properties["vector"] = vector
+
     return properties
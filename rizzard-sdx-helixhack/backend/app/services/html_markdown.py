@@ -0,0 +1,161 @@
+"""Minimal HTML to markdown conversion for directly fetched profile pages."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+SKIPPED_TAGS = frozenset(
+    {"script", "style", "noscript", "template", "svg", "iframe", "nav", "footer", "form"}
+)
+BLOCK_TAGS = frozenset(
+    {
+        "p", "div", "section", "article", "main", "header", "aside", "table", "tr",
+        "ul", "ol", "dl", "dt", "dd", "blockquote", "pre", "figure", "figcaption",
+        "address",
+    }
+)
+HEADING_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+LIST_ITEM_PREFIX = "- "
+VOID_TAGS = frozenset({"br", "hr", "img", "meta", "link", "input", "source", "wbr"})
+
+
+@dataclass
+class ConvertedPage:
+    """Markdown body plus Firecrawl-style metadata for one HTML document."""
+
+    markdown: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    links: List[str] = field(default_factory=list)
+
+
+class _MarkdownBuilder(HTMLParser):
+    def __init__(self, base_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.blocks: List[str] = []
+        self.links: List[str] = []
+        self.meta: Dict[str, str] = {}
+        self.title_parts: List[str] = []
+        self._inline: List[str] = []
+        self._prefix = ""
+        self._skip_depth = 0
+        self._in_title = False
+        self._in_head = False
+
+    def _flush(self) -> None:
+        text = WHITESPACE_RE.sub(" ", "".join(self._inline)).strip()
+        self._inline = []
+        if text:
+            self.blocks.append(f"{self._prefix}{text}")
+            # Kept until used, so <li><p>…</p></li> still becomes a list item.
+            self._prefix = ""
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in SKIPPED_TAGS:
+            if tag not in VOID_TAGS:
+                self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+
+        attributes = {key: value or "" for key, value in attrs}
+        if tag == "head":
+            self._in_head = True
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            key = (attributes.get("name") or attributes.get("property") or "").lower()
+            if key and "content" in attributes:
+                self.meta.setdefault(key, attributes["content"].strip())
+        elif tag == "a":
+            href = attributes.get("href", "").strip()
+            if href and not href.startswith(("#", "javascript:", "mailto:", "tel:")):
+                self.links.append(urljoin(self.base_url, href))
+        elif tag in HEADING_LEVELS:
+            self._flush()
+            self._prefix = "#" * HEADING_LEVELS[tag] + " "
+        elif tag == "li":
+            self._flush()
+            self._prefix = LIST_ITEM_PREFIX
+        elif tag in ("br", "td", "th"):
+            self._inline.append(" ")
+        elif tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in VOID_TAGS:
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS:
+            if tag not in VOID_TAGS and self._skip_depth:
+                self._skip_depth -= 1
+            return
+        if self._skip_depth:
+            return
+        if tag == "head":
+            self._in_head = False
+        elif tag == "title":
+            self._in_title = False
+        elif tag in HEADING_LEVELS or tag == "li":
+            self._flush()
+            self._prefix = ""
+        elif tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._in_title:
+            self.title_parts.append(data)
+        elif not self._in_head:
+            self._inline.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+
+def html_to_markdown(html: str, *, url: str = "") -> ConvertedPage:
+    """Convert ``html`` into the markdown/metadata shape ``extract_professor`` reads.
+
+    Headings become ``#`` lines, list items ``- `` lines, and other block
+    elements blank-line separated paragraphs. Scripts, styles, navigation and
+    footers are dropped. Metadata mirrors Firecrawl's keys (``title``,
+    ``description``, ``keywords``, ``sourceURL``).
+    """
+    builder = _MarkdownBuilder(url)
+    builder.feed(html or "")
+    builder.close()
+
+    metadata: Dict[str, Any] = {"sourceURL": url}
+    title = WHITESPACE_RE.sub(" ", "".join(builder.title_parts)).strip()
+    if title:
+        metadata["title"] = title
+    description = builder.meta.get("description") or builder.meta.get("og:description")
+    if description:
+        metadata["description"] = description
+    if builder.meta.get("keywords"):
+        metadata["keywords"] = builder.meta["keywords"]
+
+    parts: List[str] = []
+    previous_is_item = False
+    for block in builder.blocks:
+        is_item = block.startswith(LIST_ITEM_PREFIX)
+        if parts:
+            # Consecutive list items stay on adjacent lines, like a markdown list.
+            parts.append("\n" if is_item and previous_is_item else "\n\n")
+        parts.append(block)
+        previous_is_item = is_item
+
+    return ConvertedPage(
+        markdown="".join(parts),
+        metadata=metadata,
+        links=list(dict.fromkeys(builder.links)),
+    )
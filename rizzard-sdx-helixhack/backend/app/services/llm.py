@@ -4,20 +4,23 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Optional
-
-from anthropic import Anthropic
-from anthropic._exceptions import AnthropicError
+from typing import TYPE_CHECKING, Optional
 
 from ..config import Settings
 from ..models.schemas import ProfileInput, ScoreBreakdown
+from .singleflight import get_singleflight
+
+if TYPE_CHECKING:  # pragma: no cover - the SDK is imported on first use
+    from anthropic import Anthropic
 
 logger = logging.getLogger(__name__)
 
 
-def _get_client(settings: Settings) -> Anthropic:
+def _get_client(settings: Settings) -> "Anthropic":
     if not settings.claude_api_key:
         raise ValueError("Claude API key is not configured. Set CLAUDE_API in the environment.")
+    from anthropic import Anthropic
+
     return Anthropic(api_key=settings.claude_api_key)
 
 
@@ -78,8 +81,14 @@ def generate_score_summary(
         f"Data:\n{json.dumps(payload, indent=2)}\n"
     )
 
+    from anthropic._exceptions import AnthropicError
+
+    # Concurrent searches for the same query produce identical prompts; send one.
+    key = (settings.claude_model, max_tokens, system_prompt, prompt)
     try:
-        response = client.messages.create(
+        response = get_singleflight("llm_summary").do(
+            key,
+            client.messages.create,
             model=settings.claude_model,
             max_tokens=max_tokens,
             system=system_prompt,
@@ -0,0 +1,174 @@
+"""Single-pass extraction of professor fields from scraped profile markdown."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .text import TOKEN_PATTERN
+
+HEADING_RE = re.compile(r"^#{1,3}\s+(?P<title>[^\n#]+)$")
+SECTION_RE = re.compile(r"^(?P<hashes>#{1,6})\s+(?P<text>.*?)[\s#]*$")
+DEPARTMENT_RE = re.compile(
+    r"(?P<label>Department of|Dept\. of|School of)\s+(?P<value>[^\n\r]+)",
+    re.IGNORECASE,
+)
+DEPARTMENT_LABEL_AT_END_RE = re.compile(
+    r"(?:Department of|Dept\. of|School of)\s*$",
+    re.IGNORECASE,
+)
+TITLE_RE = re.compile(
+    r"^(?:(?:Distinguished|Assistant|Associate|Adjunct|Clinical|Visiting|Emeritus|"
+    r"Full|Senior|Teaching|Research)\s+)*"
+    r"(?:Professor|Lecturer|Instructor|Dean|Chair)\b[^\n]{0,100}$"
+)
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")
+LIST_ITEM_RE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(?P<item>.+?)\s*$")
+
+MIN_PARAGRAPH_LENGTH = 40
+MAX_PUBLICATIONS = 25
+LINE_DECORATION_CHARS = "#*_>` \t"
+# Tokens are buffered and folded into the Counter in chunks; per-line
+# ``Counter.update`` calls cost more than the tokenisation itself.
+TOKEN_FLUSH_SIZE = 4096
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercased tokens matching :func:`text.extract_tokens`."""
+    if text.isascii():
+        # Lowering first is only equivalent when no non-ASCII char lowers to ASCII.
+        return _findall_tokens(text.lower())
+    return [token.lower() for token in _findall_tokens(text)]
+
+
+_findall_tokens = TOKEN_PATTERN.findall
+
+
+@dataclass
+class MarkdownProfile:
+    """Fields recovered from one pass over a profile page's markdown."""
+
+    heading: Optional[str] = None
+    paragraph: Optional[str] = None
+    department: Optional[str] = None
+    title: Optional[str] = None
+    email: Optional[str] = None
+    publications: List[str] = field(default_factory=list)
+    token_counts: Counter = field(default_factory=Counter)
+
+    def count_tokens(self, text: str) -> None:
+        """Add the tokens of ``text`` (e.g. the chosen summary) to ``token_counts``."""
+        if text:
+            self.token_counts.update(_tokenize(text))
+
+
+class MarkdownProfileExtractor:
+    """Streaming extractor fed one markdown line at a time.
+
+    Produces the same heading, first paragraph, department, and token counts as
+    the previous multi-scan helpers, while also picking out the academic title,
+    a contact email, and the items of a "Publications" section.
+    """
+
+    def __init__(self) -> None:
+        self.result = MarkdownProfile()
+        self._block: List[str] = []
+        self._first_block: Optional[str] = None
+        self._paragraph_found = False
+        self._department_pending = False
+        self._publication_level = 0
+        self._tokens: List[str] = []
+
+    def feed(self, line: str) -> None:
+        result = self.result
+
+        if line:
+            self._tokens += _tokenize(line)
+            if len(self._tokens) >= TOKEN_FLUSH_SIZE:
+                result.token_counts.update(self._tokens)
+                self._tokens = []
+        if not self._paragraph_found:
+            self._feed_block(line)
+
+        if line.startswith("#"):
+            if result.heading is None:
+                match = HEADING_RE.match(line)
+                if match:
+                    result.heading = match.group("title").strip()
+            self._feed_section(line)
+        elif self._publication_level and len(result.publications) < MAX_PUBLICATIONS:
+            item = LIST_ITEM_RE.match(line)
+            if item:
+                result.publications.append(item.group("item"))
+
+        if result.department is None:
+            self._feed_department(line)
+        if result.email is None and "@" in line:
+            match = EMAIL_RE.search(line)
+            if match:
+                result.email = match.group(0)
+        if result.title is None and line:
+            candidate = line.strip(LINE_DECORATION_CHARS)
+            if candidate and TITLE_RE.match(candidate):
+                result.title = candidate
+
+    def _feed_block(self, line: str) -> None:
+        # Blank lines delimit blocks exactly like ``markdown.split("\n\n")``.
+        if line:
+            self._block.append(line)
+            return
+        self._close_block()
+
+    def _close_block(self) -> None:
+        block = "\n".join(self._block).strip()
+        self._block = []
+        if self._first_block is None:
+            self._first_block = block
+        if len(block) >= MIN_PARAGRAPH_LENGTH:
+            self.result.paragraph = block.replace("\n", " ")
+            self._paragraph_found = True
+
+    def _feed_section(self, line: str) -> None:
+        match = SECTION_RE.match(line)
+        if not match:
+            return
+        level = len(match.group("hashes"))
+        if self._publication_level and level <= self._publication_level:
+            self._publication_level = 0
+        if "publication" in match.group("text").lower():
+            self._publication_level = level
+
+    def _feed_department(self, line: str) -> None:
+        if self._department_pending:
+            # The label ended the previous line; the value is the next non-blank text.
+            if line.strip():
+                self.result.department = line.strip()
+                self._department_pending = False
+            return
+        match = DEPARTMENT_RE.search(line)
+        if match and match.group("value").strip():
+            self.result.department = match.group("value").strip()
+        elif DEPARTMENT_LABEL_AT_END_RE.search(line):
+            self._department_pending = True
+
+    def finish(self) -> MarkdownProfile:
+        if self._tokens:
+            self.result.token_counts.update(self._tokens)
+            self._tokens = []
+        if not self._paragraph_found and (self._block or self._first_block is None):
+            self._close_block()
+        if not self._paragraph_found and self._first_block:
+            self.result.paragraph = self._first_block
+        return self.result
+
+
+def extract_markdown_profile(markdown: str) -> MarkdownProfile:
+    """Run the single-pass extractor over a complete markdown document."""
+    extractor = MarkdownProfileExtractor()
+    if not markdown:
+        return extractor.result
+    for line in markdown.split("\n"):
+        extractor.feed(line)
+    return extractor.finish()
@@ -4,16 +4,20 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from ..config import Settings, get_settings
 from ..models.schemas import ProfileInput, ScoreRequest, ScoreResponse, ScoreResult
-from .embedding import embed_texts
+from .embedding import embed_query, embed_texts_array
+from .feature_store import profile_features
 from .scoring import (
     aggregate_scores,
     compute_compatibility_scores,
     compute_feasibility_scores,
+    detail_rows,
 )
 from .similarity import cosine_similarity_matrix
-from .text import extract_query_keywords, extract_tokens, merge_keywords
+from .text import extract_query_keywords
 from .llm import generate_score_summary
 
 
@@ -30,35 +34,21 @@ def _build_profile_text(profile: ProfileInput) -> str:
     return " ".join(parts)
 
 
-def _profile_tokens(profile: ProfileInput) -> List[str]:
-    tokens = list(profile.keywords)
-    tokens.extend(extract_tokens(profile.summary))
-    if profile.department:
-        tokens.extend(extract_tokens(profile.department))
-    return merge_keywords(tokens)
-
-
 def _prepare_embeddings(
     user_query: str,
     profiles: Sequence[ProfileInput],
     settings: Optional[Settings] = None,
-) -> Tuple[List[float], List[List[float]], str]:
+) -> Tuple[List[float], np.ndarray, str]:
     app_settings = settings or get_settings()
 
     profile_texts = [_build_profile_text(profile) for profile in profiles]
-    profile_embeddings, model_name = embed_texts(
+    profile_embeddings, model_name = embed_texts_array(
         profile_texts,
         normalize=True,
         settings=app_settings,
     )
 
-    query_embeddings, _ = embed_texts(
-        [user_query],
-        normalize=True,
-        settings=app_settings,
-    )
-
-    query_embedding = query_embeddings[0] if query_embeddings else []
+    query_embedding, _ = embed_query(user_query, settings=app_settings)
 
     return query_embedding, profile_embeddings, model_name
 
@@ -75,7 +65,7 @@ def score_profiles(
     app_settings = settings or get_settings()
 
     query_tokens = extract_query_keywords(payload.user_query)
-    profile_keyword_sets = [_profile_tokens(profile) for profile in profiles]
+    features = profile_features(profiles, app_settings)
 
     query_embedding, profile_embeddings, model_name = _prepare_embeddings(
         payload.user_query,
@@ -83,34 +73,38 @@ def score_profiles(
         settings=app_settings,
     )
 
-    if not query_embedding or not profile_embeddings:
-        semantic_scores = [0.0 for _ in profiles]
+    if not query_embedding or not len(profile_embeddings):
+        semantic_scores = np.zeros(len(profiles))
     else:
         similarity_matrix = cosine_similarity_matrix([query_embedding], profile_embeddings)
-        semantic_scores = similarity_matrix[0].tolist()
+        semantic_scores = similarity_matrix[0].astype(np.float64)
 
     compatibility_scores, compatibility_details = compute_compatibility_scores(
         query_tokens,
-        profiles,
-        profile_keyword_sets,
+        features,
     )
 
-    feasibility_scores, feasibility_details = compute_feasibility_scores(profiles)
+    feasibility_scores, feasibility_details = compute_feasibility_scores(features)
 
-    breakdowns, _ = aggregate_scores(
+    scores = aggregate_scores(
         semantic_scores,
         compatibility_scores,
         feasibility_scores,
     )
 
+    # Everything above is per-candidate arrays; models and rationale dicts are
+    # only built for the profiles returned.
+    selected = scores.ranked(payload.top_k)
+    summarize = bool(app_settings.claude_api_key)
     results: List[ScoreResult] = []
-    for profile, breakdown, comp_detail, feas_detail, semantic in zip(
-        profiles,
-        breakdowns,
-        compatibility_details,
-        feasibility_details,
-        semantic_scores,
+    for index, breakdown, comp_detail, feas_detail, semantic in zip(
+        selected.tolist(),
+        scores.breakdowns(selected),
+        detail_rows(compatibility_details, selected),
+        detail_rows(feasibility_details, selected),
+        semantic_scores[selected].tolist(),
     ):
+        profile = profiles[index]
         rationale: Dict[str, object] = {
             "semantic_score": semantic,
             "compatibility_details": comp_detail,
@@ -118,12 +112,16 @@ def score_profiles(
             "embedding_model": model_name,
         }
 
-        summary_text = generate_score_summary(
-            settings=app_settings,
-            user_query=payload.user_query,
-            profile=profile,
-            scores=breakdown,
-            rationale=rationale,
+        summary_text = (
+            generate_score_summary(
+                settings=app_settings,
+                user_query=payload.user_query,
+                profile=profile,
+                scores=breakdown,
+                rationale=rationale,
+            )
+            if summarize
+            else None
         )
         results.append(
             ScoreResult(
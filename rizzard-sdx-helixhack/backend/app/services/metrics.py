@@ -0,0 +1,74 @@
+"""Lightweight in-process metrics registry for the Rizzard AI microservice."""
+
+from __future__ import annotations
+
+import logging
+import os
+import resource
+import sys
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MetricsProvider = Callable[[], Dict[str, Any]]
+
+_providers: Dict[str, MetricsProvider] = {}
+_lock = threading.Lock()
+
+
+def register_metrics_provider(name: str, provider: MetricsProvider) -> None:
+    """Register a callable that returns a JSON-serialisable snapshot under ``name``."""
+    with _lock:
+        _providers[name] = provider
+
+
+def collect_metrics() -> Dict[str, Any]:
+    """Return the current snapshot from every registered provider."""
+    with _lock:
+        providers = dict(_providers)
+
+    snapshot: Dict[str, Any] = {}
+    for name, provider in providers.items():
+        try:
+            snapshot[name] = provider()
+        except Exception as exc:  # pragma: no cover - metrics must never break callers
+            logger.warning("Metrics provider %s failed: %s", name, exc)
+            snapshot[name] = {"error": str(exc)}
+    return snapshot
+
+
+def read_process_memory(pid: Optional[int] = None) -> Dict[str, Any]:
+    """Return resident memory figures for ``pid`` (default: this process), in bytes.
+
+    ``pss_bytes`` splits pages shared with other processes (e.g. model weights
+    inherited copy-on-write from a pre-fork parent) evenly between them, so
+    summing it over the workers gives the real footprint; ``rss_bytes`` counts
+    shared pages in full for every worker. PSS and USS need Linux
+    ``/proc/<pid>/smaps_rollup``; elsewhere only the peak RSS of this process
+    is reported.
+    """
+    target = pid or os.getpid()
+    snapshot: Dict[str, Any] = {"pid": target}
+    try:
+        with open(f"/proc/{target}/smaps_rollup", encoding="ascii") as handle:
+            fields = {}
+            for line in handle:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    except OSError:
+        if pid is None:
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ru_maxrss is bytes on macOS and kilobytes elsewhere.
+            snapshot["peak_rss_bytes"] = peak if sys.platform == "darwin" else peak * 1024
+        return snapshot
+
+    snapshot["rss_bytes"] = fields.get("Rss", 0)
+    snapshot["pss_bytes"] = fields.get("Pss", 0)
+    snapshot["uss_bytes"] = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    snapshot["shared_bytes"] = fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0)
+    return snapshot
+
+
+register_metrics_provider("process", read_process_memory)
@@ -0,0 +1,149 @@
+"""Split a professor profile into the chunks behind multi-vector search.
+
+One summary vector blurs a long profile: a professor who lists five research
+areas matches each of them only weakly. Embedding the profile as several
+chunks (the summary, each substantial page section, windows of publication
+titles) lets a query match the one part of the profile it is about;
+:mod:`.chunk_search` then aggregates chunk hits per professor.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .markdown_extract import LINE_DECORATION_CHARS, MIN_PARAGRAPH_LENGTH, SECTION_RE
+
+SUMMARY_KIND = "summary"
+SECTION_KIND = "section"
+PUBLICATIONS_KIND = "publications"
+
+PUBLICATION_WINDOW = 5
+DEFAULT_MAX_CHARS = 800
+DEFAULT_MAX_CHUNKS = 24
+
+# Lines that are only links or images (navigation, social icons, footers).
+LINK_ONLY_RE = re.compile(r"^\s*(?:[-*+]\s*)?(?:!?\[[^\]]*\]\([^)]*\)\s*)+$")
+
+
+@dataclass(frozen=True)
+class ProfileChunk:
+    """A piece of profile text that gets its own vector."""
+
+    kind: str
+    position: int
+    text: str
+
+
+def chunk_profile(
+    *,
+    name: str = "",
+    summary: str = "",
+    markdown: str = "",
+    publications: Sequence[str] = (),
+    max_chars: int = DEFAULT_MAX_CHARS,
+    max_chunks: int = DEFAULT_MAX_CHUNKS,
+) -> List[ProfileChunk]:
+    """Return the summary, section and publication chunks of one profile.
+
+    Sections are packed paragraph by paragraph up to ``max_chars`` and
+    prefixed with their heading; publication sections are skipped because the
+    extracted ``publications`` are chunked on their own. Duplicate texts are
+    dropped and at most ``max_chunks`` chunks are returned, summary first.
+    """
+    chunks: List[ProfileChunk] = []
+    seen: set[str] = set()
+
+    def add(kind: str, text: str) -> bool:
+        text = text.strip()
+        if not text or text in seen:
+            return len(chunks) < max_chunks
+        seen.add(text)
+        chunks.append(ProfileChunk(kind=kind, position=len(chunks), text=text))
+        return len(chunks) < max_chunks
+
+    if max_chunks <= 0:
+        return chunks
+    lead = summary or name
+    if lead and not add(SUMMARY_KIND, lead):
+        return chunks
+    for heading, paragraphs in _sections(markdown):
+        for text in _pack(paragraphs, heading, max_chars):
+            if not add(SECTION_KIND, text):
+                return chunks
+    titles = [title.strip() for title in publications if title and title.strip()]
+    for start in range(0, len(titles), PUBLICATION_WINDOW):
+        window = "; ".join(titles[start : start + PUBLICATION_WINDOW])
+        if not add(PUBLICATIONS_KIND, f"Publications: {window}"):
+            return chunks
+    return chunks
+
+
+def _sections(markdown: str) -> Iterator[Tuple[str, List[str]]]:
+    """Yield ``(heading, paragraphs)`` for each non-publication section."""
+    if not markdown:
+        return
+    heading = ""
+    skip_level = 0
+    paragraphs: List[str] = []
+    block: List[str] = []
+
+    def close_block() -> None:
+        text = " ".join(block).strip()
+        block.clear()
+        if len(text) >= MIN_PARAGRAPH_LENGTH:
+            paragraphs.append(text)
+
+    for line in markdown.split("\n"):
+        match = SECTION_RE.match(line)
+        if match:
+            close_block()
+            if paragraphs:
+                yield heading, list(paragraphs)
+                paragraphs.clear()
+            level = len(match.group("hashes"))
+            if skip_level and level > skip_level:
+                continue
+            text = match.group("text").strip(LINE_DECORATION_CHARS)
+            skip_level = level if "publication" in text.lower() else 0
+            heading = text
+            continue
+        if skip_level:
+            continue
+        if not line.strip():
+            close_block()
+        elif not LINK_ONLY_RE.match(line):
+            block.append(line.strip(LINE_DECORATION_CHARS))
+    close_block()
+    if paragraphs:
+        yield heading, paragraphs
+
+
+def _pack(paragraphs: Iterable[str], heading: str, max_chars: int) -> Iterator[str]:
+    """Join paragraphs into texts of at most ``max_chars`` (long paragraphs are cut
+    at word boundaries), each prefixed with the section heading."""
+    prefix = f"{heading}: " if heading else ""
+    budget = max(1, max_chars - len(prefix))
+    current: Optional[str] = None
+    for paragraph in paragraphs:
+        for piece in _split_words(paragraph, budget):
+            if current is not None and len(current) + 1 + len(piece) <= budget:
+                current = f"{current} {piece}"
+                continue
+            if current is not None:
+                yield prefix + current
+            current = piece
+    if current is not None:
+        yield prefix + current
+
+
+def _split_words(text: str, budget: int) -> Iterator[str]:
+    while len(text) > budget:
+        cut = text.rfind(" ", 0, budget + 1)
+        if cut <= 0:
+            cut = budget
+        yield text[:cut].rstrip()
+        text = text[cut:].lstrip()
+    if text:
+        yield text
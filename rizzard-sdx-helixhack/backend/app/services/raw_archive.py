@@ -0,0 +1,238 @@
+"""Append-only compressed archive of raw scrape payloads.
+
+Each payload is written as an independently compressed frame (a gzip member
+or, when ``zstandard`` is installed, a zstd frame) appended to the current
+segment file. A JSON-lines index records the segment, byte offset and length
+of every frame so single payloads can be read back without decompressing the
+whole segment, and so replays can fan segments out across workers.
+
+Appends hold an exclusive ``flock`` on the directory's lock file (where the
+platform has ``fcntl``), so several processes (pre-fork API workers, the
+scrape CLI) can share one archive without recording offsets that do not
+match the bytes written.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:  # pragma: no cover - POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover - appends are then only serialised per process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.jsonl"
+LOCK_FILENAME = ".lock"
+SEGMENT_PREFIX = "segment-"
+CODEC_GZIP = "gzip"
+CODEC_ZSTD = "zstd"
+CODEC_EXTENSIONS = {CODEC_GZIP: ".jsonl.gz", CODEC_ZSTD: ".jsonl.zst"}
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+@dataclass
+class ArchiveEntry:
+    """Index record locating one archived payload."""
+
+    url: str
+    segment: str
+    offset: int
+    length: int
+    codec: str
+    archived_at: float
+
+
+def _resolve_codec(codec: Optional[str]) -> str:
+    if codec in (None, "", "auto"):
+        return CODEC_ZSTD if zstandard is not None else CODEC_GZIP
+    if codec == CODEC_ZSTD and zstandard is None:
+        raise RuntimeError("zstandard is not installed; use the gzip codec or pip install zstandard")
+    if codec not in CODEC_EXTENSIONS:
+        raise ValueError(f"Unknown archive codec {codec!r}")
+    return codec
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd archive segments")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class RawPayloadArchive:
+    """Writer and reader for a directory of archive segments, safe across threads and processes."""
+
+    def __init__(
+        self,
+        directory: os.PathLike | str,
+        *,
+        codec: Optional[str] = None,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.codec = _resolve_codec(codec)
+        self.segment_bytes = max(1, segment_bytes)
+        self._lock = threading.Lock()
+        self._segment: Optional[Path] = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / INDEX_FILENAME
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Serialise appends within this process and, with ``fcntl``, across processes."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if fcntl is None:
+                yield
+                return
+            with (self.directory / LOCK_FILENAME).open("a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _current_segment(self, incoming: int) -> Path:
+        if self._segment is None:
+            existing = sorted(self.directory.glob(f"{SEGMENT_PREFIX}*{CODEC_EXTENSIONS[self.codec]}"))
+            self._segment = existing[-1] if existing else None
+        if self._segment is None or (
+            self._segment.exists()
+            and self._segment.stat().st_size + incoming > self.segment_bytes
+        ):
+            number = len(list(self.directory.glob(f"{SEGMENT_PREFIX}*")))
+            name = f"{SEGMENT_PREFIX}{number + 1:06d}{CODEC_EXTENSIONS[self.codec]}"
+            self._segment = self.directory / name
+        return self._segment
+
+    def append(self, payload: Dict[str, Any]) -> ArchiveEntry:
+        """Compress and append ``payload``, returning its index entry."""
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        frame = _compress(self.codec, data)
+        with self._locked():
+            if fcntl is not None:
+                # Another process may have started a newer segment since our last append.
+                self._segment = None
+            segment = self._current_segment(len(frame))
+            with segment.open("ab") as handle:
+                offset = handle.seek(0, os.SEEK_END)
+                handle.write(frame)
+            entry = ArchiveEntry(
+                url=payload.get("url", ""),
+                segment=segment.name,
+                offset=offset,
+                length=len(frame),
+                codec=self.codec,
+                archived_at=time.time(),
+            )
+            with self.index_path.open("a", encoding="utf-8") as index:
+                index.write(json.dumps(asdict(entry), separators=(",", ":")) + "\n")
+        return entry
+
+    def append_many(self, payloads: Iterable[Dict[str, Any]]) -> List[ArchiveEntry]:
+        """Archive successful payloads, skipping error placeholders."""
+        entries: List[ArchiveEntry] = []
+        for payload in payloads:
+            if not isinstance(payload, dict) or payload.get("error"):
+                continue
+            try:
+                entries.append(self.append(payload))
+            except Exception as exc:
+                logger.warning("Failed to archive payload for %s: %s", payload.get("url"), exc)
+        return entries
+
+    def entries(self, *, latest_only: bool = True) -> List[ArchiveEntry]:
+        """Return index entries, keeping only the newest capture per URL by default."""
+        if not self.index_path.exists():
+            return []
+        entries: List[ArchiveEntry] = []
+        with self.index_path.open("r", encoding="utf-8") as index:
+            for line_number, line in enumerate(index, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(ArchiveEntry(**json.loads(line)))
+                except (TypeError, ValueError) as exc:
+                    # A crash mid-write can leave a torn final line; skip it.
+                    logger.warning("Skipping bad archive index line %s: %s", line_number, exc)
+        if not latest_only:
+            return entries
+        latest: Dict[str, ArchiveEntry] = {}
+        for entry in entries:
+            latest[entry.url] = entry
+        return list(latest.values())
+
+    def read(self, entry: ArchiveEntry) -> Dict[str, Any]:
+        """Load the payload an index entry points at."""
+        with (self.directory / entry.segment).open("rb") as handle:
+            handle.seek(entry.offset)
+            frame = handle.read(entry.length)
+        return json.loads(_decompress(entry.codec, frame))
+
+    def iter_payloads(self, entries: Iterable[ArchiveEntry]) -> Iterator[Dict[str, Any]]:
+        """Yield payloads for ``entries``, reading each segment sequentially."""
+        ordered = sorted(entries, key=lambda item: (item.segment, item.offset))
+        handle = None
+        current = None
+        try:
+            for entry in ordered:
+                if entry.segment != current:
+                    if handle is not None:
+                        handle.close()
+                    handle = (self.directory / entry.segment).open("rb")
+                    current = entry.segment
+                handle.seek(entry.offset)
+                yield json.loads(_decompress(entry.codec, handle.read(entry.length)))
+        finally:
+            if handle is not None:
+                handle.close()
+
+
+_archives: Dict[str, RawPayloadArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_raw_archive(settings: Any) -> Optional[RawPayloadArchive]:
+    """Return the shared archive for ``settings.raw_archive_dir`` (None when disabled)."""
+    directory = getattr(settings, "raw_archive_dir", None)
+    if not directory:
+        return None
+    key = str(Path(directory).resolve())
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is None:
+            archive = RawPayloadArchive(
+                directory,
+                codec=settings.raw_archive_codec,
+                segment_bytes=settings.raw_archive_segment_bytes,
+            )
+            _archives[key] = archive
+        return archive
@@ -0,0 +1,321 @@
+"""Retry budgets, jittered backoff, and circuit breakers for outbound dependencies."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from ..config import Settings, get_settings
+from .metrics import register_metrics_provider
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class TransientDependencyError(RuntimeError):
+    """A dependency failure that is safe to retry (timeouts, 429s, 5xx responses)."""
+
+    def __init__(self, message: str, *, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the dependency while its circuit breaker is open."""
+
+    def __init__(self, dependency: str, retry_in: float) -> None:
+        super().__init__(
+            f"Circuit for {dependency} is open; failing fast (retry in {retry_in:.1f}s)"
+        )
+        self.dependency = dependency
+        self.retry_in = retry_in
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given either as seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter, capped at ``max_delay``."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Return the delay before retry number ``attempt`` (1-based), or None to give up.
+
+        A server-provided ``Retry-After`` is honoured as a lower bound; if it asks
+        us to wait longer than ``max_delay`` we stop retrying instead of blocking.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0.0, ceiling)
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of first attempts.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws one,
+    so during an outage retries stop amplifying load once the bucket drains.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, min_tokens: float = 10.0) -> None:
+        self.ratio = ratio
+        self.max_tokens = min_tokens
+        self._tokens = min_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = STATE_HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise :class:`CircuitOpenError` unless a call may proceed."""
+        with self._lock:
+            state = self._current_state()
+            if state == STATE_CLOSED:
+                return
+            if state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                logger.info("Circuit for %s closed after successful probe", self.name)
+            self._state = STATE_CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if (
+                self._state == STATE_HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+            ):
+                if self._state != STATE_OPEN:
+                    logger.warning(
+                        "Circuit for %s opened after %s consecutive failures",
+                        self.name,
+                        self._consecutive_failures,
+                    )
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Free the half-open slot when a probe ended in a non-transient error."""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+class DependencyGuard:
+    """Bundle of retry policy, retry budget, and breaker for one dependency."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        policy: RetryPolicy,
+        budget: RetryBudget,
+        breaker: CircuitBreaker,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.name = name
+        self.policy = policy
+        self.budget = budget
+        self.breaker = breaker
+        self._sleep = sleep
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "calls": 0,
+            "successes": 0,
+            "failures": 0,
+            "retries": 0,
+            "retries_denied": 0,
+            "short_circuited": 0,
+        }
+
+    def _bump(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def call(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        retry: bool = True,
+        is_transient: Optional[Callable[[BaseException], bool]] = None,
+        **kwargs: Any,
+    ) -> T:
+        """Invoke ``fn`` under the breaker, retrying transient failures.
+
+        ``is_transient`` decides which exceptions count as the dependency being
+        unhealthy; anything else is re-raised immediately without tripping the
+        breaker. Pass ``retry=False`` for non-idempotent calls.
+        """
+        classify = is_transient or _default_is_transient
+        self._bump("calls")
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                self._bump("short_circuited")
+                raise
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                if not classify(exc):
+                    self.breaker.release_probe()
+                    raise
+                self.breaker.record_failure()
+                self._bump("failures")
+                if not retry or attempt >= self.policy.max_attempts:
+                    raise
+                delay = self.policy.backoff(attempt, getattr(exc, "retry_after", None))
+                if delay is None:
+                    raise
+                if not self.budget.try_withdraw():
+                    self._bump("retries_denied")
+                    raise
+                self._bump("retries")
+                logger.info(
+                    "Retrying %s call in %.2fs (attempt %s/%s): %s",
+                    self.name,
+                    delay,
+                    attempt + 1,
+                    self.policy.max_attempts,
+                    exc,
+                )
+                self._sleep(delay)
+                continue
+            self.breaker.record_success()
+            self._bump("successes")
+            return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["state"] = self.breaker.state
+        stats["retry_budget_tokens"] = round(self.budget.tokens, 2)
+        return stats
+
+
+def _default_is_transient(exc: BaseException) -> bool:
+    return isinstance(exc, (TransientDependencyError, ConnectionError, TimeoutError))
+
+
+_guards: Dict[str, DependencyGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_dependency_guard(name: str, settings: Optional[Settings] = None) -> DependencyGuard:
+    """Return the process-wide guard for ``name``, creating it from settings."""
+    with _guards_lock:
+        guard = _guards.get(name)
+        if guard is None:
+            app_settings = settings or get_settings()
+            guard = DependencyGuard(
+                name,
+                policy=RetryPolicy(
+                    max_attempts=app_settings.resilience_max_attempts,
+                    base_delay=app_settings.resilience_base_delay_seconds,
+                    max_delay=app_settings.resilience_max_delay_seconds,
+                ),
+                budget=RetryBudget(ratio=app_settings.resilience_retry_budget_ratio),
+                breaker=CircuitBreaker(
+                    name,
+                    failure_threshold=app_settings.circuit_failure_threshold,
+                    reset_timeout=app_settings.circuit_reset_timeout_seconds,
+                ),
+            )
+            _guards[name] = guard
+        return guard
+
+
+def resilience_snapshot() -> Dict[str, Any]:
+    with _guards_lock:
+        guards = list(_guards.values())
+    return {guard.name: guard.snapshot() for guard in guards}
+
+
+register_metrics_provider("dependencies", resilience_snapshot)
@@ -2,131 +2,134 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Sequence, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 import numpy as np
 
-from ..models.schemas import ProfileInput, ScoreBreakdown
+from ..models.schemas import ScoreBreakdown
+from .feature_store import ProfileFeatures
+from .vectors import VectorLike
 
 SEMANTIC_WEIGHT = 0.6
 COMPATIBILITY_WEIGHT = 0.2
 FEASIBILITY_WEIGHT = 0.2
+DEPARTMENT_BONUS = 0.1
+
+
+def normalize_scores(scores: VectorLike) -> np.ndarray:
+    """Min-max scale ``scores`` to [0, 1]; all zeros when they (nearly) coincide."""
+    values = np.asarray(scores, dtype=np.float64)
+    if values.size == 0:
+        return values
+    # The bounds are taken at float32 precision, as the list version did.
+    bounds = values.astype(np.float32)
+    min_val = float(bounds.min())
+    max_val = float(bounds.max())
+    if max_val - min_val < 1e-6:
+        return np.zeros_like(values)
+    return (values - min_val) / (max_val - min_val)
 
 
-def keyword_overlap_score(query_tokens: Iterable[str], profile_tokens: Iterable[str]) -> float:
-    """Compute keyword overlap ratio between query and profile tokens."""
-    query_set = {token.lower() for token in query_tokens if token}
-    profile_set = {token.lower() for token in profile_tokens if token}
-
-    if not query_set or not profile_set:
-        return 0.0
-
-    overlap = query_set.intersection(profile_set)
-    return len(overlap) / len(query_set)
-
-
-def department_diversity_bonus(profile: ProfileInput, seen_departments: set[str]) -> float:
-    """Reward profiles from new departments to encourage diversity."""
-    department = (profile.department or "").strip().lower()
-    if not department:
-        return 0.0
-
-    return 0.1 if department not in seen_departments else 0.0
-
-
-def normalize_scores(scores: List[float]) -> List[float]:
-    arr = np.asarray(scores, dtype=np.float32)
-    if arr.size == 0:
-        return []
-    min_val = float(np.min(arr))
-    max_val = float(np.max(arr))
-    if max_val - min_val < 1e-6:
-        return [0.0 for _ in scores]
-    return [float((s - min_val) / (max_val - min_val)) for s in scores]
+def detail_rows(details: Mapping[str, np.ndarray], indices: np.ndarray) -> List[dict]:
+    """Per-candidate rationale dicts (Python scalars) for the candidates at ``indices``."""
+    columns = {key: column[indices].tolist() for key, column in details.items()}
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
 
 
 def compute_compatibility_scores(
     query_tokens: Iterable[str],
-    profiles: Sequence[ProfileInput],
-    profile_keywords: Sequence[Sequence[str]],
-) -> Tuple[List[float], List[dict]]:
-    raw_scores: List[float] = []
-    details: List[dict] = []
-    seen_departments: set[str] = set()
-
-    for profile, keywords in zip(profiles, profile_keywords):
-        keyword_score = keyword_overlap_score(query_tokens, keywords)
-        diversity_bonus = department_diversity_bonus(profile, seen_departments)
-        seniority_bonus = 0.0
-        if profile.title:
-            lowered_title = profile.title.lower()
-            if "assistant" in lowered_title or "associate" in lowered_title:
-                seniority_bonus = 0.05
-
-        total_score = keyword_score + diversity_bonus + seniority_bonus
-        raw_scores.append(total_score)
-        details.append(
-            {
-                "keyword_overlap": keyword_score,
-                "department_bonus": diversity_bonus,
-                "seniority_bonus": seniority_bonus,
-                "raw_score": total_score,
-            }
-        )
-
-        if profile.department:
-            seen_departments.add(profile.department.strip().lower())
-
+    features: ProfileFeatures,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Keyword overlap plus department-diversity and seniority bonuses, min-max normalised.
+
+    The first candidate of each department (in list order) gets the diversity
+    bonus, which encourages diverse result lists. Details are returned as
+    columns; see :func:`detail_rows`.
+    """
+    keyword_scores = features.token_overlap(query_tokens)
+    diversity_bonuses = np.where(features.department_first_seen(), DEPARTMENT_BONUS, 0.0)
+    raw_scores = keyword_scores + diversity_bonuses + features.seniority
     normalized = normalize_scores(raw_scores)
-    for detail, norm in zip(details, normalized):
-        detail["normalized_score"] = norm
+    details = {
+        "keyword_overlap": keyword_scores,
+        "department_bonus": diversity_bonuses,
+        "seniority_bonus": features.seniority,
+        "raw_score": raw_scores,
+        "normalized_score": normalized,
+    }
+    return normalized, details
+
 
+def compute_feasibility_scores(
+    features: ProfileFeatures,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Activity-signal recency (0.5 without signals), min-max normalised."""
+    normalized = normalize_scores(features.recency)
+    details = {
+        "has_activity_signals": features.has_signals,
+        "raw_score": features.recency,
+        "normalized_score": normalized,
+    }
     return normalized, details
 
 
-def compute_feasibility_scores(profiles: Sequence[ProfileInput]) -> Tuple[List[float], List[dict]]:
-    raw_scores: List[float] = []
-    details: List[dict] = []
-    for profile in profiles:
-        signals = profile.activity_signals
-        score = signals.recency_score() if signals else 0.5
-        raw_scores.append(score)
-        details.append(
-            {
-                "has_activity_signals": bool(signals),
-                "raw_score": score,
-            }
-        )
+@dataclass(frozen=True)
+class AggregatedScores:
+    """Clamped score components and final scores, one entry per candidate."""
 
-    normalized = normalize_scores(raw_scores)
-    for detail, norm in zip(details, normalized):
-        detail["normalized_score"] = norm
+    semantic: np.ndarray
+    compatibility: np.ndarray
+    feasibility: np.ndarray
+    final: np.ndarray
 
-    return normalized, details
+    def __len__(self) -> int:
+        return len(self.final)
 
+    def ranked(self, top_k: Optional[int] = None) -> np.ndarray:
+        """Indices of the ``top_k`` best final scores, best first (ties keep input order).
 
-def aggregate_scores(
-    semantic: List[float],
-    compatibility: List[float],
-    feasibility: List[float],
-) -> Tuple[List[ScoreBreakdown], List[float]]:
-    breakdowns: List[ScoreBreakdown] = []
-    final_scores: List[float] = []
-
-    for s, c, f in zip(semantic, compatibility, feasibility):
-        final = (
-            SEMANTIC_WEIGHT * s
-            + COMPATIBILITY_WEIGHT * c
-            + FEASIBILITY_WEIGHT * f
-        )
-        breakdowns.append(
+        Without ``top_k`` every candidate is returned, in input order.
+        """
+        if top_k is None:
+            return np.arange(len(self))
+        return np.argsort(-self.final, kind="stable")[:top_k]
+
+    def breakdowns(self, indices: np.ndarray) -> List[ScoreBreakdown]:
+        """``ScoreBreakdown`` models for the candidates at ``indices`` only."""
+        return [
             ScoreBreakdown(
-                semantic=max(0.0, min(1.0, s)),
-                compatibility=max(0.0, min(1.0, c)),
-                feasibility=max(0.0, min(1.0, f)),
-                final_score=max(0.0, min(1.0, final)),
+                semantic=semantic,
+                compatibility=compatibility,
+                feasibility=feasibility,
+                final_score=final,
+            )
+            for semantic, compatibility, feasibility, final in zip(
+                self.semantic[indices].tolist(),
+                self.compatibility[indices].tolist(),
+                self.feasibility[indices].tolist(),
+                self.final[indices].tolist(),
             )
-        )
-        final_scores.append(max(0.0, min(1.0, final)))
+        ]
 
-    return breakdowns, final_scores
+
+def aggregate_scores(
+    semantic: VectorLike,
+    compatibility: VectorLike,
+    feasibility: VectorLike,
+) -> AggregatedScores:
+    """Weight the components into final scores; everything is clamped to [0, 1]."""
+    semantic = np.asarray(semantic, dtype=np.float64)
+    compatibility = np.asarray(compatibility, dtype=np.float64)
+    feasibility = np.asarray(feasibility, dtype=np.float64)
+    final = (
+        SEMANTIC_WEIGHT * semantic
+        + COMPATIBILITY_WEIGHT * compatibility
+        + FEASIBILITY_WEIGHT * feasibility
+    )
+    return AggregatedScores(
+        semantic=np.clip(semantic, 0.0, 1.0),
+        compatibility=np.clip(compatibility, 0.0, 1.0),
+        feasibility=np.clip(feasibility, 0.0, 1.0),
+        final=np.clip(final, 0.0, 1.0),
+    )
@@ -5,16 +5,22 @@ from __future__ import annotations
 import logging
 import uuid
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from ..config import Settings, get_settings
-from ..models.schemas import ProfileInput
-from .embedding import embed_texts
-from .firecrawl_service import FirecrawlService, ScrapedProfessor
+from ..models.schemas import ProfileActivitySignals, ProfileInput
+from .embedding import embed_texts, embed_texts_array
+from .firecrawl_service import FirecrawlService, ScrapedProfessor, extract_professor
 from .helixdb_service import HelixDBService
+from .profile_chunks import ProfileChunk, chunk_profile
+from .raw_archive import RawPayloadArchive, get_raw_archive
+from .scraper_backends import ScraperRouter
+from .urls import canonicalize_url, dedupe_urls, remember_redirect
 
 logger = logging.getLogger(__name__)
 
+RECENT_PUBLICATION_LIMIT = 10
+
 
 @dataclass
 class ScrapeResult:
@@ -64,7 +70,7 @@ class ScrapeSummary:
 
 
 class ScrapeOrchestrator:
-    """Coordinate Firecrawl scraping, embedding, and HelixDB persistence."""
+    """Coordinate scraping, embedding, and HelixDB persistence."""
 
     def __init__(
         self,
@@ -72,10 +78,16 @@ class ScrapeOrchestrator:
         settings: Optional[Settings] = None,
         firecrawl_service: Optional[FirecrawlService] = None,
         helix_service: Optional[HelixDBService] = None,
+        scraper: Optional[ScraperRouter] = None,
+        archive: Optional[RawPayloadArchive] = None,
     ) -> None:
         self.settings = settings or get_settings()
-        self.firecrawl = firecrawl_service or FirecrawlService(settings=self.settings)
+        self.scraper = scraper or ScraperRouter(
+            settings=self.settings,
+            firecrawl_service=firecrawl_service,
+        )
         self.helix = helix_service or HelixDBService(settings=self.settings)
+        self.archive = archive or get_raw_archive(self.settings)
 
     def run(
         self,
@@ -83,6 +95,9 @@ class ScrapeOrchestrator:
         *,
         initialize_schema: bool = False,
     ) -> ScrapeSummary:
+        # Scheme/slash/tracking variants are fetched once, under the URL as given;
+        # insert_professor looks that URL up before storing the canonical form.
+        urls = dedupe_urls(urls, force_https=self.settings.url_force_https)
         if not urls:
             return ScrapeSummary(results=[])
 
@@ -93,10 +108,21 @@ class ScrapeOrchestrator:
                 logger.error("Helix schema initialization failed: %s", exc)
                 raise
 
-        raw_payloads = self.firecrawl.scrape_batch(urls)
+        raw_payloads = self.scraper.scrape_batch(urls)
+        if self.archive is not None:
+            self.archive.append_many(raw_payloads)
+
+        return self.process_payloads(raw_payloads)
+
+    def process_payloads(self, raw_payloads: Iterable[Dict[str, Any]]) -> ScrapeSummary:
+        """Extract, embed, and persist already-scraped payloads.
+
+        Used by :meth:`run` after scraping and by the archive replay script.
+        """
 
         structured: List[ScrapedProfessor] = []
         results: List[ScrapeResult] = []
+        seen_urls: set[str] = set()
         for payload in raw_payloads:
             url = payload.get("url", "") if isinstance(payload, dict) else ""
             error = payload.get("error") if isinstance(payload, dict) else None
@@ -105,8 +131,22 @@ class ScrapeOrchestrator:
                     ScrapeResult(url=url or "unknown", success=False, error=error)
                 )
                 continue
+            requested = url
+            url = self._resolve_redirect(payload)
+            key = canonicalize_url(url, force_https=self.settings.url_force_https)
+            if key in seen_urls:
+                logger.info("Skipping %s: redirected to a page already in this batch", url)
+                results.append(
+                    ScrapeResult(
+                        url=requested or url,
+                        success=False,
+                        error=f"duplicate of {url} after redirect",
+                    )
+                )
+                continue
+            seen_urls.add(key)
             try:
-                structured.append(self.firecrawl.extract_professor(payload))
+                structured.append(extract_professor(payload))
             except Exception as exc:
                 logger.error("Failed to normalize scraped payload for %s: %s", url, exc)
                 results.append(
@@ -125,19 +165,25 @@ class ScrapeOrchestrator:
                 len(structured),
             )
 
+        stored: List[ScrapedProfessor] = []
         for idx, record in enumerate(structured):
             embedding = embeddings[idx] if idx < len(embeddings) else []
             # Generate a profile_id if not present
             profile_id = record.url or str(uuid.uuid4())
+            activity_signals = (
+                {"recent_publications": record.publications[:RECENT_PUBLICATION_LIMIT]}
+                if record.publications
+                else None
+            )
             profile_payload = {
                 "profile_id": profile_id,
                 "name": record.name,
-                "title": getattr(record, "title", None) or "",
+                "title": record.title or "",
                 "department": record.department or "",
                 "profile_url": record.url,
                 "summary": record.summary or "",
                 "keywords": record.keywords or [],
-                "activity_signals": None,  # Can be populated later from external sources
+                "activity_signals": activity_signals,
                 "rerank_strategy": "hybrid",
             }
             try:
@@ -147,11 +193,15 @@ class ScrapeOrchestrator:
                 profile = ProfileInput(
                     profile_id=helix_id or profile_id,
                     name=record.name,
-                    title=getattr(record, "title", None),
+                    title=record.title,
                     department=record.department,
                     summary=record.summary,
                     keywords=record.keywords,
-                    activity_signals=None,
+                    activity_signals=(
+                        ProfileActivitySignals(**activity_signals)
+                        if activity_signals
+                        else None
+                    ),
                 )
                 results.append(
                     ScrapeResult(
@@ -163,10 +213,66 @@ class ScrapeOrchestrator:
                         created=created,
                     )
                 )
+                stored.append(record)
             except Exception as exc:
                 logger.error("Helix insertion failed for %s: %s", record.url, exc)
                 results.append(
                     ScrapeResult(url=record.url, success=False, error=str(exc))
                 )
 
+        if self.settings.profile_chunking and stored:
+            self._store_chunks(stored)
         return ScrapeSummary(results=results)
+
+    def _store_chunks(self, records: Sequence[ScrapedProfessor]) -> None:
+        """Replace the chunk vectors of freshly stored profiles.
+
+        All chunks of the batch are embedded in one call. Failures are logged
+        and leave the profile searchable through its summary vector.
+        """
+
+        chunked: List[tuple[str, List[ProfileChunk]]] = []
+        for record in records:
+            chunks = chunk_profile(
+                name=record.name,
+                summary=record.summary,
+                markdown=record.markdown,
+                publications=record.publications,
+                max_chars=self.settings.profile_chunk_chars,
+                max_chunks=self.settings.profile_max_chunks,
+            )
+            if chunks:
+                chunked.append((record.url, chunks))
+        if not chunked:
+            return
+        try:
+            vectors, _ = embed_texts_array(
+                [chunk.text for _, chunks in chunked for chunk in chunks],
+                settings=self.settings,
+            )
+        except Exception as exc:
+            logger.error("Embedding profile chunks failed: %s", exc)
+            return
+        offset = 0
+        for url, chunks in chunked:
+            rows = vectors[offset : offset + len(chunks)]
+            offset += len(chunks)
+            try:
+                self.helix.replace_professor_chunks(url, chunks, rows)
+            except Exception as exc:
+                logger.error("Storing profile chunks failed for %s: %s", url, exc)
+
+    def _resolve_redirect(self, payload: dict) -> str:
+        """Point ``payload["url"]`` at the canonical final URL after redirects."""
+
+        requested = payload.get("url", "")
+        metadata = payload.get("metadata") or {}
+        final = metadata.get("url") if isinstance(metadata, dict) else None
+        if final and requested:
+            target = remember_redirect(
+                requested, final, force_https=self.settings.url_force_https
+            )
+            if target:
+                logger.info("Scraped %s redirected to %s", requested, target)
+                payload["url"] = target
+        return payload.get("url", "")
@@ -0,0 +1,190 @@
+"""Pluggable scraping backends and per-domain routing between them."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Protocol
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import Settings, get_settings
+from .firecrawl_service import FirecrawlService
+from .html_markdown import html_to_markdown
+from .resilience import TransientDependencyError, get_dependency_guard, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+BACKEND_FIRECRAWL = "firecrawl"
+BACKEND_DIRECT = "direct"
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+
+class ScraperBackend(Protocol):
+    """Anything that turns a URL into a Firecrawl-shaped payload.
+
+    Payloads carry ``url``, ``markdown`` and ``metadata`` keys so that
+    :func:`firecrawl_service.extract_professor` can consume them unchanged.
+    """
+
+    name: str
+
+    def scrape_url(self, url: str) -> Dict[str, Any]:
+        ...
+
+
+class DirectFetchBackend:
+    """Fetch pages straight from the origin and convert the HTML locally."""
+
+    name = BACKEND_DIRECT
+    RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        *,
+        settings: Optional[Settings] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        self.settings = settings or get_settings()
+        self._session = session or self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.settings.direct_fetch_pool_size,
+            pool_maxsize=self.settings.direct_fetch_pool_size,
+            max_retries=0,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = self.settings.direct_fetch_user_agent
+        session.headers["Accept"] = "text/html,application/xhtml+xml;q=0.9,*/*;q=0.1"
+        return session
+
+    def scrape_url(self, url: str) -> Dict[str, Any]:
+        if not url:
+            raise ValueError("URL must be provided for scraping")
+        host = urlsplit(url).hostname or "unknown"
+        guard = get_dependency_guard(f"direct:{host}", self.settings)
+        return guard.call(self._fetch, url)
+
+    def _fetch(self, url: str) -> Dict[str, Any]:
+        timeout = (
+            self.settings.direct_fetch_connect_timeout_seconds,
+            self.settings.direct_fetch_read_timeout_seconds,
+        )
+        try:
+            response = self._session.get(url, timeout=timeout, allow_redirects=True)
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            raise TransientDependencyError(f"Direct fetch failed for {url}: {exc}") from exc
+        except requests.RequestException as exc:
+            raise RuntimeError(f"Direct fetch failed for {url}: {exc}") from exc
+
+        if response.status_code in self.RETRYABLE_STATUS_CODES:
+            raise TransientDependencyError(
+                f"Direct fetch returned HTTP {response.status_code} for {url}",
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+        if response.status_code >= 400:
+            raise RuntimeError(f"Direct fetch returned HTTP {response.status_code} for {url}")
+
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            raise RuntimeError(f"Unsupported content type {content_type!r} for {url}")
+
+        page = html_to_markdown(response.text, url=response.url or url)
+        page.metadata["statusCode"] = response.status_code
+        page.metadata["url"] = response.url or url
+        page.metadata["sourceURL"] = url
+        return {
+            "url": url,
+            "markdown": page.markdown,
+            "metadata": page.metadata,
+            "links": page.links,
+        }
+
+
+class RateLimiter(Protocol):
+    def wait(self, url: str) -> None:
+        ...
+
+
+class ScraperRouter:
+    """Choose a scraper backend per URL host based on configuration.
+
+    Hosts listed in ``SCRAPER_DIRECT_DOMAINS`` (exact or as a parent domain) use
+    :class:`DirectFetchBackend`; everything else uses ``SCRAPER_DEFAULT_BACKEND``.
+    Backends are created lazily so Firecrawl credentials are only required when
+    a URL is actually routed to Firecrawl.
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: Optional[Settings] = None,
+        firecrawl_service: Optional[FirecrawlService] = None,
+        direct_backend: Optional[DirectFetchBackend] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self.settings = settings or get_settings()
+        self.rate_limiter = rate_limiter
+        self._backends: Dict[str, Any] = {}
+        if firecrawl_service is not None:
+            self._backends[BACKEND_FIRECRAWL] = firecrawl_service
+        if direct_backend is not None:
+            self._backends[BACKEND_DIRECT] = direct_backend
+        self._lock = threading.Lock()
+        self._direct_domains = _parse_domains(self.settings.scraper_direct_domains)
+
+    def backend_name_for(self, url: str) -> str:
+        host = (urlsplit(url).hostname or "").lower()
+        for domain in self._direct_domains:
+            if host == domain or host.endswith("." + domain):
+                return BACKEND_DIRECT
+        return self.settings.scraper_default_backend
+
+    def backend_for(self, url: str) -> ScraperBackend:
+        name = self.backend_name_for(url)
+        with self._lock:
+            backend = self._backends.get(name)
+            if backend is None:
+                backend = self._create_backend(name)
+                self._backends[name] = backend
+        return backend
+
+    def _create_backend(self, name: str) -> ScraperBackend:
+        if name == BACKEND_DIRECT:
+            return DirectFetchBackend(settings=self.settings)
+        if name == BACKEND_FIRECRAWL:
+            return FirecrawlService(settings=self.settings)
+        raise ValueError(f"Unknown scraper backend {name!r}")
+
+    def scrape_url(self, url: str) -> Dict[str, Any]:
+        return self._scrape(self.backend_for(url), url)
+
+    def _scrape(self, backend: ScraperBackend, url: str) -> Dict[str, Any]:
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait(url)
+        return backend.scrape_url(url)
+
+    def scrape_batch(self, urls: Iterable[str]) -> List[Dict[str, Any]]:
+        """Scrape multiple URLs sequentially, logging failures instead of raising.
+
+        Backend misconfiguration (e.g. a missing Firecrawl key) still raises.
+        """
+
+        results: List[Dict[str, Any]] = []
+        for url in urls:
+            backend = self.backend_for(url)
+            try:
+                results.append(self._scrape(backend, url))
+            except Exception as exc:
+                logger.error("Failed to scrape %s: %s", url, exc)
+                results.append({"url": url, "error": str(exc)})
+        return results
+
+
+def _parse_domains(value: str) -> List[str]:
+    return [part.strip().lower().lstrip(".") for part in (value or "").split(",") if part.strip()]
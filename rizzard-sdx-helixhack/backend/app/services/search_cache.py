@@ -0,0 +1,171 @@
+"""In-process response cache for profile search, invalidated by corpus writes.
+
+Each worker keeps its own cache, so the corpus version it is keyed on has to
+see writes made by other processes (sibling workers, the seeding scripts, the
+scrape CLI). Writers append one byte to ``CORPUS_VERSION_FILE``, and the
+version includes that file's size. An ``O_APPEND`` write is atomic, so the size
+only ever grows and no lock is needed across processes. The file is only shared
+between processes on one host, so deployments with workers on several hosts
+should keep ``SEARCH_CACHE_TTL_SECONDS`` short.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from ..config import Settings, get_settings
+from .metrics import register_metrics_provider
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+_corpus_version = 0
+_corpus_lock = threading.Lock()
+
+
+def corpus_version(settings: Optional[Settings] = None) -> Tuple[int, int]:
+    """Return the corpus version: this process's write count and the shared file size.
+
+    Either part changes on every professor write; the size is -1 while the
+    file is missing or disabled.
+    """
+    path = (settings or get_settings()).corpus_version_file
+    shared = -1
+    if path:
+        try:
+            shared = os.stat(path).st_size
+        except OSError:
+            pass
+    return _corpus_version, shared
+
+
+def bump_corpus_version(settings: Optional[Settings] = None) -> None:
+    """Mark the professor corpus as changed so cached searches stop matching."""
+    global _corpus_version
+    with _corpus_lock:
+        _corpus_version += 1
+    path = (settings or get_settings()).corpus_version_file
+    if not path:
+        return
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, b".")
+        finally:
+            os.close(fd)
+    except OSError as exc:
+        logger.warning("Could not update corpus version file %s: %s", path, exc)
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and collapse whitespace so trivially different queries share entries."""
+    return " ".join((query or "").casefold().split())
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache whose entries also expire after ``ttl_seconds``."""
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            expires_at, value = item
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+_search_cache: Optional[TTLCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache(settings: Optional[Settings] = None) -> TTLCache:
+    """Return the process-wide search response cache."""
+    global _search_cache
+    with _search_cache_lock:
+        if _search_cache is None:
+            settings = settings or get_settings()
+            _search_cache = TTLCache(
+                max_entries=settings.search_cache_max_entries,
+                ttl_seconds=settings.search_cache_ttl_seconds,
+            )
+        return _search_cache
+
+
+def search_cache_key(
+    query: str,
+    limit: int,
+    filters: Hashable = None,
+    *,
+    settings: Optional[Settings] = None,
+) -> Tuple[str, int, Hashable, Tuple[int, int]]:
+    """Key a search by normalised query, limit, filters, and the corpus version it saw."""
+    return normalize_query(query), limit, filters, corpus_version(settings)
+
+
+def search_cache_snapshot() -> Dict[str, Any]:
+    snapshot = _search_cache.snapshot() if _search_cache is not None else {}
+    snapshot["corpus_version"] = list(corpus_version())
+    return snapshot
+
+
+register_metrics_provider("search_cache", search_cache_snapshot)
@@ -29,7 +29,7 @@ def cosine_similarity_matrix(
     candidates: Sequence[Sequence[float]],
 ) -> np.ndarray:
     """Compute cosine similarity between query vectors and candidate vectors."""
-    if not query or not candidates:
+    if not len(query) or not len(candidates):
         return np.zeros((len(query), len(candidates)), dtype=np.float32)
 
     query_matrix = np.asarray(query, dtype=np.float32)
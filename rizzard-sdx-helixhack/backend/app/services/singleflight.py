@@ -0,0 +1,181 @@
+"""Coalesce identical concurrent calls so only one of them does the work.
+
+:class:`SingleFlight` is for synchronous callers (model load, LLM summaries):
+duplicates block their thread until the leader finishes. Async endpoints use
+:class:`AsyncSingleFlight`, whose duplicates await instead and so hold no
+worker thread while they wait.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from .metrics import register_metrics_provider
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run at most one in-flight call per key; duplicates wait for its result.
+
+    The first caller for a key (the leader) runs the function. Callers that
+    arrive with the same key while it is running block until it finishes and
+    receive the same return value or exception. Nothing is cached afterwards.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_waiters = 0
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                self.max_waiters = max(self.max_waiters, call.waiters)
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as exc:
+            call.error = exc
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.executed + self.coalesced
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "coalesced_ratio": round(self.coalesced / total, 4) if total else 0.0,
+                "errors": self.errors,
+                "in_flight": len(self._calls),
+                "max_waiters": self.max_waiters,
+            }
+
+
+class AsyncSingleFlight:
+    """Run at most one in-flight coroutine per key; duplicates await its result.
+
+    The first caller for a key starts ``fn(*args, **kwargs)`` as a task and
+    every caller with that key, the first included, awaits it through
+    :func:`asyncio.shield`. A cancelled caller (say, a dropped client)
+    therefore neither cancels the work nor fails the others. Use one instance
+    from a single event loop.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.executed = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_waiters = 0
+
+    async def do(
+        self, key: Hashable, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._calls[key] = task
+            self._waiters[key] = 0
+            self.executed += 1
+            task.add_done_callback(partial(self._finished, key))
+        else:
+            self._waiters[key] += 1
+            self.coalesced += 1
+            self.max_waiters = max(self.max_waiters, self._waiters[key])
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
+        # Retrieving the exception also keeps asyncio from logging it as unhandled
+        # when every caller was cancelled.
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self.executed + self.coalesced
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": round(self.coalesced / total, 4) if total else 0.0,
+            "errors": self.errors,
+            "in_flight": len(self._calls),
+            "max_waiters": self.max_waiters,
+        }
+
+
+_groups: Dict[str, SingleFlight] = {}
+_async_groups: Dict[str, AsyncSingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_singleflight(name: str) -> SingleFlight:
+    """Return the process-wide coalescing group for ``name``."""
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = SingleFlight(name)
+            _groups[name] = group
+        return group
+
+
+def get_async_singleflight(name: str) -> AsyncSingleFlight:
+    """Return the process-wide coroutine coalescing group for ``name``."""
+    with _groups_lock:
+        group = _async_groups.get(name)
+        if group is None:
+            group = AsyncSingleFlight(name)
+            _async_groups[name] = group
+        return group
+
+
+def singleflight_snapshot() -> Dict[str, Any]:
+    with _groups_lock:
+        groups: Dict[str, Any] = {**_groups, **_async_groups}
+    return {name: group.snapshot() for name, group in groups.items()}
+
+
+register_metrics_provider("singleflight", singleflight_snapshot)
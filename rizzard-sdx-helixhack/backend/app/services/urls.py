@@ -0,0 +1,117 @@
+"""URL canonicalisation shared by the scraper, loaders, and HelixDB writes."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid", "_ga", "ref_src"}
+)
+TRACKING_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+MAX_REMEMBERED_REDIRECTS = 10_000
+
+_redirects: "OrderedDict[str, str]" = OrderedDict()
+_redirects_lock = threading.Lock()
+
+
+def canonicalize_url(url: str, *, force_https: bool = True) -> str:
+    """Return the canonical form used to identify a profile page.
+
+    Lowercases the scheme and host, upgrades ``http`` on the default port to
+    ``https`` (unless ``force_https`` is False), drops default ports, fragments, tracking query
+    parameters and trailing slashes, and sorts the remaining query parameters.
+    Known redirects recorded via :func:`remember_redirect` are followed.
+    Paths keep their case since many profile sites treat them case-sensitively.
+    """
+    if not url:
+        return url
+    canonical = _canonical_form(url, force_https=force_https)
+    with _redirects_lock:
+        return _redirects.get(canonical, canonical)
+
+
+def _canonical_form(url: str, *, force_https: bool) -> str:
+    """:func:`canonicalize_url` without following remembered redirects."""
+    raw = url.strip()
+    if "://" not in raw:
+        raw = f"https://{raw}"
+
+    parts = urlsplit(raw)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower().rstrip(".")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    # Servers on explicit non-default ports (e.g. local fixtures) keep plain http.
+    if force_https and scheme == "http" and port in (None, 80):
+        scheme = "https"
+        port = None
+
+    # Rebuilt from host/port only, so any userinfo is deliberately dropped.
+    netloc = f"[{host}]" if ":" in host else host
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+
+    path = parts.path or "/"
+    while "//" in path:
+        path = path.replace("//", "/")
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    query_pairs = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query = urlencode(sorted(query_pairs))
+
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def remember_redirect(source: str, target: str, *, force_https: bool = True) -> Optional[str]:
+    """Record that ``source`` resolves to ``target`` so later batches skip the hop.
+
+    Returns the canonical target, or None when the two are already equivalent.
+    """
+    if not source or not target:
+        return None
+    canonical_source = canonicalize_url(source, force_https=force_https)
+    canonical_target = canonicalize_url(target, force_https=force_https)
+    if canonical_source == canonical_target:
+        return None
+    with _redirects_lock:
+        _redirects[canonical_source] = canonical_target
+        _redirects.move_to_end(canonical_source)
+        while len(_redirects) > MAX_REMEMBERED_REDIRECTS:
+            _redirects.popitem(last=False)
+    return canonical_target
+
+
+def dedupe_urls(urls: Iterable[str], *, force_https: bool = True) -> List[str]:
+    """Drop URLs whose canonical form was already seen, preserving first-seen order.
+
+    The URLs are returned as given, not canonicalised, so they can still be
+    fetched (an http-only host keeps its scheme) and looked up as stored
+    before canonicalisation. A URL with a known redirect is replaced by its
+    target so the hop is skipped.
+    """
+    seen = set()
+    unique: List[str] = []
+    for url in urls:
+        if not url or not url.strip():
+            continue
+        url = url.strip()
+        form = _canonical_form(url, force_https=force_https)
+        with _redirects_lock:
+            canonical = _redirects.get(form, form)
+        if canonical in seen:
+            continue
+        seen.add(canonical)
+        unique.append(url if canonical == form else canonical)
+    return unique
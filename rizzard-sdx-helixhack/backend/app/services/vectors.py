@@ -0,0 +1,85 @@
+"""Float32 vector helpers shared by embedding, HelixDB transport, and scripts."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Nine decimal places bounds the absolute error per component at 5e-10. That is
+# below a float32 ulp for components near 1 but up to ~70 ulps for small ones (at
+# 1e-4), which is harmless for cosine similarity on unit vectors. It cuts
+# a JSON-encoded 384-d vector to roughly 60% of its float64 repr.
+F32_JSON_DECIMALS = 9
+
+VectorLike = Union[np.ndarray, List[float], List[List[float]]]
+
+
+def as_float32_array(values: Any) -> np.ndarray:
+    """Return ``values`` as a float32 array without copying when already float32."""
+    return np.asarray(values, dtype=np.float32)
+
+
+def float32_to_list(values: VectorLike) -> List[Any]:
+    """Convert a float32 vector (or matrix) into compact JSON-ready float lists.
+
+    ``ndarray.tolist()`` on float32 data yields float64 values whose repr
+    carries ~17 significant digits of noise; rounding first keeps the payload
+    sized for what Helix actually stores as ``[F32]``.
+    """
+    array = as_float32_array(values)
+    return np.round(array.astype(np.float64), F32_JSON_DECIMALS).tolist()
+
+
+# Wire encodings for embedding matrices. "float" is the JSON float list; the
+# others are little-endian binary (base64 in JSON, or a raw body).
+EMBEDDING_ENCODINGS = ("float", "float32", "float16", "int8")
+_WIRE_DTYPES = {"float": "<f4", "float32": "<f4", "float16": "<f2", "int8": "i1"}
+INT8_MAX = 127
+
+
+@dataclass(frozen=True)
+class EncodedEmbeddings:
+    """A row-major embedding matrix in a compact wire encoding.
+
+    For ``int8`` each row ``i`` decodes as ``data[i] * scales[i]``.
+    """
+
+    encoding: str
+    dtype: str
+    shape: Tuple[int, int]
+    data: bytes
+    scales: Optional[np.ndarray] = None
+
+    def to_bytes(self) -> bytes:
+        """Raw body: the matrix, then (int8 only) one little-endian float32 scale per row."""
+        if self.scales is None:
+            return self.data
+        return self.data + self.scales.astype("<f4", copy=False).tobytes()
+
+
+def quantize_int8(matrix: VectorLike) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantisation; returns ``(int8 rows, float32 scales)``."""
+    array = np.atleast_2d(as_float32_array(matrix))
+    scales = np.abs(array).max(axis=1) / INT8_MAX if array.size else np.zeros(len(array))
+    scales = scales.astype(np.float32)
+    safe = np.where(scales == 0.0, np.float32(1.0), scales)
+    quantized = np.rint(array / safe[:, None]).clip(-INT8_MAX, INT8_MAX).astype(np.int8)
+    return quantized, scales
+
+
+def encode_embeddings(matrix: VectorLike, encoding: str) -> EncodedEmbeddings:
+    """Encode a ``(rows, dim)`` float matrix as little-endian bytes."""
+    if encoding not in _WIRE_DTYPES:
+        expected = ", ".join(EMBEDDING_ENCODINGS)
+        raise ValueError(f"Unknown embedding encoding {encoding!r}; expected one of {expected}")
+    array = np.atleast_2d(as_float32_array(matrix))
+    shape = (int(array.shape[0]), int(array.shape[1]) if array.ndim > 1 else 0)
+    scales = None
+    if encoding == "int8":
+        array, scales = quantize_int8(array)
+    data = np.ascontiguousarray(array, dtype=_WIRE_DTYPES[encoding]).tobytes()
+    return EncodedEmbeddings(
+        encoding=encoding, dtype=_WIRE_DTYPES[encoding], shape=shape, data=data, scales=scales
+    )
@@ -15,14 +15,99 @@ V::Professor {
     rerank_strategy: String
 }
 
-QUERY InsertProfessor(profile_id: String, name: String, title: String, department: String, profile_url: String, summary: String, keywords: [String], recent_publications: [String], news_mentions: [String], hiring: Boolean, last_updated: String, rerank_strategy: String, vector: [F64]) =>
+// One vector per chunk of a profile (summary, page section, publication
+// window), linked to its professor by canonical profile_url.
+V::ProfessorChunk {
+    profile_url: String,
+    kind: String,
+    position: I64,
+    text: String
+}
+
+QUERY InsertProfessor(profile_id: String, name: String, title: String, department: String, profile_url: String, summary: String, keywords: [String], recent_publications: [String], news_mentions: [String], hiring: Boolean, last_updated: String, rerank_strategy: String, vector: [F32]) =>
     professor <- AddV<Professor>(vector, { profile_id: profile_id, name: name, title: title, department: department, profile_url: profile_url, summary: summary, keywords: keywords, recent_publications: recent_publications, news_mentions: news_mentions, hiring: hiring, last_updated: last_updated, rerank_strategy: rerank_strategy })
     RETURN professor
 
-QUERY SearchSimilarProfessors(vector: [F64], limit: I64) =>
+// Bulk insert used by the seeding scripts: one round trip per batch.
+QUERY InsertProfessors(professors: [{profile_id: String, name: String, title: String, department: String, profile_url: String, summary: String, keywords: [String], recent_publications: [String], news_mentions: [String], hiring: Boolean, last_updated: String, rerank_strategy: String, vector: [F32]}]) =>
+    FOR {profile_id, name, title, department, profile_url, summary, keywords, recent_publications, news_mentions, hiring, last_updated, rerank_strategy, vector} IN professors {
+        AddV<Professor>(vector, { profile_id: profile_id, name: name, title: title, department: department, profile_url: profile_url, summary: summary, keywords: keywords, recent_publications: recent_publications, news_mentions: news_mentions, hiring: hiring, last_updated: last_updated, rerank_strategy: rerank_strategy })
+    }
+    RETURN "inserted"
+
+// Search queries project only the fields scoring and the UI read, leaving the
+// vector and bookkeeping properties out of the response. The *WithVectors
+// variants return whole vertices for callers that need the embeddings.
+QUERY SearchSimilarProfessors(vector: [F32], limit: I64) =>
+    professors <- SearchV<Professor>(vector, limit)
+    RETURN professors::{profile_id, name, title, department, profile_url, summary, keywords, recent_publications, news_mentions, hiring, last_updated}
+
+// Filtered variants apply the predicate inside the vector search so a full
+// `limit` of matches comes back. HelixQL has no optional parameters, so the
+// service picks the variant matching the filters supplied; an open-ended
+// last_updated bound is sent as "" (lower) or "\uffff" (upper).
+QUERY SearchSimilarProfessorsUpdatedBetween(vector: [F32], limit: I64, updated_after: String, updated_before: String) =>
+    professors <- SearchV<Professor>(vector, limit)::PREFILTER(AND(_::{last_updated}::GTE(updated_after), _::{last_updated}::LTE(updated_before)))
+    RETURN professors::{profile_id, name, title, department, profile_url, summary, keywords, recent_publications, news_mentions, hiring, last_updated}
+
+QUERY SearchSimilarProfessorsInDepartment(vector: [F32], limit: I64, department: String, updated_after: String, updated_before: String) =>
+    professors <- SearchV<Professor>(vector, limit)::PREFILTER(AND(_::{department}::EQ(department), _::{last_updated}::GTE(updated_after), _::{last_updated}::LTE(updated_before)))
+    RETURN professors::{profile_id, name, title, department, profile_url, summary, keywords, recent_publications, news_mentions, hiring, last_updated}
+
+QUERY SearchSimilarHiringProfessors(vector: [F32], limit: I64, updated_after: String, updated_before: String) =>
+    professors <- SearchV<Professor>(vector, limit)::PREFILTER(AND(_::{hiring}::EQ(true), _::{last_updated}::GTE(updated_after), _::{last_updated}::LTE(updated_before)))
+    RETURN professors::{profile_id, name, title, department, profile_url, summary, keywords, recent_publications, news_mentions, hiring, last_updated}
+
+QUERY SearchSimilarHiringProfessorsInDepartment(vector: [F32], limit: I64, department: String, updated_after: String, updated_before: String) =>
+    professors <- SearchV<Professor>(vector, limit)::PREFILTER(AND(_::{hiring}::EQ(true), _::{department}::EQ(department), _::{last_updated}::GTE(updated_after), _::{last_updated}::LTE(updated_before)))
+    RETURN professors::{profile_id, name, title, department, profile_url, summary, keywords, recent_publications, news_mentions, hiring, last_updated}
+
+QUERY SearchSimilarProfessorsWithVectors(vector: [F32], limit: I64) =>
     professors <- SearchV<Professor>(vector, limit)
     RETURN professors
 
+QUERY SearchSimilarProfessorsUpdatedBetweenWithVectors(vector: [F32], limit: I64, updated_after: String, updated_before: String) =>
+    professors <- SearchV<Professor>(vector, limit)::PREFILTER(AND(_::{last_updated}::GTE(updated_after), _::{last_updated}::LTE(updated_before)))
+    RETURN professors
+
+QUERY SearchSimilarProfessorsInDepartmentWithVectors(vector: [F32], limit: I64, department: String, updated_after: String, updated_before: String) =>
+    professors <- SearchV<Professor>(vector, limit)::PREFILTER(AND(_::{department}::EQ(department), _::{last_updated}::GTE(updated_after), _::{last_updated}::LTE(updated_before)))
+    RETURN professors
+
+QUERY SearchSimilarHiringProfessorsWithVectors(vector: [F32], limit: I64, updated_after: String, updated_before: String) =>
+    professors <- SearchV<Professor>(vector, limit)::PREFILTER(AND(_::{hiring}::EQ(true), _::{last_updated}::GTE(updated_after), _::{last_updated}::LTE(updated_before)))
+    RETURN professors
+
+QUERY SearchSimilarHiringProfessorsInDepartmentWithVectors(vector: [F32], limit: I64, department: String, updated_after: String, updated_before: String) =>
+    professors <- SearchV<Professor>(vector, limit)::PREFILTER(AND(_::{hiring}::EQ(true), _::{department}::EQ(department), _::{last_updated}::GTE(updated_after), _::{last_updated}::LTE(updated_before)))
+    RETURN professors
+
 QUERY GetProfessorByUrl(url: String) =>
     professor <- V<Professor>::WHERE(_::{profile_url}::EQ(url))
     RETURN professor
+
+// Paging and deletion used by scripts/migrate_vectors_f32.py.
+QUERY ListProfessors(start: I64, end: I64) =>
+    professors <- V<Professor>::RANGE(start, end)
+    RETURN professors
+
+QUERY DeleteProfessor(id: ID) =>
+    DROP V<Professor>(id)
+    RETURN "deleted"
+
+// Multi-vector profiles. Chunks are replaced per professor (delete, then
+// insert) and searched on their own; the service aggregates the hits per
+// professor.
+QUERY InsertProfessorChunks(chunks: [{profile_url: String, kind: String, position: I64, text: String, vector: [F32]}]) =>
+    FOR {profile_url, kind, position, text, vector} IN chunks {
+        AddV<ProfessorChunk>(vector, { profile_url: profile_url, kind: kind, position: position, text: text })
+    }
+    RETURN "inserted"
+
+QUERY SearchProfessorChunks(vector: [F32], limit: I64) =>
+    chunks <- SearchV<ProfessorChunk>(vector, limit)
+    RETURN chunks::{profile_url, kind, position}
+
+QUERY DeleteProfessorChunks(profile_url: String) =>
+    DROP V<ProfessorChunk>::WHERE(_::{profile_url}::EQ(profile_url))
+    RETURN "deleted"
@@ -0,0 +1,149 @@
+"""Measure multi-vector (chunk) search against summary-only search.
+
+Builds a synthetic corpus in the in-memory Helix store: every professor has a
+summary vector near its main topic and ``--chunks`` chunk vectors near its
+other topics (the first chunk is the summary). Queries target one non-summary
+chunk of a random professor, the case summary-only search misses. The script
+reports recall@limit for both search paths and timings for the chunk query,
+the rank aggregation, and the end-to-end search.
+No Helix instance or embedding model is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.services.chunk_search import aggregate_chunk_ranks, search_professors_multi_vector
+from app.services.helixdb_service import HelixDBService
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--professors", type=int, default=10000)
+    parser.add_argument("--chunks", type=int, default=10, help="Chunks per professor")
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--noise", type=float, default=0.6, help="Chunk/query noise scale")
+    parser.add_argument("--aggregation", choices=("max", "top-m"), default="max")
+    return parser.parse_args()
+
+
+def unit(matrix: np.ndarray) -> np.ndarray:
+    return (matrix / np.linalg.norm(matrix, axis=-1, keepdims=True)).astype(np.float32)
+
+
+def timed(samples: List[float], fn: Callable[[], object]) -> object:
+    started = time.perf_counter()
+    result = fn()
+    samples.append(time.perf_counter() - started)
+    return result
+
+
+def describe(label: str, samples: List[float]) -> str:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"  {label:<22} p50 {statistics.median(samples) * 1e3:8.3f} ms  p95 {p95 * 1e3:8.3f} ms"
+
+
+def main() -> None:
+    args = parse_args()
+    settings = get_settings().model_copy(
+        update={"helixdb_backend": "memory", "chunk_aggregation": args.aggregation}
+    )
+    helix = HelixDBService(settings=settings)
+    client = helix.client
+    client.store.clear()
+    client.chunk_store.clear()
+
+    rng = np.random.default_rng(0)
+    scale = args.noise / np.sqrt(args.dimensions)
+    topics = unit(rng.standard_normal((args.professors, args.chunks, args.dimensions)))
+    chunk_vectors = unit(topics + scale * rng.standard_normal(topics.shape))
+    urls = [f"https://profiles.example.edu/prof{idx}" for idx in range(args.professors)]
+
+    started = time.perf_counter()
+    client.store.insert_many(
+        [
+            {"profile_id": f"bench-{idx}", "name": f"Professor {idx}", "profile_url": url}
+            for idx, url in enumerate(urls)
+        ],
+        chunk_vectors[:, 0],
+    )
+    client.chunk_store.insert_many(
+        [
+            {"profile_url": url, "kind": "section", "position": position, "text": ""}
+            for url in urls
+            for position in range(args.chunks)
+        ],
+        chunk_vectors.reshape(-1, args.dimensions),
+    )
+    total_chunks = len(client.chunk_store)
+    print(
+        f"{args.professors} professors x {args.chunks} chunks = {total_chunks} chunk vectors, "
+        f"{args.dimensions}-d, limit {args.limit}, {args.aggregation} aggregation "
+        f"(loaded in {time.perf_counter() - started:.1f}s)"
+    )
+
+    targets = rng.integers(0, args.professors, args.queries)
+    positions = rng.integers(1, args.chunks, args.queries) if args.chunks > 1 else np.zeros(
+        args.queries, dtype=int
+    )
+    queries = unit(
+        topics[targets, positions] + scale * rng.standard_normal((args.queries, args.dimensions))
+    )
+
+    plain_times: List[float] = []
+    chunk_times: List[float] = []
+    aggregate_times: List[float] = []
+    multi_times: List[float] = []
+    plain_hits = multi_hits = 0
+    oversample = args.limit * settings.chunk_search_oversample
+    for target, query in zip(targets, queries):
+        expected = urls[target]
+        plain = timed(plain_times, lambda: helix.search_similar_professors(query, limit=args.limit))
+        plain_hits += any(record["profile_url"] == expected for record in plain)
+        hits = timed(chunk_times, lambda: helix.search_professor_chunks(query, limit=oversample))
+        hit_urls = [hit["profile_url"] for hit in hits]
+        timed(
+            aggregate_times,
+            lambda: aggregate_chunk_ranks(
+                hit_urls, mode=args.aggregation, m=settings.chunk_aggregation_m
+            ),
+        )
+        multi = timed(
+            multi_times,
+            lambda: search_professors_multi_vector(
+                helix, query, limit=args.limit, settings=settings
+            ),
+        )
+        multi_hits += any(record["profile_url"] == expected for record in multi)
+
+    print(f"  recall@{args.limit}: summary only {plain_hits / args.queries:6.1%}, "
+          f"multi-vector {multi_hits / args.queries:6.1%}")
+    print(describe("summary search", plain_times))
+    print(describe(f"chunk search ({oversample})", chunk_times))
+    print(describe("rank aggregation", aggregate_times))
+    print(describe("multi-vector search", multi_times))
+
+    many = [urls[idx] for idx in rng.integers(0, args.professors, total_chunks)]
+    samples: List[float] = []
+    for _ in range(5):
+        timed(samples, lambda: aggregate_chunk_ranks(many, mode="top-m", m=3))
+    print(describe(f"aggregate {len(many)} hits", samples))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compare plain ``model.encode`` with length-bucketed ``encode_bucketed``.
+
+The workload mixes short keyword queries with long professor summaries, the
+shape of bulk ingestion plus search traffic. It reports throughput for each
+path and the padding and truncation counts from ``encode_stats``. It also
+checks that bucketing returns the same vectors in input order.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.services.embedding import encode_bucketed, encode_stats, get_configured_model
+from data.professors import UCSD_PROFESSORS
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=1024)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[16, 32, 64])
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def workload(count: int) -> list:
+    long_texts = [
+        " ".join([record.get("summary", "")] + record.get("recent_publications", []))
+        for record in UCSD_PROFESSORS
+    ]
+    short_texts = [" ".join(record.get("keywords", [])[:2]) for record in UCSD_PROFESSORS]
+    pool = long_texts + short_texts * 3
+    rng = random.Random(0)
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def best_of(repeat: int, fn) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return min(samples)
+
+
+def main() -> None:
+    args = parse_args()
+    settings = get_settings()
+    model = get_configured_model(settings)
+    texts = workload(args.texts)
+    print(
+        f"{settings.embedding_model_name}: {len(texts)} mixed-length texts, "
+        f"max_seq_length {getattr(model, 'max_seq_length', '?')}"
+    )
+
+    for batch_size in args.batch_sizes:
+        reference = np.asarray(
+            model.encode(texts, batch_size=batch_size, convert_to_numpy=True), dtype=np.float32
+        )
+        bucketed = encode_bucketed(model, texts, batch_size=batch_size)
+        max_diff = float(np.abs(reference - bucketed).max())
+
+        plain = best_of(
+            args.repeat, lambda: model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+        )
+        sorted_time = best_of(
+            args.repeat, lambda: encode_bucketed(model, texts, batch_size=batch_size)
+        )
+        print(
+            f"  batch {batch_size:>3}: encode {len(texts) / plain:8.1f} texts/s, "
+            f"bucketed {len(texts) / sorted_time:8.1f} texts/s "
+            f"({plain / sorted_time:.2f}x), max |diff| {max_diff:.2e}"
+        )
+
+    stats = encode_stats.snapshot()
+    print(
+        f"Bucketed runs: padding ratio {stats['padding_ratio']:.1%}, "
+        f"{stats['texts_truncated']} of {stats['texts']} texts truncated, "
+        f"{stats['tokens_dropped']} tokens dropped"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Compare /embed wire encodings: serialisation time, payload size, and fidelity.
+
+Uses random unit vectors shaped like the model's output, so no model is
+needed. Each encoding is built into the response body the way the route does
+it (JSON float lists, base64 in JSON, or the raw octet-stream body). Decoded
+vectors are compared with the float32 originals by cosine similarity.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Tuple
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models.schemas import EmbedResponse
+from app.services.vectors import encode_embeddings, float32_to_list
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def render(response: EmbedResponse) -> bytes:
+    # What FastAPI does for a response_model: dump to JSON-able data, then json.dumps.
+    return json.dumps(
+        response.model_dump(mode="json", exclude_none=True), separators=(",", ":")
+    ).encode("utf-8")
+
+
+def json_floats(matrix: np.ndarray) -> bytes:
+    return render(EmbedResponse(embeddings=float32_to_list(matrix), model=MODEL_NAME))
+
+
+def json_base64(encoding: str) -> Callable[[np.ndarray], bytes]:
+    def build(matrix: np.ndarray) -> bytes:
+        encoded = encode_embeddings(matrix, encoding)
+        return render(
+            EmbedResponse(
+                model=MODEL_NAME,
+                encoding=encoding,
+                data=base64.b64encode(encoded.data).decode("ascii"),
+                shape=list(encoded.shape),
+                scales=encoded.scales.tolist() if encoded.scales is not None else None,
+            )
+        )
+
+    return build
+
+
+def raw_body(encoding: str) -> Callable[[np.ndarray], bytes]:
+    return lambda matrix: encode_embeddings(matrix, encoding).to_bytes()
+
+
+def decode(label: str, body: bytes, shape: Tuple[int, int]) -> np.ndarray:
+    rows, dimensions = shape
+    if label == "json float":
+        return np.asarray(json.loads(body)["embeddings"], dtype=np.float32)
+    if label.startswith("json"):
+        payload = json.loads(body)
+        encoding = payload["encoding"]
+        data = base64.b64decode(payload["data"])
+        scales = np.asarray(payload.get("scales") or [], dtype=np.float32)
+    else:
+        encoding = label.split()[-1]
+        data, scales = body, None
+    dtype = {"float32": "<f4", "float16": "<f2", "int8": "i1"}[encoding]
+    matrix = np.frombuffer(data, dtype=dtype, count=rows * dimensions).reshape(rows, dimensions)
+    if encoding == "int8":
+        if scales is None:
+            scales = np.frombuffer(data, dtype="<f4", offset=rows * dimensions)
+        return matrix.astype(np.float32) * scales[:, None]
+    return matrix.astype(np.float32)
+
+
+def main() -> None:
+    args = parse_args()
+    rng = np.random.default_rng(0)
+    matrix = rng.standard_normal((args.rows, args.dimensions)).astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    cases = {"json float": json_floats}
+    for encoding in ("float32", "float16", "int8"):
+        cases[f"json {encoding}"] = json_base64(encoding)
+    for encoding in ("float32", "float16", "int8"):
+        cases[f"raw {encoding}"] = raw_body(encoding)
+
+    print(f"{args.rows} x {args.dimensions} unit vectors, best of {args.repeat}")
+    print(f"  {'format':<14} {'ms':>9} {'speedup':>8} {'bytes':>11} {'smaller':>8} {'min cos':>9}")
+    baseline = None
+    for label, build in cases.items():
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            body = build(matrix)
+            samples.append(time.perf_counter() - started)
+        best = min(samples)
+        baseline = baseline or (best, len(body))
+        decoded = decode(label, body, matrix.shape)
+        cosine = np.sum(decoded * matrix, axis=1) / np.linalg.norm(decoded, axis=1)
+        print(
+            f"  {label:<14} {best * 1e3:9.2f} {baseline[0] / best:7.1f}x {len(body):11,d} "
+            f"{baseline[1] / len(body):7.1f}x {cosine.min():9.6f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Compare embedding backends for accuracy against torch and for CPU throughput.
+
+The embeddings are taken over the professor summaries in ``data/professors.py``,
+plus keyword queries built from them. For each backend the script reports:
+
+- load time;
+- encode throughput (texts/s);
+- per-text cosine agreement with the reference ``torch`` vectors (mean and minimum);
+- how many of the reference top-k professors each keyword query still retrieves.
+
+It exits non-zero when a backend's mean cosine falls below ``--min-cosine``,
+so it doubles as the accuracy gate before switching ``EMBEDDING_BACKEND``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.services.embedding import normalize_embeddings
+from app.services.embedding_backends import (
+    EMBEDDING_BACKENDS,
+    REFERENCE_BACKEND,
+    EmbeddingBackendError,
+    load_sentence_transformer,
+)
+from data.professors import UCSD_PROFESSORS
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backends", nargs="+", default=list(EMBEDDING_BACKENDS))
+    parser.add_argument("--onnx-file", default=None, help="ONNX export inside the model repo")
+    parser.add_argument("--texts", type=int, default=512, help="Texts per throughput run")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    return parser.parse_args()
+
+
+def corpus() -> Dict[str, List[str]]:
+    summaries = [record.get("summary") or record.get("name") or "" for record in UCSD_PROFESSORS]
+    queries = [
+        " ".join(record.get("keywords", [])[:3]) or record.get("department", "")
+        for record in UCSD_PROFESSORS
+    ]
+    return {"summaries": summaries, "queries": queries}
+
+
+def encode(model, texts: List[str], batch_size: int) -> np.ndarray:
+    vectors = model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+    return normalize_embeddings(np.asarray(vectors, dtype=np.float32))
+
+
+def top_k(queries: np.ndarray, documents: np.ndarray, k: int) -> np.ndarray:
+    return np.argsort(-(queries @ documents.T), axis=1)[:, :k]
+
+
+def main() -> None:
+    args = parse_args()
+    model_name = get_settings().embedding_model_name
+    texts = corpus()
+    copies = args.texts // max(1, len(texts["summaries"])) + 1
+    workload = (texts["summaries"] * copies)[: args.texts]
+    backends = [REFERENCE_BACKEND] + [b for b in args.backends if b != REFERENCE_BACKEND]
+
+    reference: Dict[str, np.ndarray] = {}
+    failures: List[str] = []
+    print(f"{model_name}: {len(workload)} texts per run, batch size {args.batch_size}")
+    print(
+        f"  {'backend':<28} {'load s':>7} {'texts/s':>9} {'speedup':>8} "
+        f"{'cos mean':>9} {'cos min':>8} {f'top-{args.top_k}':>7}"
+    )
+    baseline_rate = None
+    for backend in backends:
+        label = f"onnx:{args.onnx_file}" if backend == "onnx" and args.onnx_file else backend
+        started = time.perf_counter()
+        try:
+            model = load_sentence_transformer(model_name, backend, onnx_file=args.onnx_file)
+        except (EmbeddingBackendError, ImportError) as exc:
+            if backend == REFERENCE_BACKEND:
+                raise SystemExit(f"Cannot load the reference backend: {exc}")
+            print(f"  {label:<28} skipped: {exc}")
+            continue
+        load_seconds = time.perf_counter() - started
+
+        encode(model, workload[: args.batch_size], args.batch_size)  # warm-up
+        best = min(
+            _timed(lambda: encode(model, workload, args.batch_size)) for _ in range(args.repeat)
+        )
+        rate = len(workload) / best
+        baseline_rate = baseline_rate or rate
+
+        summaries = encode(model, texts["summaries"], args.batch_size)
+        queries = encode(model, texts["queries"], args.batch_size)
+        if backend == REFERENCE_BACKEND:
+            reference = {"summaries": summaries, "queries": queries}
+        cosines = np.sum(summaries * reference["summaries"], axis=1)
+        expected = top_k(reference["queries"], reference["summaries"], args.top_k)
+        got = top_k(queries, summaries, args.top_k)
+        overlap = np.mean(
+            [len(set(a) & set(b)) / args.top_k for a, b in zip(expected, got)]
+        )
+        print(
+            f"  {label:<28} {load_seconds:7.2f} {rate:9.1f} {rate / baseline_rate:7.2f}x "
+            f"{cosines.mean():9.5f} {cosines.min():8.5f} {overlap:7.1%}"
+        )
+        if cosines.mean() < args.min_cosine:
+            failures.append(f"{label}: mean cosine {cosines.mean():.5f} < {args.min_cosine}")
+        del model
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+def _timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    main()
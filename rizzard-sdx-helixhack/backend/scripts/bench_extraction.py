@@ -0,0 +1,143 @@
+"""Benchmark single-pass markdown extraction against the previous multi-scan helpers."""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.markdown_extract import extract_markdown_profile
+from app.services.text import extract_tokens
+
+
+# Frozen copy of the extraction helpers that FirecrawlService used before the
+# single-pass extractor, kept here as the benchmark baseline.
+LEGACY_HEADING_RE = re.compile(r"^#{1,3}\s+(?P<title>[^\n#]+)$", re.MULTILINE)
+LEGACY_DEPARTMENT_RE = re.compile(
+    r"(?P<label>Department of|Dept\. of|School of)\s+(?P<value>[^\n\r]+)",
+    re.IGNORECASE,
+)
+
+
+def legacy_extract(markdown: str) -> Tuple[Optional[str], Optional[str], Optional[str], List[str]]:
+    match = LEGACY_HEADING_RE.search(markdown)
+    heading = match.group("title").strip() if match else None
+
+    blocks = [block.strip() for block in markdown.split("\n\n")]
+    paragraph = next((b.replace("\n", " ") for b in blocks if len(b) >= 40), None)
+    if paragraph is None:
+        paragraph = blocks[0] or None
+
+    match = LEGACY_DEPARTMENT_RE.search(markdown)
+    department = match.group("value").strip() if match else None
+
+    summary = paragraph or heading or ""
+    freq = Counter(extract_tokens(markdown + " " + summary))
+    return heading, paragraph, department, [t for t, _ in freq.most_common(12)]
+
+
+def single_pass_extract(
+    markdown: str,
+) -> Tuple[Optional[str], Optional[str], Optional[str], List[str]]:
+    extracted = extract_markdown_profile(markdown)
+    summary = extracted.paragraph or extracted.heading or ""
+    extracted.count_tokens(summary)
+    return (
+        extracted.heading,
+        extracted.paragraph,
+        extracted.department,
+        [t for t, _ in extracted.token_counts.most_common(12)],
+    )
+
+
+def synthetic_profile(sections: int) -> str:
+    parts = [
+        "# Jane Q. Researcher, PhD",
+        "",
+        "Associate Professor of Bioengineering",
+        "",
+        "Department of Bioengineering, Jacobs School of Engineering",
+        "Contact: jresearcher@example.edu",
+        "",
+        "Jane studies computational models of cardiac tissue, machine learning for "
+        "medical imaging, and the mechanics of soft biological materials.",
+    ]
+    for idx in range(sections):
+        parts.extend(
+            [
+                "",
+                f"## Research Area {idx}",
+                "",
+                f"Project {idx} combines finite element simulation, deep learning and "
+                "clinical imaging data to characterise tissue remodelling over time.",
+                "",
+                "## Selected Publications",
+                "",
+            ]
+        )
+        parts.extend(
+            f"- Researcher J, et al. Study {idx}.{pub} of cardiac mechanics. J Biomech. 2024."
+            for pub in range(8)
+        )
+    return "\n".join(parts)
+
+
+def measure(fn: Callable[[str], object], markdown: str, repeat: int) -> Tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(markdown)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    fn(markdown)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-i",
+        "--input",
+        type=Path,
+        nargs="*",
+        help="Markdown files to benchmark (defaults to a synthetic large profile page)",
+    )
+    parser.add_argument("--sections", type=int, default=400, help="Synthetic page size")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing iterations per page")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    pages = (
+        [(str(path), path.read_text(encoding="utf-8")) for path in args.input]
+        if args.input
+        else [(f"synthetic ({args.sections} sections)", synthetic_profile(args.sections))]
+    )
+
+    for label, markdown in pages:
+        legacy = legacy_extract(markdown)
+        current = single_pass_extract(markdown)
+        status = "match" if legacy == current else "MISMATCH"
+
+        legacy_time, legacy_peak = measure(legacy_extract, markdown, args.repeat)
+        new_time, new_peak = measure(single_pass_extract, markdown, args.repeat)
+
+        print(f"{label}: {len(markdown) / 1024:.0f} KiB, outputs {status}")
+        print(f"  legacy      {legacy_time * 1e3:8.2f} ms  peak {legacy_peak / 1024:8.0f} KiB")
+        print(f"  single-pass {new_time * 1e3:8.2f} ms  peak {new_peak / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Benchmark compatibility and feasibility scoring with the profile feature store.
+
+Candidates are drawn from ``data/professors.py`` with distinct ids. Three
+ways of producing the compatibility and feasibility scores are timed:
+
+- ``per-profile``: a frozen copy of the previous implementation, which
+  tokenises every profile and scores it in Python on each request;
+- ``store, cold``: a fresh :class:`ProfileFeatureStore`, so every candidate's
+  features are computed on this request;
+- ``store, warm``: features already stored (at ingest or by an earlier
+  request), so scoring is a gather plus array operations.
+
+All three must return identical scores and details.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models.schemas import ProfileActivitySignals, ProfileInput
+from app.services.feature_store import ProfileFeatureStore
+from app.services.scoring import (
+    compute_compatibility_scores,
+    compute_feasibility_scores,
+    detail_rows,
+)
+from app.services.text import extract_query_keywords, extract_tokens, merge_keywords
+from data.professors import UCSD_PROFESSORS
+
+QUERY = "machine learning for protein structure and drug discovery"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+# Frozen copy of the per-profile implementation, kept as the benchmark baseline.
+def keyword_overlap_score(query_tokens: Iterable[str], profile_tokens: Iterable[str]) -> float:
+    """Compute keyword overlap ratio between query and profile tokens."""
+    query_set = {token.lower() for token in query_tokens if token}
+    profile_set = {token.lower() for token in profile_tokens if token}
+
+    if not query_set or not profile_set:
+        return 0.0
+
+    overlap = query_set.intersection(profile_set)
+    return len(overlap) / len(query_set)
+
+
+def normalize_list(scores: List[float]) -> List[float]:
+    arr = np.asarray(scores, dtype=np.float32)
+    if arr.size == 0:
+        return []
+    min_val = float(np.min(arr))
+    max_val = float(np.max(arr))
+    if max_val - min_val < 1e-6:
+        return [0.0 for _ in scores]
+    return [float((s - min_val) / (max_val - min_val)) for s in scores]
+
+
+def per_profile_scores(
+    query_tokens: Iterable[str], profiles: Sequence[ProfileInput]
+) -> Tuple[List[float], List[dict], List[float], List[dict]]:
+    raw_scores: List[float] = []
+    compatibility_details: List[dict] = []
+    seen_departments: set = set()
+    for profile in profiles:
+        tokens = list(profile.keywords)
+        tokens.extend(extract_tokens(profile.summary))
+        if profile.department:
+            tokens.extend(extract_tokens(profile.department))
+        keyword_score = keyword_overlap_score(query_tokens, merge_keywords(tokens))
+        department = (profile.department or "").strip().lower()
+        diversity_bonus = 0.1 if department and department not in seen_departments else 0.0
+        seniority_bonus = 0.0
+        if profile.title:
+            lowered_title = profile.title.lower()
+            if "assistant" in lowered_title or "associate" in lowered_title:
+                seniority_bonus = 0.05
+        total_score = keyword_score + diversity_bonus + seniority_bonus
+        raw_scores.append(total_score)
+        compatibility_details.append(
+            {
+                "keyword_overlap": keyword_score,
+                "department_bonus": diversity_bonus,
+                "seniority_bonus": seniority_bonus,
+                "raw_score": total_score,
+            }
+        )
+        if profile.department:
+            seen_departments.add(profile.department.strip().lower())
+    compatibility = normalize_list(raw_scores)
+    for detail, norm in zip(compatibility_details, compatibility):
+        detail["normalized_score"] = norm
+
+    recency: List[float] = []
+    feasibility_details: List[dict] = []
+    for profile in profiles:
+        signals = profile.activity_signals
+        score = signals.recency_score() if signals else 0.5
+        recency.append(score)
+        feasibility_details.append({"has_activity_signals": bool(signals), "raw_score": score})
+    feasibility = normalize_list(recency)
+    for detail, norm in zip(feasibility_details, feasibility):
+        detail["normalized_score"] = norm
+    return compatibility, compatibility_details, feasibility, feasibility_details
+
+
+def store_scores(
+    store: ProfileFeatureStore, query_tokens: Iterable[str], profiles: Sequence[ProfileInput]
+) -> Tuple[List[float], List[dict], List[float], List[dict]]:
+    features = store.features_for(profiles)
+    compatibility, compatibility_details = compute_compatibility_scores(query_tokens, features)
+    feasibility, feasibility_details = compute_feasibility_scores(features)
+    indices = np.arange(len(profiles))
+    return (
+        compatibility.tolist(),
+        detail_rows(compatibility_details, indices),
+        feasibility.tolist(),
+        detail_rows(feasibility_details, indices),
+    )
+
+
+def build_profiles(count: int) -> List[ProfileInput]:
+    profiles: List[ProfileInput] = []
+    for idx in range(count):
+        record = UCSD_PROFESSORS[idx % len(UCSD_PROFESSORS)]
+        has_signals = idx % 4 != 0
+        profiles.append(
+            ProfileInput(
+                profile_id=f"{record['profile_id']}-{idx}",
+                name=record["name"],
+                title=record.get("title"),
+                department=record.get("department") if idx % 5 else f"Department {idx % 97}",
+                summary=record.get("summary", ""),
+                keywords=record.get("keywords", []),
+                activity_signals=ProfileActivitySignals(
+                    recent_publications=record.get("recent_publications") or [],
+                    news_mentions=record.get("news_mentions") or [],
+                    hiring=record.get("hiring", False),
+                    last_updated=record.get("last_updated") or "",
+                )
+                if has_signals
+                else None,
+            )
+        )
+    return profiles
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return min(samples)
+
+
+def main() -> None:
+    args = parse_args()
+    query_tokens = extract_query_keywords(QUERY)
+    print(f"Compatibility + feasibility scoring, best of {args.repeat}")
+    for count in args.candidates:
+        profiles = build_profiles(count)
+        warm = ProfileFeatureStore()
+        reference = per_profile_scores(query_tokens, profiles)
+        assert store_scores(warm, query_tokens, profiles) == reference, "store output differs"
+
+        cases = {
+            "per-profile": lambda: per_profile_scores(query_tokens, profiles),
+            "store, cold": lambda: store_scores(ProfileFeatureStore(), query_tokens, profiles),
+            "store, warm": lambda: store_scores(warm, query_tokens, profiles),
+        }
+        print(f"{count} candidates")
+        baseline = None
+        for label, fn in cases.items():
+            best = best_of(args.repeat, fn)
+            baseline = baseline or best
+            print(f"  {label:<14} {best * 1e3:9.2f} ms  {baseline / best:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
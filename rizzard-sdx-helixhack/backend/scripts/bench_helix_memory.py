@@ -0,0 +1,117 @@
+"""Load-test the Helix-bound service paths against the in-memory Helix client.
+
+Seeds synthetic professors through ``HelixDBService.insert_professor`` (URL
+lookup + insert, exactly as the scrape pipeline does), then times plain and
+filtered searches from a pool of concurrent callers. ``--latency-ms`` and
+``--jitter-ms`` emulate the network round trip to a real Helix container.
+No Helix instance or embedding model is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.services.helixdb_service import HelixDBService, SearchFilters
+
+DEPARTMENTS = ("Medicine", "Bioengineering", "Computer Science", "Public Health", "Physics")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--professors", type=int, default=5000)
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--searches", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    return parser.parse_args()
+
+
+def report(label: str, samples: List[float], wall: float) -> None:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(
+        f"  {label:<20} {len(samples) / wall:9.0f} ops/s  "
+        f"p50 {statistics.median(samples) * 1e3:7.3f} ms  p95 {p95 * 1e3:7.3f} ms"
+    )
+
+
+def run(label: str, calls: List[Callable[[], object]], concurrency: int) -> None:
+    def timed(call: Callable[[], object]) -> float:
+        start = time.perf_counter()
+        call()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(timed, calls))
+    report(label, samples, time.perf_counter() - start)
+
+
+def main() -> None:
+    args = parse_args()
+    settings = get_settings().model_copy(
+        update={
+            "helixdb_backend": "memory",
+            "helix_memory_latency_ms": args.latency_ms,
+            "helix_memory_jitter_ms": args.jitter_ms,
+        }
+    )
+    helix = HelixDBService(settings=settings)
+    helix.client.store.clear()
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((args.professors, args.dimensions)).astype(np.float32)
+
+    def insert(idx: int) -> Callable[[], object]:
+        profile = {
+            "profile_id": f"bench-{idx}",
+            "name": f"Professor {idx}",
+            "department": DEPARTMENTS[idx % len(DEPARTMENTS)],
+            "profile_url": f"https://profiles.example.edu/prof{idx}",
+            "summary": "Synthetic professor",
+            "keywords": ["synthetic"],
+            "activity_signals": {
+                "hiring": idx % 4 == 0,
+                "last_updated": f"2025-{1 + idx % 12:02d}-01",
+            },
+        }
+        return lambda: helix.insert_professor(profile, vectors[idx])
+
+    print(
+        f"{args.professors} professors, {args.dimensions}-d, concurrency {args.concurrency}, "
+        f"injected latency {args.latency_ms} ms (+{args.jitter_ms} ms jitter)"
+    )
+    run("insert_professor", [insert(idx) for idx in range(args.professors)], args.concurrency)
+
+    queries = rng.standard_normal((args.searches, args.dimensions)).astype(np.float32)
+    for label, filters in (
+        ("search", None),
+        ("search dept+hiring", SearchFilters(department="Medicine", hiring=True)),
+        ("search date range", SearchFilters(updated_after="2025-03-01", updated_before="2025-06-30")),
+    ):
+        run(
+            label,
+            [
+                (lambda q=query, f=filters: helix.search_similar_professors(q, limit=args.limit, filters=f))
+                for query in queries
+            ],
+            args.concurrency,
+        )
+
+
+if __name__ == "__main__":
+    main()
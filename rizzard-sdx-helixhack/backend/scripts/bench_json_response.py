@@ -0,0 +1,196 @@
+"""Time serialisation of a search-sized ``ScoreResponse``.
+
+The payload is built from ``data/professors.py`` with the real compatibility
+and feasibility rationale, with no model or LLM involved. It is serialised
+three ways:
+
+- ``legacy``: what FastAPI releases before the pydantic-core fast path do with
+  a returned model: ``model_dump``, validate the dict against
+  ``response_model``, ``jsonable``-encode it, then ``json.dumps``;
+- ``fastapi``: the installed FastAPI, through a route that returns the model;
+- ``ModelJSONResponse``: the same route returning ``app.responses.ModelJSONResponse``.
+
+The last two are timed in-process through the ASGI app, so the figures
+include routing but no network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+
+from app.models.schemas import ProfileActivitySignals, ProfileInput, ScoreResponse, ScoreResult
+from app.responses import ModelJSONResponse, dump_json, orjson
+from app.services.feature_store import ProfileFeatureStore
+from app.services.scoring import (
+    aggregate_scores,
+    compute_compatibility_scores,
+    compute_feasibility_scores,
+    detail_rows,
+)
+from app.services.text import extract_query_keywords
+from data.professors import UCSD_PROFESSORS
+
+QUERY = "machine learning for protein structure and drug discovery"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--results", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    return parser.parse_args()
+
+
+def build_response(count: int) -> ScoreResponse:
+    profiles: List[ProfileInput] = []
+    for idx in range(count):
+        record = UCSD_PROFESSORS[idx % len(UCSD_PROFESSORS)]
+        profiles.append(
+            ProfileInput(
+                profile_id=f"{record['profile_url']}#{idx}",
+                name=record["name"],
+                title=record.get("title"),
+                department=record.get("department"),
+                summary=record.get("summary", ""),
+                keywords=record.get("keywords", []),
+                activity_signals=ProfileActivitySignals(
+                    recent_publications=record.get("recent_publications") or [],
+                    news_mentions=record.get("news_mentions") or [],
+                    hiring=record.get("hiring", False),
+                    last_updated=record.get("last_updated") or "",
+                ),
+            )
+        )
+    features = ProfileFeatureStore().features_for(profiles)
+    rng = random.Random(0)
+    semantic = [rng.random() for _ in profiles]
+    compatibility, compatibility_details = compute_compatibility_scores(
+        extract_query_keywords(QUERY), features
+    )
+    feasibility, feasibility_details = compute_feasibility_scores(features)
+    scores = aggregate_scores(semantic, compatibility, feasibility)
+    indices = scores.ranked()
+    return ScoreResponse(
+        results=[
+            ScoreResult(
+                profile=profile,
+                scores=breakdown,
+                rationale={
+                    "semantic_score": score,
+                    "compatibility_details": comp,
+                    "feasibility_details": feas,
+                    "embedding_model": "sentence-transformers/all-MiniLM-L6-v2",
+                },
+                summary_text=None,
+            )
+            for profile, breakdown, score, comp, feas in zip(
+                profiles,
+                scores.breakdowns(indices),
+                semantic,
+                detail_rows(compatibility_details, indices),
+                detail_rows(feasibility_details, indices),
+            )
+        ]
+    )
+
+
+def legacy(response: ScoreResponse) -> bytes:
+    validated = ScoreResponse.model_validate(response.model_dump(by_alias=True))
+    return json.dumps(
+        jsonable_encoder(validated), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def asgi_caller(app: FastAPI, path: str) -> Callable[[], bytes]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("bench", 80),
+        "client": ("bench", 1),
+    }
+    loop = asyncio.new_event_loop()
+
+    async def call() -> bytes:
+        body: List[bytes] = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                body.append(message.get("body", b""))
+
+        await app(dict(scope), receive, send)
+        return b"".join(body)
+
+    return lambda: loop.run_until_complete(call())
+
+
+def best_of(repeat: int, fn: Callable[[], bytes]) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return min(samples)
+
+
+def main() -> None:
+    args = parse_args()
+    response = build_response(args.results)
+
+    app = FastAPI()
+
+    @app.get("/model", response_model=ScoreResponse)
+    async def as_model() -> ScoreResponse:
+        return response
+
+    @app.get("/fast", response_model=ScoreResponse)
+    async def as_fast_response() -> ModelJSONResponse:
+        return ModelJSONResponse(response)
+
+    cases = {
+        "legacy": lambda: legacy(response),
+        "dump_json": lambda: dump_json(response),
+        "fastapi route": asgi_caller(app, "/model"),
+        "ModelJSONResponse route": asgi_caller(app, "/fast"),
+    }
+    reference = json.loads(legacy(response))
+    print(
+        f"ScoreResponse with {args.results} results, best of {args.repeat} "
+        f"(orjson {'available' if orjson else 'missing'})"
+    )
+    baseline = None
+    for label, fn in cases.items():
+        body = fn()
+        assert json.loads(body) == reference, f"{label} output differs"
+        best = best_of(args.repeat, fn)
+        baseline = baseline or best
+        print(
+            f"  {label:<24} {best * 1e3:8.3f} ms  {baseline / best:6.1f}x  {len(body):,} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Benchmark building ``ProfileInput`` models from Helix search records.
+
+Times ``_records_to_profiles`` (one batched pydantic-core validation) against
+a frozen copy of the baseline version (one validation per model) and against
+pydantic's ``model_construct`` on normalised records. It checks that all
+three produce the same profiles and that the baseline and current versions
+drop the same malformed legacy record, then times serialising them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models.schemas import ProfileActivitySignals, ProfileInput
+from app.responses import dump_json
+from app.routers.profiles import _records_to_profiles
+from app.services.helixdb_service import _extract_professor_properties
+
+logger = logging.getLogger(__name__)
+
+
+# Frozen copy of the baseline implementation (its in-loop schema import hoisted),
+# kept as the benchmark baseline.
+def baseline_records_to_profiles(records: List[dict]) -> List[ProfileInput]:
+    profiles: List[ProfileInput] = []
+    for record in records:
+        props = record if isinstance(record, dict) else {}
+        if not props:
+            continue
+        keywords = props.get("keywords") or []
+        if isinstance(keywords, str):
+            keywords = [part.strip() for part in keywords.split(",") if part.strip()]
+        elif not isinstance(keywords, list):
+            keywords = [str(keywords)]
+
+        profile_id = (
+            props.get("profile_id")
+            or props.get("id")
+            or props.get("_id")
+            or props.get("profile_url")
+            or str(uuid.uuid4())
+        )
+        name = props.get("name") or props.get("profile_url") or "Unknown Professor"
+        summary = props.get("summary") or ""
+
+        # Extract activity_signals from flattened fields or nested object
+        activity_signals = None
+        if props.get("activity_signals"):
+            signals_data = props.get("activity_signals")
+            if isinstance(signals_data, dict):
+                activity_signals = ProfileActivitySignals(**signals_data)
+            elif isinstance(signals_data, ProfileActivitySignals):
+                activity_signals = signals_data
+        elif any(
+            props.get(key)
+            for key in ["recent_publications", "news_mentions", "hiring", "last_updated"]
+        ):
+            activity_signals = ProfileActivitySignals(
+                recent_publications=props.get("recent_publications") or [],
+                news_mentions=props.get("news_mentions") or [],
+                hiring=props.get("hiring", False),
+                last_updated=props.get("last_updated") or "",
+            )
+
+        try:
+            profile = ProfileInput(
+                profile_id=str(profile_id),
+                name=str(name),
+                title=props.get("title"),
+                department=props.get("department"),
+                summary=str(summary),
+                keywords=[str(keyword) for keyword in keywords if keyword],
+                activity_signals=activity_signals,
+            )
+        except Exception as exc:
+            logger.debug("Skipping malformed Helix record %s: %s", props, exc)
+            continue
+        profiles.append(profile)
+
+    return profiles
+
+
+def model_construct_records_to_profiles(records: List[dict]) -> List[ProfileInput]:
+    return [
+        ProfileInput.model_construct(
+            profile_id=str(props.get("profile_id") or props.get("profile_url")),
+            name=str(props.get("name") or "Unknown Professor"),
+            title=props.get("title"),
+            department=props.get("department"),
+            summary=str(props.get("summary") or ""),
+            keywords=[str(keyword) for keyword in props.get("keywords") or [] if keyword],
+            activity_signals=ProfileActivitySignals.model_construct(
+                **props["activity_signals"]
+            ),
+        )
+        for props in records
+    ]
+
+
+def synthetic_record(idx: int) -> Dict[str, Any]:
+    return {
+        "profile_id": f"https://profiles.example.edu/prof{idx}",
+        "name": f"Professor {idx}",
+        "title": "Associate Professor",
+        "department": "Bioengineering",
+        "profile_url": f"https://profiles.example.edu/prof{idx}",
+        "summary": "Computational models of cardiac tissue and machine learning for imaging.",
+        "keywords": ["cardiac", "imaging", "machine learning", "biomechanics"],
+        "recent_publications": [f"Study {idx}.{pub} of cardiac mechanics" for pub in range(5)],
+        "news_mentions": [],
+        "hiring": idx % 3 == 0,
+        "last_updated": "2025-06-01T00:00:00Z",
+    }
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return min(samples)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    records = [_extract_professor_properties(synthetic_record(idx)) for idx in range(args.records)]
+
+    builders = {
+        "baseline": baseline_records_to_profiles,
+        "model_construct": model_construct_records_to_profiles,
+        "current": _records_to_profiles,
+    }
+    built = {label: build(records) for label, build in builders.items()}
+    reference = [profile.model_dump() for profile in built["baseline"]]
+    same = all(
+        [profile.model_dump() for profile in profiles] == reference for profiles in built.values()
+    )
+    print(f"{args.records} records, profiles {'match' if same else 'MISMATCH'}")
+    malformed = records[:3] + [{**records[3], "title": 7}]
+    kept = [
+        [profile.profile_id for profile in build(malformed)]
+        for build in (baseline_records_to_profiles, _records_to_profiles)
+    ]
+    assert kept[0] == kept[1] and len(kept[1]) == 3, "malformed record handling differs"
+
+    baseline = None
+    for label, build in builders.items():
+        fn = lambda build=build: build(records)
+        best = best_of(args.repeat, fn)
+        baseline = baseline or best
+        print(
+            f"  {label:<16} {best * 1e3:7.2f} ms  {best / args.records * 1e6:6.2f} us/record  "
+            f"{baseline / best:5.1f}x"
+        )
+    for label in ("baseline", "current"):
+        profiles = built[label]
+        best = best_of(args.repeat, lambda: [dump_json(profile) for profile in profiles])
+        print(f"  serialise {label:<16} {best * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
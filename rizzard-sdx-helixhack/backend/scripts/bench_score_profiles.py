@@ -0,0 +1,270 @@
+"""Benchmark ``score_profiles`` end to end with the LLM disabled.
+
+Candidates are drawn from ``data/professors.py`` with distinct ids. The
+profile texts are embedded once up front (with the configured model) and
+``_prepare_embeddings`` is pointed at those vectors, so the figures cover
+everything in ``score_profiles`` except the model forward pass, which is the
+same for every variant. Variants:
+
+- ``baseline``: a frozen copy of the previous list-based pipeline (per-profile
+  features, a ``ScoreBreakdown`` and rationale per candidate);
+- ``cold``: the array pipeline with an empty feature store;
+- ``warm``: the array pipeline with the candidates' features already stored;
+- ``warm, top_k``: as ``warm``, returning only the best ``--top-k`` results.
+
+The baseline and the array pipeline must serialise to identical JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.models.schemas import (
+    ProfileActivitySignals,
+    ProfileInput,
+    ScoreBreakdown,
+    ScoreRequest,
+    ScoreResponse,
+    ScoreResult,
+)
+from app.responses import dump_json
+from app.services import match
+from app.services.embedding import embed_texts_array
+from app.services.feature_store import get_feature_store
+from app.services.llm import generate_score_summary
+from app.services.scoring import (
+    COMPATIBILITY_WEIGHT,
+    FEASIBILITY_WEIGHT,
+    SEMANTIC_WEIGHT,
+)
+from app.services.similarity import cosine_similarity_matrix
+from app.services.text import extract_query_keywords, extract_tokens, merge_keywords
+from data.professors import UCSD_PROFESSORS
+
+QUERY = "machine learning for protein structure and drug discovery"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+# Frozen copy of the list-based pipeline, kept as the benchmark baseline.
+def keyword_overlap_score(query_tokens: Iterable[str], profile_tokens: Iterable[str]) -> float:
+    """Compute keyword overlap ratio between query and profile tokens."""
+    query_set = {token.lower() for token in query_tokens if token}
+    profile_set = {token.lower() for token in profile_tokens if token}
+
+    if not query_set or not profile_set:
+        return 0.0
+
+    overlap = query_set.intersection(profile_set)
+    return len(overlap) / len(query_set)
+
+
+def normalize_list(scores: List[float]) -> List[float]:
+    arr = np.asarray(scores, dtype=np.float32)
+    if arr.size == 0:
+        return []
+    min_val = float(np.min(arr))
+    max_val = float(np.max(arr))
+    if max_val - min_val < 1e-6:
+        return [0.0 for _ in scores]
+    return [float((s - min_val) / (max_val - min_val)) for s in scores]
+
+
+def baseline_score_profiles(payload: ScoreRequest, settings) -> ScoreResponse:
+    profiles = payload.profiles
+    query_tokens = extract_query_keywords(payload.user_query)
+    keyword_sets = []
+    for profile in profiles:
+        tokens = list(profile.keywords)
+        tokens.extend(extract_tokens(profile.summary))
+        if profile.department:
+            tokens.extend(extract_tokens(profile.department))
+        keyword_sets.append(merge_keywords(tokens))
+    query_embedding, profile_embeddings, model_name = match._prepare_embeddings(
+        payload.user_query, profiles, settings=settings
+    )
+    semantic_scores = cosine_similarity_matrix([query_embedding], profile_embeddings)[0].tolist()
+
+    raw_scores: List[float] = []
+    compatibility_details: List[dict] = []
+    seen_departments: set = set()
+    for profile, keywords in zip(profiles, keyword_sets):
+        keyword_score = keyword_overlap_score(query_tokens, keywords)
+        department = (profile.department or "").strip().lower()
+        diversity_bonus = 0.1 if department and department not in seen_departments else 0.0
+        seniority_bonus = 0.0
+        if profile.title:
+            lowered_title = profile.title.lower()
+            if "assistant" in lowered_title or "associate" in lowered_title:
+                seniority_bonus = 0.05
+        total_score = keyword_score + diversity_bonus + seniority_bonus
+        raw_scores.append(total_score)
+        compatibility_details.append(
+            {
+                "keyword_overlap": keyword_score,
+                "department_bonus": diversity_bonus,
+                "seniority_bonus": seniority_bonus,
+                "raw_score": total_score,
+            }
+        )
+        if profile.department:
+            seen_departments.add(profile.department.strip().lower())
+    compatibility_scores = normalize_list(raw_scores)
+    for detail, norm in zip(compatibility_details, compatibility_scores):
+        detail["normalized_score"] = norm
+
+    recency: List[float] = []
+    feasibility_details: List[dict] = []
+    for profile in profiles:
+        signals = profile.activity_signals
+        score = signals.recency_score() if signals else 0.5
+        recency.append(score)
+        feasibility_details.append({"has_activity_signals": bool(signals), "raw_score": score})
+    feasibility_scores = normalize_list(recency)
+    for detail, norm in zip(feasibility_details, feasibility_scores):
+        detail["normalized_score"] = norm
+
+    results: List[ScoreResult] = []
+    for profile, s, c, f, comp_detail, feas_detail in zip(
+        profiles,
+        semantic_scores,
+        compatibility_scores,
+        feasibility_scores,
+        compatibility_details,
+        feasibility_details,
+    ):
+        final = SEMANTIC_WEIGHT * s + COMPATIBILITY_WEIGHT * c + FEASIBILITY_WEIGHT * f
+        breakdown = ScoreBreakdown(
+            semantic=max(0.0, min(1.0, s)),
+            compatibility=max(0.0, min(1.0, c)),
+            feasibility=max(0.0, min(1.0, f)),
+            final_score=max(0.0, min(1.0, final)),
+        )
+        rationale: Dict[str, object] = {
+            "semantic_score": s,
+            "compatibility_details": comp_detail,
+            "feasibility_details": feas_detail,
+            "embedding_model": model_name,
+        }
+        summary_text = generate_score_summary(
+            settings=settings,
+            user_query=payload.user_query,
+            profile=profile,
+            scores=breakdown,
+            rationale=rationale,
+        )
+        results.append(
+            ScoreResult(
+                profile=profile, scores=breakdown, rationale=rationale, summary_text=summary_text
+            )
+        )
+    return ScoreResponse(results=results)
+
+
+def build_profiles(count: int) -> List[ProfileInput]:
+    profiles: List[ProfileInput] = []
+    for idx in range(count):
+        record = UCSD_PROFESSORS[idx % len(UCSD_PROFESSORS)]
+        profiles.append(
+            ProfileInput(
+                profile_id=f"{record['profile_id']}-{idx}",
+                name=record["name"],
+                title=record.get("title"),
+                department=record.get("department") if idx % 5 else f"Department {idx % 97}",
+                summary=record.get("summary", ""),
+                keywords=record.get("keywords", []),
+                activity_signals=ProfileActivitySignals(
+                    recent_publications=record.get("recent_publications") or [],
+                    news_mentions=record.get("news_mentions") or [],
+                    hiring=record.get("hiring", False),
+                    last_updated=record.get("last_updated") or "",
+                )
+                if idx % 4
+                else None,
+            )
+        )
+    return profiles
+
+
+def install_precomputed_embeddings(profiles: List[ProfileInput], settings) -> None:
+    """Embed each distinct profile text once and serve ``_prepare_embeddings`` from that."""
+    texts = [match._build_profile_text(profile) for profile in profiles]
+    distinct = sorted(set(texts))
+    matrix, model_name = embed_texts_array(distinct + [QUERY], normalize=True, settings=settings)
+    rows = {text: row for row, text in enumerate(distinct)}
+    query_embedding = matrix[-1].tolist()
+
+    def prepare(user_query, candidates, settings=None):
+        picks = [rows[match._build_profile_text(profile)] for profile in candidates]
+        return query_embedding, matrix[picks], model_name
+
+    match._prepare_embeddings = prepare
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return min(samples)
+
+
+def main() -> None:
+    args = parse_args()
+    # Without an API key the baseline logs a warning per candidate; only the
+    # level check is timed, not the log output.
+    logging.getLogger("app.services.llm").setLevel(logging.ERROR)
+    settings = get_settings().model_copy(
+        update={"claude_api_key": None, "feature_store": True, "embedding_warmup": False}
+    )
+    print(f"score_profiles with the LLM disabled, best of {args.repeat}")
+    for count in args.candidates:
+        profiles = build_profiles(count)
+        install_precomputed_embeddings(profiles, settings)
+        request = ScoreRequest(user_query=QUERY, profiles=profiles)
+        top_request = ScoreRequest(user_query=QUERY, profiles=profiles, top_k=args.top_k)
+
+        def run(payload: ScoreRequest, *, cold: bool = False) -> ScoreResponse:
+            if cold:
+                get_feature_store(settings).clear()
+            return match.score_profiles(payload, settings=settings)
+
+        reference = dump_json(baseline_score_profiles(request, settings))
+        assert dump_json(run(request, cold=True)) == reference, "array pipeline output differs"
+
+        cases = {
+            "baseline": lambda: baseline_score_profiles(request, settings),
+            "cold": lambda: run(request, cold=True),
+            # The cold runs leave every candidate's features in the store.
+            "warm": lambda: run(request),
+            f"warm, top_k={args.top_k}": lambda: run(top_request),
+        }
+        print(f"{count} candidates")
+        baseline = None
+        for label, fn in cases.items():
+            best = best_of(args.repeat, fn)
+            baseline = baseline or best
+            print(f"  {label:<16} {best * 1e3:9.2f} ms  {baseline / best:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
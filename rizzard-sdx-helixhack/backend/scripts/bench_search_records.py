@@ -0,0 +1,165 @@
+"""Benchmark projected search records against whole-vertex records.
+
+Compares the JSON payload size of a search response with and without vectors
+and bookkeeping fields, and the per-record cost of decoding that response,
+normalising the records (previous multi-step ``_extract_professor_properties``
+vs the single pass) and building profiles with ``_records_to_profiles``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.routers.profiles import _records_to_profiles
+from app.services.helixdb_service import _extract_professor_properties
+
+PROJECTED_FIELDS = (
+    "profile_id",
+    "name",
+    "title",
+    "department",
+    "profile_url",
+    "summary",
+    "keywords",
+    "recent_publications",
+    "news_mentions",
+    "hiring",
+    "last_updated",
+)
+
+
+# Frozen copy of the normalisation used before projected queries, kept as the
+# benchmark baseline.
+def legacy_extract_properties(record: Dict[str, Any]) -> Dict[str, Any]:
+    properties = dict(record)
+    node_props = record.get("properties")
+    if isinstance(node_props, dict):
+        properties.update(node_props)
+    keywords = properties.get("keywords") or []
+    if isinstance(keywords, str):
+        keywords = [keyword.strip() for keyword in keywords.split(",") if keyword.strip()]
+    elif not isinstance(keywords, list):
+        keywords = [str(keywords)]
+    properties["keywords"] = keywords
+    properties.setdefault("profile_id", record.get("profile_id", ""))
+    properties.setdefault("profile_url", record.get("profile_url"))
+    properties.setdefault("name", record.get("name"))
+    properties.setdefault("title", record.get("title", ""))
+    properties.setdefault("department", record.get("department"))
+    properties.setdefault("summary", record.get("summary"))
+    properties.setdefault("recent_publications", record.get("recent_publications", []))
+    properties.setdefault("news_mentions", record.get("news_mentions", []))
+    properties.setdefault("hiring", record.get("hiring", False))
+    properties.setdefault("last_updated", record.get("last_updated", ""))
+    properties.setdefault("rerank_strategy", record.get("rerank_strategy", "hybrid"))
+    if "activity_signals" not in properties:
+        properties["activity_signals"] = {
+            "recent_publications": properties.get("recent_publications", []),
+            "news_mentions": properties.get("news_mentions", []),
+            "hiring": properties.get("hiring", False),
+            "last_updated": properties.get("last_updated", ""),
+        }
+    identifier = (
+        properties.get("id")
+        or record.get("id")
+        or record.get("_id")
+        or properties.get("profile_id")
+        or properties.get("profile_url")
+    )
+    if identifier:
+        properties["id"] = str(identifier)
+    return properties
+
+
+def synthetic_vertex(idx: int, dimensions: int, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "id": f"vertex-{idx}",
+        "label": "Professor",
+        "profile_id": f"https://profiles.example.edu/prof{idx}",
+        "name": f"Professor {idx}",
+        "title": "Associate Professor",
+        "department": "Bioengineering",
+        "profile_url": f"https://profiles.example.edu/prof{idx}",
+        "summary": "Computational models of cardiac tissue and machine learning for imaging. " * 3,
+        "keywords": ["cardiac", "imaging", "machine learning", "biomechanics"],
+        "recent_publications": [f"Study {idx}.{pub} of cardiac mechanics" for pub in range(5)],
+        "news_mentions": [],
+        "hiring": idx % 3 == 0,
+        "last_updated": "2025-06-01T00:00:00Z",
+        "rerank_strategy": "hybrid",
+        "data": [rng.uniform(-1.0, 1.0) for _ in range(dimensions)],
+    }
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100, help="Search results per response")
+    parser.add_argument("--dimensions", type=int, default=384, help="Embedding dimensions")
+    parser.add_argument("--repeat", type=int, default=200, help="Timing iterations")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    rng = random.Random(0)
+    vertices = [synthetic_vertex(idx, args.dimensions, rng) for idx in range(args.records)]
+    projected = [{key: vertex[key] for key in PROJECTED_FIELDS} for vertex in vertices]
+
+    full_body = json.dumps({"professors": vertices})
+    projected_body = json.dumps({"professors": projected})
+    print(f"{args.records} records, {args.dimensions}-d vectors")
+    print(f"  payload whole vertices {len(full_body) / 1024:8.1f} KiB")
+    print(f"  payload projected      {len(projected_body) / 1024:8.1f} KiB")
+
+    def legacy() -> List[Any]:
+        records = json.loads(full_body)["professors"]
+        return _records_to_profiles([legacy_extract_properties(record) for record in records])
+
+    def current() -> List[Any]:
+        records = json.loads(projected_body)["professors"]
+        return _records_to_profiles([_extract_professor_properties(record) for record in records])
+
+    legacy_profiles = [profile.model_dump() for profile in legacy()]
+    current_profiles = [profile.model_dump() for profile in current()]
+    status = "match" if legacy_profiles == current_profiles else "MISMATCH"
+
+    print(f"  profiles {status}")
+    for label, normalise, build in (
+        (
+            "legacy     ",
+            lambda: [legacy_extract_properties(record) for record in vertices],
+            legacy,
+        ),
+        (
+            "single-pass",
+            lambda: [_extract_professor_properties(record) for record in projected],
+            current,
+        ),
+    ):
+        normalise_time = measure(normalise, args.repeat)
+        total_time = measure(build, args.repeat)
+        print(
+            f"  {label} normalise {normalise_time / args.records * 1e6:6.2f} us/record, "
+            f"decode+normalise+profiles {total_time / args.records * 1e6:6.2f} us/record"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark float64 vs float32 vector transport for HelixDB queries.
+
+Offline it compares JSON payload size and encode/decode time for insert and
+search payloads built from ``ndarray.tolist()`` (the old path) and from
+``float32_to_list``. With ``--helix`` it also times live searches against the
+configured HelixDB, and with ``--insert`` live inserts of throwaway vertices
+(deleted again afterwards).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.services.helixdb_service import HelixDBService, _extract_vertex_id
+from app.services.vectors import float32_to_list
+
+BENCH_URL_PREFIX = "https://bench.invalid/professor/"
+
+
+def synthetic_vectors(count: int, dimensions: int) -> np.ndarray:
+    vectors = np.random.default_rng(0).standard_normal((count, dimensions)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def insert_payload(idx: int, vector: List[float]) -> Dict[str, Any]:
+    return {
+        "profile_id": f"bench-{idx}",
+        "name": f"Bench Professor {idx}",
+        "title": "",
+        "department": "Benchmarking",
+        "profile_url": f"{BENCH_URL_PREFIX}{idx}",
+        "summary": "Synthetic vertex written by bench_vector_f32.py",
+        "keywords": [],
+        "recent_publications": [],
+        "news_mentions": [],
+        "hiring": False,
+        "last_updated": "",
+        "rerank_strategy": "hybrid",
+        "vector": vector,
+    }
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(label: str, samples: List[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"  {label:<28} p50 {statistics.median(samples) * 1e3:8.3f} ms  p95 {p95 * 1e3:8.3f} ms")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--vectors", type=int, default=200, help="Vectors per bulk payload")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20, help="Search limit for live queries")
+    parser.add_argument("--helix", action="store_true", help="Time live searches")
+    parser.add_argument("--insert", action="store_true", help="Also time live inserts")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    vectors = synthetic_vectors(args.vectors, args.dimensions)
+    encoders = {"float64 tolist": lambda arr: arr.tolist(), "float32 compact": float32_to_list}
+
+    print(f"{args.vectors} x {args.dimensions}-d vectors")
+    for label, encode in encoders.items():
+        single = json.dumps({"vector": encode(vectors[0]), "limit": args.limit})
+        bulk = json.dumps([insert_payload(i, v) for i, v in enumerate(encode(vectors))])
+        encode_time = statistics.median(timed(lambda: json.dumps(encode(vectors)), args.repeat))
+        decode_time = statistics.median(timed(lambda: json.loads(bulk), args.repeat))
+        print(
+            f"  {label:<16} search payload {len(single) / 1024:6.1f} KiB, "
+            f"bulk insert payload {len(bulk) / 1024:8.1f} KiB, "
+            f"encode {encode_time * 1e3:6.1f} ms, decode {decode_time * 1e3:6.1f} ms"
+        )
+
+    if not (args.helix or args.insert):
+        return
+
+    helix = HelixDBService(settings=get_settings())
+    print(f"Live HelixDB ({args.repeat} calls each)")
+    for label, encode in encoders.items():
+        query_vector = encode(vectors[0])
+        samples = timed(
+            lambda: helix._query(
+                "SearchSimilarProfessors", {"vector": query_vector, "limit": args.limit}
+            ),
+            args.repeat,
+        )
+        report(f"search {label}", samples)
+
+    if not args.insert:
+        return
+    for label, encode in encoders.items():
+        encoded = encode(vectors[: args.repeat])
+        inserted: List[str] = []
+        samples = []
+        for idx, vector in enumerate(encoded):
+            start = time.perf_counter()
+            result = helix._query("InsertProfessor", insert_payload(idx, vector), retry=False)
+            samples.append(time.perf_counter() - start)
+            inserted.append(_extract_vertex_id(result))
+        report(f"insert {label}", samples)
+        for vertex_id in inserted:
+            helix.delete_professor(vertex_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Measure resident memory per worker for ``scripts/serve.py``.
+
+Starts the server with and without ``--no-preload``, waits until every
+worker has loaded the model and served a few ``/embed`` requests, then reads
+RSS, PSS and USS for the parent and each worker from ``/proc``. PSS charges
+shared pages proportionally, so its sum is the real footprint of the
+deployment; compare it between the two modes. Linux only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import requests
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.metrics import read_process_memory
+
+MIB = 2**20
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--requests", type=int, default=20, help="/embed calls before measuring")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Seconds to wait for readiness")
+    return parser.parse_args()
+
+
+def child_pids(pid: int) -> List[int]:
+    try:
+        return [int(child) for child in Path(f"/proc/{pid}/task/{pid}/children").read_text().split()]
+    except OSError:
+        return []
+
+
+def wait_until_ready(base_url: str, server: subprocess.Popen, workers: int, timeout: float) -> None:
+    """Wait until ``workers`` distinct worker pids report a loaded model."""
+    deadline = time.monotonic() + timeout
+    ready: set = set()
+    while len(ready) < workers:
+        if server.poll() is not None:
+            raise SystemExit(f"serve.py exited with status {server.returncode}")
+        if time.monotonic() > deadline:
+            raise SystemExit(f"Only {len(ready)} of {workers} workers became ready")
+        try:
+            if requests.get(f"{base_url}/health/ready", timeout=5).status_code == 200:
+                ready.add(requests.get(f"{base_url}/metrics", timeout=5).json()["process"]["pid"])
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+
+
+def measure(args: argparse.Namespace, preload: bool) -> Dict[str, float]:
+    command = [
+        sys.executable,
+        str(BACKEND_DIR / "scripts" / "serve.py"),
+        "--workers",
+        str(args.workers),
+        "--port",
+        str(args.port),
+        "--log-level",
+        "warning",
+    ]
+    if not preload:
+        command.append("--no-preload")
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(command, cwd=BACKEND_DIR)
+    try:
+        wait_until_ready(base_url, server, args.workers, args.timeout)
+        for idx in range(args.requests):
+            requests.post(f"{base_url}/embed", json={"texts": [f"warm request {idx}"]}, timeout=30)
+        time.sleep(1.0)
+
+        label = "preloaded (shared)" if preload else "per-worker load"
+        print(f"\n{label}, {args.workers} workers")
+        print(f"  {'process':<10} {'RSS MiB':>9} {'PSS MiB':>9} {'USS MiB':>9}")
+        totals = {"rss": 0.0, "pss": 0.0, "uss": 0.0}
+        for role, pid in [("parent", server.pid)] + [
+            (f"worker {idx}", pid) for idx, pid in enumerate(child_pids(server.pid))
+        ]:
+            memory = read_process_memory(pid)
+            row = {key: memory.get(f"{key}_bytes", 0) / MIB for key in totals}
+            for key in totals:
+                totals[key] += row[key]
+            print(f"  {role:<10} {row['rss']:9.1f} {row['pss']:9.1f} {row['uss']:9.1f}")
+        print(f"  {'total':<10} {totals['rss']:9.1f} {totals['pss']:9.1f} {totals['uss']:9.1f}")
+        return totals
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    args = parse_args()
+    if not Path("/proc/self/smaps_rollup").exists():
+        raise SystemExit("PSS needs /proc/<pid>/smaps_rollup (Linux 4.14+)")
+    shared = measure(args, preload=True)
+    separate = measure(args, preload=False)
+    saved = separate["pss"] - shared["pss"]
+    print(
+        f"\nPreloading saves {saved:.0f} MiB PSS in total "
+        f"({saved / max(1, args.workers):.0f} MiB per worker)."
+    )
+
+
+if __name__ == "__main__":
+    main()
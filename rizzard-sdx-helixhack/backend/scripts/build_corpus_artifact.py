@@ -0,0 +1,82 @@
+"""Compile ``data/professors.py`` into a corpus artifact with float32 embeddings.
+
+The artifact (``data/ucsd_professors.npz`` by default) holds the records, their
+embeddings, the model name and per-record content hashes. Rebuilding only
+re-encodes records whose contents changed; ``--check`` reports whether the
+artifact is current without loading the model.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.services.corpus_artifact import (
+    CorpusArtifactError,
+    build_corpus_artifact,
+    default_artifact_path,
+    load_corpus_artifact,
+    save_corpus_artifact,
+)
+from data.professors import UCSD_PROFESSORS
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the professor corpus artifact")
+    parser.add_argument("--output", type=Path, default=default_artifact_path("ucsd"))
+    parser.add_argument("--force", action="store_true", help="Re-encode every record")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if the artifact is missing or stale; build nothing",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    settings = get_settings()
+    model_name = settings.embedding_model_name
+
+    previous = None
+    try:
+        previous = load_corpus_artifact(args.output)
+    except CorpusArtifactError as exc:
+        print(f"No usable artifact: {exc}")
+
+    if args.check:
+        if previous is not None and previous.is_current(UCSD_PROFESSORS, model_name):
+            print(f"{args.output} is current ({len(previous)} records, {previous.model_name}).")
+            return
+        raise SystemExit(f"{args.output} is missing or stale; run build_corpus_artifact.py.")
+
+    def embed(texts):
+        from app.services.embedding import embed_texts_array
+
+        return embed_texts_array(texts, settings=settings)
+
+    started = time.perf_counter()
+    artifact, encoded = build_corpus_artifact(
+        UCSD_PROFESSORS,
+        embed,
+        model_name=model_name,
+        previous=None if args.force else previous,
+    )
+    save_corpus_artifact(artifact, args.output)
+    print(
+        f"Wrote {args.output}: {len(artifact)} records, "
+        f"{artifact.embeddings.shape[1] if len(artifact) else 0}-d {model_name} embeddings, "
+        f"{encoded} encoded, {len(artifact) - encoded} reused "
+        f"({time.perf_counter() - started:.2f}s)."
+    )
+
+
+if __name__ == "__main__":
+    main()
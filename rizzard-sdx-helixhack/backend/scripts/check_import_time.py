@@ -0,0 +1,97 @@
+"""Check that importing the application stays fast and free of heavy libraries.
+
+Imports ``app.main`` in fresh interpreters, reports the best wall time and the
+slowest top-level packages (from ``python -X importtime``), and exits non-zero
+when the import exceeds ``--budget-ms`` or pulls in a module that must load
+lazily (the embedding model stack, the Anthropic SDK, firecrawl). Run it in
+CI or before merging changes that add imports to routers or services.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+LAZY_MODULES = ("sentence_transformers", "torch", "transformers", "anthropic", "firecrawl")
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters to time")
+    parser.add_argument("--top", type=int, default=10, help="Slowest packages to list")
+    return parser.parse_args()
+
+
+def probe(importtime: bool = False) -> Tuple[dict, str]:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", PROBE.format(lazy=LAZY_MODULES)]
+    completed = subprocess.run(command, cwd=BACKEND_DIR, capture_output=True, text=True, check=False)
+    if completed.returncode != 0:
+        raise SystemExit(f"Importing app.main failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def slowest_packages(importtime_log: str, top: int) -> List[Tuple[str, float]]:
+    """Cumulative import time of each top-level package outside ``app``.
+
+    A package nested inside another is counted for both, so this answers
+    "what does importing X cost", not a partition of the total.
+    """
+    totals: Dict[str, float] = {}
+    for line in importtime_log.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        name = match.group(2)
+        if "." in name or name == "app" or name.startswith("_") or name in totals:
+            continue
+        totals[name] = int(match.group(1)) / 1000.0
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main() -> None:
+    args = parse_args()
+    runs = [probe()[0] for _ in range(max(1, args.repeat))]
+    best_ms = min(run["seconds"] for run in runs) * 1000.0
+    loaded = sorted({module for run in runs for module in run["loaded"]})
+
+    _, log = probe(importtime=True)
+    print(f"import app.main: best of {len(runs)} = {best_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    print("Slowest third-party/stdlib packages (cumulative):")
+    for package, millis in slowest_packages(log, args.top):
+        print(f"  {package:<28} {millis:8.1f} ms")
+
+    failures = []
+    if best_ms > args.budget_ms:
+        failures.append(f"import took {best_ms:.0f} ms, over the {args.budget_ms:.0f} ms budget")
+    if loaded:
+        failures.append(f"modules that must load lazily were imported: {', '.join(loaded)}")
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        raise SystemExit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
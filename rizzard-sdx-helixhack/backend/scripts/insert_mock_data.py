@@ -6,6 +6,7 @@ to insert real UCSD professor data from db/schema.hx.
 
 from __future__ import annotations
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -22,6 +23,7 @@ spec.loader.exec_module(config_module)
 get_settings = config_module.get_settings
 
 # Import services
+from app.services.bulk_loader import add_loader_arguments, loader_from_args
 from app.services.embedding import embed_texts
 from app.services.helixdb_service import HelixDBService
 
@@ -159,91 +161,53 @@ MOCK_PROFESSORS = [
 ]
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Insert mock professor data into HelixDB")
+    parser.add_argument(
+        "--skip-schema", action="store_true", help="Do not deploy the schema first"
+    )
+    add_loader_arguments(parser)
+    return parser.parse_args()
+
+
 def main() -> None:
     """Insert mock professor data into HelixDB."""
+    args = parse_args()
     print("Initializing HelixDB service...")
     settings = get_settings()
     helix_service = HelixDBService(settings=settings)
 
-    print("Initializing schema...")
-    try:
-        schema_initialized = helix_service.initialize_schema()
-        if schema_initialized:
-            print("✓ Schema initialized successfully")
-        else:
-            print("⚠ Schema initialization returned False (may already be initialized)")
-    except Exception as exc:
-        print(f"⚠ Schema initialization warning: {exc}")
-        print("Continuing anyway...")
+    if not (args.skip_schema or args.dry_run):
+        print("Initializing schema...")
+        try:
+            schema_initialized = helix_service.initialize_schema()
+            if schema_initialized:
+                print("✓ Schema initialized successfully")
+            else:
+                print("⚠ Schema initialization returned False (may already be initialized)")
+        except Exception as exc:
+            print(f"⚠ Schema initialization warning: {exc}")
+            print("Continuing anyway...")
 
     print(f"\nGenerating embeddings for {len(MOCK_PROFESSORS)} professors...")
     summaries = [prof["summary"] for prof in MOCK_PROFESSORS]
     embeddings, model_name = embed_texts(summaries, settings=settings)
     print(f"✓ Generated embeddings using model: {model_name}")
 
-    print(f"\nInserting {len(MOCK_PROFESSORS)} professors into HelixDB...")
-    success_count = 0
-    error_count = 0
-
-    for idx, professor in enumerate(MOCK_PROFESSORS):
-        try:
-            embedding = embeddings[idx] if idx < len(embeddings) else []
-            if not embedding:
-                print(f"⚠ Warning: No embedding for {professor['name']}, skipping...")
-                error_count += 1
-                continue
-
-            # Extract activity signals
-            activity_signals = {
-                "recent_publications": professor["recent_publications"],
-                "news_mentions": professor["news_mentions"],
-                "hiring": professor["hiring"],
-                "last_updated": professor["last_updated"],
-            }
-
-            # Build payload directly to bypass the "already exists" check
-            payload = {
-                "profile_id": professor["profile_id"],
-                "name": professor["name"],
-                "title": professor["title"],
-                "department": professor["department"],
-                "profile_url": professor["profile_url"],
-                "summary": professor["summary"],
-                "keywords": professor["keywords"],
-                "recent_publications": professor["recent_publications"],
-                "news_mentions": professor["news_mentions"],
-                "hiring": professor["hiring"],
-                "last_updated": professor["last_updated"],
-                "rerank_strategy": "hybrid",
-                "vector": embedding,
-            }
-
-            # Insert directly using the query (bypassing the "already exists" check)
-            print(f"Inserting {professor['name']}...")
-            result = helix_service.client.query("InsertProfessor", payload)
-            
-            # Extract vertex ID from result
-            if isinstance(result, dict):
-                helix_id = str(result.get("id") or result.get("vertex_id") or result.get("_id") or "unknown")
-            else:
-                helix_id = str(result)
-            
-            print(f"✓ Inserted: {professor['name']} (ID: {helix_id})")
-            success_count += 1
-        except Exception as exc:
-            print(f"✗ Error inserting {professor['name']}: {exc}")
-            error_count += 1
+    action = "Planning" if args.dry_run else "Loading"
+    print(f"\n{action} {len(MOCK_PROFESSORS)} professors into HelixDB...")
+    report = loader_from_args(helix_service, args).load(MOCK_PROFESSORS, embeddings)
 
     print(f"\n{'='*60}")
-    print(f"Summary:")
-    print(f"  Successfully inserted/updated: {success_count}")
-    print(f"  Errors: {error_count}")
-    print(f"  Total: {len(MOCK_PROFESSORS)}")
+    print("Summary:")
+    print("\n".join(report.summary_lines()))
     print(f"{'='*60}")
-    print("\n✓ Mock data insertion complete!")
-    print("You can now test the search functionality.")
+    if report.failed:
+        sys.exit(1)
+    if not args.dry_run:
+        print("\n✓ Mock data insertion complete!")
+        print("You can now test the search functionality.")
 
 
 if __name__ == "__main__":
     main()
-
@@ -1,7 +1,12 @@
-"""Script to insert real UCSD professor data into HelixDB."""
+"""Load the UCSD professor dataset into HelixDB.
+
+Safe to re-run: professors already stored are left alone unless their record
+changed, in which case they are replaced. ``--dry-run`` reports the plan.
+"""
 
 from __future__ import annotations
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -18,15 +23,26 @@ spec.loader.exec_module(config_module)
 get_settings = config_module.get_settings
 
 # Import services
-from app.services.embedding import embed_texts
+from app.services.bulk_loader import add_loader_arguments, loader_from_args
+from app.services.corpus_artifact import corpus_embeddings, default_artifact_path
 from app.services.helixdb_service import HelixDBService
 
 # Import professor data
 from data.professors import UCSD_PROFESSORS
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Insert UCSD professor data into HelixDB")
+    parser.add_argument(
+        "--skip-schema", action="store_true", help="Do not deploy the schema first"
+    )
+    add_loader_arguments(parser)
+    return parser.parse_args()
+
+
 def main() -> None:
     """Insert UCSD professor data into HelixDB."""
+    args = parse_args()
     professors = UCSD_PROFESSORS
     
     print(f"✓ Found {len(professors)} UCSD professors in data file")
@@ -39,77 +55,41 @@ def main() -> None:
     settings = get_settings()
     helix_service = HelixDBService(settings=settings)
     
-    print("Initializing schema...")
-    try:
-        schema_initialized = helix_service.initialize_schema()
-        if schema_initialized:
-            print("✓ Schema initialized successfully")
-        else:
-            print("⚠ Schema initialization returned False (may already be initialized)")
-    except Exception as exc:
-        print(f"⚠ Schema initialization warning: {exc}")
-        print("Continuing anyway...")
-    
-    print(f"\nGenerating embeddings for {len(professors)} professors...")
-    summaries = [prof.get("summary", "") or prof.get("name", "") for prof in professors]
-    embeddings, model_name = embed_texts(summaries, settings=settings)
-    print(f"✓ Generated embeddings using model: {model_name}")
-    
-    print(f"\nInserting {len(professors)} UCSD professors into HelixDB...")
-    success_count = 0
-    error_count = 0
-    
-    for idx, professor in enumerate(professors):
+    if not (args.skip_schema or args.dry_run):
+        print("Initializing schema...")
         try:
-            embedding = embeddings[idx] if idx < len(embeddings) else []
-            if not embedding:
-                print(f"⚠ Warning: No embedding for {professor.get('name', 'Unknown')}, skipping...")
-                error_count += 1
-                continue
-            
-            # Build payload
-            payload = {
-                "profile_id": professor.get("profile_id", ""),
-                "name": professor.get("name", ""),
-                "title": professor.get("title", ""),
-                "department": professor.get("department", ""),
-                "profile_url": professor.get("profile_url", ""),
-                "summary": professor.get("summary", ""),
-                "keywords": professor.get("keywords", []),
-                "recent_publications": professor.get("recent_publications", []),
-                "news_mentions": professor.get("news_mentions", []),
-                "hiring": professor.get("hiring", False),
-                "last_updated": professor.get("last_updated", ""),
-                "rerank_strategy": professor.get("rerank_strategy", "hybrid"),
-                "vector": embedding,
-            }
-            
-            # Insert directly using the query
-            print(f"Inserting {professor.get('name', 'Unknown')}...")
-            result = helix_service.client.query("InsertProfessor", payload)
-            
-            # Extract vertex ID from result
-            if isinstance(result, dict):
-                helix_id = str(result.get("id") or result.get("vertex_id") or result.get("_id") or "unknown")
+            schema_initialized = helix_service.initialize_schema()
+            if schema_initialized:
+                print("✓ Schema initialized successfully")
             else:
-                helix_id = str(result)
-            
-            print(f"✓ Inserted: {professor.get('name', 'Unknown')} (ID: {helix_id[:20]}...)")
-            success_count += 1
+                print("⚠ Schema initialization returned False (may already be initialized)")
         except Exception as exc:
-            print(f"✗ Error inserting {professor.get('name', 'Unknown')}: {exc}")
-            error_count += 1
+            print(f"⚠ Schema initialization warning: {exc}")
+            print("Continuing anyway...")
+    
+    artifact_path = Path(settings.corpus_artifact_path or default_artifact_path("ucsd"))
+    print(f"\nLoading embeddings for {len(professors)} professors from {artifact_path}...")
+    embeddings, model_name, encoded = corpus_embeddings(
+        professors, path=artifact_path, settings=settings
+    )
+    if encoded:
+        print(f"⚠ Encoded {encoded} professors missing from the artifact; run build_corpus_artifact.py")
+    print(f"✓ Loaded embeddings for model: {model_name}")
+    
+    action = "Planning" if args.dry_run else "Loading"
+    print(f"\n{action} {len(professors)} UCSD professors into HelixDB...")
+    report = loader_from_args(helix_service, args).load(professors, embeddings)
     
     print(f"\n{'='*60}")
-    print(f"Summary:")
-    print(f"  Successfully inserted: {success_count}")
-    print(f"  Errors: {error_count}")
-    print(f"  Total: {len(professors)}")
+    print("Summary:")
+    print("\n".join(report.summary_lines()))
     print(f"{'='*60}")
-    print("\n✓ UCSD professor data insertion complete!")
-    print("You can now search for professors using the search endpoint.")
+    if report.failed:
+        sys.exit(1)
+    if not args.dry_run:
+        print("\n✓ UCSD professor data insertion complete!")
+        print("You can now search for professors using the search endpoint.")
 
 
 if __name__ == "__main__":
     main()
-
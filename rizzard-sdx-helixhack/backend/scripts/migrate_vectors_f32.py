@@ -0,0 +1,143 @@
+"""Re-encode stored professor vectors through the ``[F32]`` HelixQL queries.
+
+Deploy the updated ``db/queries.hx`` first, then either:
+
+* ``rewrite --backup FILE`` – snapshot every vertex to FILE, then delete and
+  re-insert each one with a float32 vector (in place), or
+* ``export --output FILE`` followed by ``load --input FILE`` – move the data
+  through a JSON-lines file, e.g. into a freshly initialised instance.
+
+``--reembed`` recomputes vectors from the stored summaries instead of reusing
+the existing ones, which is needed when the stored vectors are missing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.services.embedding import embed_texts
+from app.services.helixdb_service import HelixDBService
+from app.services.vectors import float32_to_list
+
+PAGE_SIZE = 200
+PROFILE_FIELDS = (
+    "profile_id",
+    "name",
+    "title",
+    "department",
+    "profile_url",
+    "summary",
+    "keywords",
+    "rerank_strategy",
+)
+SIGNAL_FIELDS = ("recent_publications", "news_mentions", "hiring", "last_updated")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Migrate professor vectors to F32")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Write every vertex to a JSON-lines file")
+    export.add_argument("--output", type=Path, required=True)
+
+    load = commands.add_parser("load", help="Insert vertices from an exported file")
+    load.add_argument("--input", type=Path, required=True)
+    load.add_argument("--reembed", action="store_true", help="Recompute vectors from summaries")
+
+    rewrite = commands.add_parser("rewrite", help="Delete and re-insert every vertex in place")
+    rewrite.add_argument("--backup", type=Path, required=True, help="Snapshot written first")
+    rewrite.add_argument("--reembed", action="store_true", help="Recompute vectors from summaries")
+    return parser.parse_args()
+
+
+def iter_vertices(helix: HelixDBService) -> Iterator[Dict[str, Any]]:
+    offset = 0
+    while True:
+        page = helix.list_professors(offset=offset, limit=PAGE_SIZE)
+        if not page:
+            return
+        yield from page
+        offset += len(page)
+
+
+def to_row(vertex: Dict[str, Any]) -> Dict[str, Any]:
+    row = {key: vertex.get(key) for key in PROFILE_FIELDS}
+    row["activity_signals"] = {key: vertex.get(key) for key in SIGNAL_FIELDS}
+    row["id"] = vertex.get("id")
+    vector = vertex.get("vector")
+    row["vector"] = float32_to_list(vector) if vector else []
+    return row
+
+
+def export_vertices(helix: HelixDBService, path: Path) -> int:
+    count = 0
+    with path.open("w", encoding="utf-8") as handle:
+        for vertex in iter_vertices(helix):
+            handle.write(json.dumps(to_row(vertex)) + "\n")
+            count += 1
+    return count
+
+
+def read_rows(path: Path) -> List[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def fill_vectors(rows: List[Dict[str, Any]], reembed: bool) -> None:
+    pending = [row for row in rows if reembed or not row.get("vector")]
+    if not pending:
+        return
+    print(f"Embedding {len(pending)} summaries...")
+    texts = [row.get("summary") or row.get("name") or "" for row in pending]
+    embeddings, _ = embed_texts(texts, settings=get_settings())
+    for row, embedding in zip(pending, embeddings):
+        row["vector"] = embedding
+
+
+def insert_rows(helix: HelixDBService, rows: List[Dict[str, Any]], *, delete_first: bool) -> int:
+    failures = 0
+    for idx, row in enumerate(rows, start=1):
+        try:
+            if delete_first and row.get("id"):
+                helix.delete_professor(row["id"])
+            helix.insert_professor(row, row["vector"])
+        except Exception as exc:
+            failures += 1
+            print(f"[FAIL] {row.get('profile_url') or row.get('name')} :: {exc}")
+        if idx % 100 == 0:
+            print(f"  {idx}/{len(rows)} migrated")
+    return failures
+
+
+def main() -> None:
+    args = parse_args()
+    helix = HelixDBService(settings=get_settings())
+
+    if args.command == "export":
+        count = export_vertices(helix, args.output)
+        print(f"Exported {count} vertices to {args.output}")
+        return
+
+    if args.command == "rewrite":
+        count = export_vertices(helix, args.backup)
+        print(f"Backed up {count} vertices to {args.backup}")
+        rows = read_rows(args.backup)
+    else:
+        rows = read_rows(args.input)
+
+    fill_vectors(rows, args.reembed)
+    failures = insert_rows(helix, rows, delete_first=args.command == "rewrite")
+    print(f"Migrated {len(rows) - failures} / {len(rows)} vertices ({failures} failed).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Scrape URLs (or local fixture pages) and print the extracted professor records.
+
+Nothing is embedded or written to HelixDB, which makes this handy for checking
+how a scraper backend and ``extract_professor`` handle a page. With ``--serve``
+the HTML files in a directory are served from a throwaway local HTTP server and
+scraped through the direct-fetch backend.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.services.firecrawl_service import FirecrawlService, extract_professor
+from app.services.scraper_backends import (
+    BACKEND_DIRECT,
+    BACKEND_FIRECRAWL,
+    DirectFetchBackend,
+    ScraperRouter,
+)
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+
+def _serve_directory(directory: Path) -> ThreadingHTTPServer:
+    handler = functools.partial(_QuietHandler, directory=str(directory))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Preview scraper extraction output")
+    parser.add_argument("urls", nargs="*", help="URLs to scrape")
+    parser.add_argument(
+        "--backend",
+        choices=["auto", BACKEND_DIRECT, BACKEND_FIRECRAWL],
+        default="auto",
+        help="Force a backend instead of routing by domain",
+    )
+    parser.add_argument(
+        "--serve",
+        type=Path,
+        help="Serve *.html files from this directory locally and scrape them directly",
+    )
+    parser.add_argument("--markdown", action="store_true", help="Include converted markdown")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    settings = get_settings()
+
+    urls: List[str] = list(args.urls)
+    server = None
+    if args.serve:
+        server = _serve_directory(args.serve)
+        host, port = server.server_address[:2]
+        urls.extend(
+            f"http://{host}:{port}/{path.name}" for path in sorted(args.serve.glob("*.html"))
+        )
+        args.backend = BACKEND_DIRECT
+    if not urls:
+        raise SystemExit("No URLs supplied. Pass URLs or --serve DIRECTORY.")
+
+    router = ScraperRouter(settings=settings)
+    forced = None
+    if args.backend == BACKEND_DIRECT:
+        forced = DirectFetchBackend(settings=settings)
+    elif args.backend == BACKEND_FIRECRAWL:
+        forced = FirecrawlService(settings=settings)
+
+    try:
+        for url in urls:
+            backend = forced or router.backend_for(url)
+            payload = backend.scrape_url(url)
+            record = extract_professor(payload).to_dict()
+            if not args.markdown:
+                record.pop("markdown", None)
+            record["backend"] = backend.name
+            print(json.dumps(record, indent=2))
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
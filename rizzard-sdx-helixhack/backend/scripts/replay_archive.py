@@ -0,0 +1,141 @@
+"""Re-run extraction, embedding, and HelixDB insertion from the raw payload archive.
+
+Payloads written under ``RAW_ARCHIVE_DIR`` by the scrape orchestrator are read
+back from local disk and pushed through ``ScrapeOrchestrator.process_payloads``
+in parallel batches, so extraction changes can be applied without scraping
+again. ``--extract-only`` skips embedding and HelixDB entirely and runs the
+extractor across processes, which is useful for checking an extractor change.
+
+Existing professors are left untouched by ``insert_professor``; replay into a
+fresh database (or after removing stale vertices) to rewrite them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Sequence
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.config import get_settings
+from app.services.firecrawl_service import extract_professor
+from app.services.raw_archive import ArchiveEntry, RawPayloadArchive
+from app.services.scrape_orchestrator import ScrapeOrchestrator, ScrapeSummary
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay archived scrape payloads")
+    parser.add_argument(
+        "--archive-dir",
+        type=Path,
+        help="Archive directory (defaults to RAW_ARCHIVE_DIR)",
+    )
+    parser.add_argument("--batch-size", type=int, default=32, help="Payloads per batch")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel batches")
+    parser.add_argument("--match", help="Only replay URLs matching this regex")
+    parser.add_argument("--limit", type=int, help="Replay at most this many payloads")
+    parser.add_argument(
+        "--all-captures",
+        action="store_true",
+        help="Replay every archived capture instead of the newest per URL",
+    )
+    parser.add_argument(
+        "--extract-only",
+        action="store_true",
+        help="Run extraction only (no embeddings or HelixDB writes)",
+    )
+    parser.add_argument(
+        "--init-schema",
+        action="store_true",
+        help="Attempt to apply the Helix schema before replaying",
+    )
+    return parser.parse_args()
+
+
+def _batches(entries: Sequence[ArchiveEntry], size: int) -> List[List[ArchiveEntry]]:
+    size = max(1, size)
+    return [list(entries[start : start + size]) for start in range(0, len(entries), size)]
+
+
+def _extract_batch(directory: str, entries: List[ArchiveEntry]) -> int:
+    archive = RawPayloadArchive(directory, codec=entries[0].codec if entries else None)
+    failures = 0
+    for payload in archive.iter_payloads(entries):
+        try:
+            extract_professor(payload)
+        except Exception:
+            failures += 1
+    return failures
+
+
+def main() -> None:
+    args = parse_args()
+    settings = get_settings()
+    directory = args.archive_dir or settings.raw_archive_dir
+    if not directory:
+        raise SystemExit("No archive directory. Pass --archive-dir or set RAW_ARCHIVE_DIR.")
+
+    archive = RawPayloadArchive(directory, codec=settings.raw_archive_codec)
+    entries = archive.entries(latest_only=not args.all_captures)
+    if args.match:
+        pattern = re.compile(args.match)
+        entries = [entry for entry in entries if pattern.search(entry.url)]
+    if args.limit is not None:
+        entries = entries[: args.limit]
+    if not entries:
+        raise SystemExit(f"No archived payloads to replay in {directory}.")
+
+    # Sorting by location keeps each batch's reads sequential within a segment.
+    entries.sort(key=lambda entry: (entry.segment, entry.offset))
+    batches = _batches(entries, args.batch_size)
+    print(f"Replaying {len(entries)} payloads in {len(batches)} batches from {directory}")
+    started = time.perf_counter()
+
+    if args.extract_only:
+        failures = 0
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [pool.submit(_extract_batch, str(directory), batch) for batch in batches]
+            for future in as_completed(futures):
+                failures += future.result()
+        elapsed = time.perf_counter() - started
+        print(
+            f"Extracted {len(entries) - failures} / {len(entries)} payloads in "
+            f"{elapsed:.2f}s ({len(entries) / elapsed:.0f}/s)."
+        )
+        return
+
+    orchestrator = ScrapeOrchestrator(settings=settings, archive=archive)
+    if args.init_schema:
+        orchestrator.helix.initialize_schema()
+
+    def replay(batch: List[ArchiveEntry]) -> ScrapeSummary:
+        return orchestrator.process_payloads(list(archive.iter_payloads(batch)))
+
+    results = []
+    with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="replay") as pool:
+        futures = [pool.submit(replay, batch) for batch in batches]
+        for future in as_completed(futures):
+            summary = future.result()
+            results.extend(summary.results)
+            print(f"Batch done: {summary.success_count}/{summary.total} succeeded")
+
+    payload = ScrapeSummary(results=results).to_dict()
+    elapsed = time.perf_counter() - started
+    print(
+        f"Replayed {payload['success_count']} / {payload['total']} payloads "
+        f"({payload['failure_count']} failed) in {elapsed:.2f}s."
+    )
+    for result in payload["results"]:
+        if not result["success"]:
+            print(f"[FAIL] {result['url']} :: {result['error']}")
+
+
+if __name__ == "__main__":
+    main()
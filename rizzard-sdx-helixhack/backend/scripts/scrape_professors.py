@@ -13,7 +13,8 @@ if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
 from app.config import get_settings
-from app.services.scrape_orchestrator import ScrapeOrchestrator
+from app.services.crawler import DirectoryCrawler
+from app.services.scrape_orchestrator import ScrapeOrchestrator, ScrapeSummary
 
 
 def _load_urls(path: Path) -> List[str]:
@@ -58,33 +59,118 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Attempt to apply the Helix schema before scraping",
     )
+
+    crawl = parser.add_argument_group(
+        "crawl mode",
+        "Discover profile URLs from department listings or sitemaps instead of "
+        "supplying them by hand.",
+    )
+    crawl.add_argument(
+        "--listing",
+        action="append",
+        default=[],
+        metavar="URL",
+        help="Department listing page to harvest profile links from (repeatable)",
+    )
+    crawl.add_argument(
+        "--sitemap",
+        action="append",
+        default=[],
+        metavar="URL",
+        help="Sitemap or sitemap index to harvest profile URLs from (repeatable)",
+    )
+    crawl.add_argument(
+        "--department",
+        help="Department name to attach to discovered URLs (defaults to the listing page)",
+    )
+    crawl.add_argument(
+        "--profile-pattern",
+        help="Regex a discovered URL must match (defaults to CRAWL_PROFILE_URL_PATTERN)",
+    )
+    crawl.add_argument(
+        "--max-profiles",
+        type=int,
+        help="Upper bound on profiles scraped in this job",
+    )
+    crawl.add_argument(
+        "--concurrency",
+        type=int,
+        help="Concurrent scrape batches (defaults to CRAWL_MAX_CONCURRENCY)",
+    )
+    crawl.add_argument("--batch-size", type=int, default=10, help="URLs per scrape batch")
+    crawl.add_argument(
+        "--refresh-existing",
+        action="store_true",
+        help="Also queue profiles already in HelixDB, stalest first",
+    )
     return parser.parse_args()
 
 
+def _print_summary(payload: dict) -> None:
+    print(
+        f"Scraped {payload['success_count']} / {payload['total']} URLs ("
+        f"{payload['failure_count']} failed)."
+    )
+
+    for result in payload["results"]:
+        status = "OK" if result["success"] else "FAIL"
+        detail = result.get("helix_id") or result.get("error", "")
+        print(f"[{status}] {result['url']} :: {detail}")
+
+
+def _run_crawl(args: argparse.Namespace) -> None:
+    crawler = DirectoryCrawler(
+        settings=get_settings(),
+        profile_pattern=args.profile_pattern,
+        include_known=args.refresh_existing,
+    )
+    for listing in args.listing:
+        try:
+            crawler.add_listing(listing, department=args.department)
+        except Exception as exc:
+            print(f"[FAIL] listing {listing} :: {exc}")
+    for sitemap in args.sitemap:
+        try:
+            crawler.add_sitemap(sitemap, department=args.department)
+        except Exception as exc:
+            print(f"[FAIL] sitemap {sitemap} :: {exc}")
+
+    print(
+        f"Discovered {crawler.report.discovered} links, "
+        f"queued {crawler.report.queued} profiles."
+    )
+
+    def on_batch(summary: ScrapeSummary) -> None:
+        print(f"Batch done: {summary.success_count}/{summary.total} succeeded")
+
+    report = crawler.run(
+        max_profiles=args.max_profiles,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        initialize_schema=args.init_schema,
+        on_batch=on_batch,
+    )
+    _print_summary(ScrapeSummary(results=report.results).to_dict())
+
+
 def main() -> None:
     args = parse_args()
 
+    if args.listing or args.sitemap:
+        _run_crawl(args)
+        return
+
     urls: List[str] = list(args.urls)
     if args.input:
         urls.extend(_load_urls(args.input))
 
     urls = [url.strip() for url in urls if url.strip()]
     if not urls:
-        raise SystemExit("No URLs supplied. Use arguments or --input file.")
+        raise SystemExit("No URLs supplied. Use arguments, --input file, or --listing/--sitemap.")
 
     orchestrator = ScrapeOrchestrator(settings=get_settings())
     summary = orchestrator.run(urls, initialize_schema=args.init_schema)
-    payload = summary.to_dict()
-
-    print(
-        f"Scraped {payload['success_count']} / {payload['total']} URLs ("
-        f"{payload['failure_count']} failed)."
-    )
-
-    for result in payload["results"]:
-        status = "OK" if result["success"] else "FAIL"
-        detail = result.get("helix_id") or result.get("error", "")
-        print(f"[{status}] {result['url']} :: {detail}")
+    _print_summary(summary.to_dict())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+"""Serve the API from several uvicorn workers that share one copy of the model.
+
+``uvicorn --workers N`` spawns fresh interpreters, so every worker loads its
+own SentenceTransformer weights. This script instead loads the model once in
+the parent, binds the listening socket, and forks the workers: the weights
+are inherited copy-on-write and stay shared as long as nobody writes to them
+(inference does not). Each worker then runs its own uvicorn server on the
+shared socket; dead workers are replaced, and SIGINT/SIGTERM stop them all.
+
+Linux/macOS only (needs ``os.fork``). Use ``--no-preload`` to compare against
+per-worker model loading; ``scripts/bench_worker_memory.py`` measures both.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import uvicorn
+
+from app.config import get_settings
+from app.services.embedding import get_configured_model, model_label
+from app.services.metrics import read_process_memory
+
+logger = logging.getLogger("serve")
+
+RESPAWN_BACKOFF_SECONDS = 1.0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", "2")),
+        help="Worker processes (default: $WEB_CONCURRENCY or 2)",
+    )
+    parser.add_argument(
+        "--no-preload",
+        action="store_true",
+        help="Let each worker load its own model copy (for comparison)",
+    )
+    parser.add_argument(
+        "--torch-threads",
+        type=int,
+        default=None,
+        help="Intra-op threads per worker (default: CPU count / workers)",
+    )
+    parser.add_argument("--log-level", default="info")
+    return parser.parse_args()
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def limit_torch_threads(threads: int) -> None:
+    """Stop N workers from each starting one BLAS/OpenMP thread per core."""
+    for variable in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[variable] = str(threads)
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(threads)
+
+
+def run_worker(sock: socket.socket, args: argparse.Namespace, threads: int) -> None:
+    # The parent's handlers only forward signals; uvicorn installs its own.
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    limit_torch_threads(threads)
+
+    from app.main import app
+
+    config = uvicorn.Config(app, log_level=args.log_level, lifespan="on")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s serve: %(message)s")
+    workers = max(1, args.workers)
+    threads = args.torch_threads or max(1, (os.cpu_count() or 1) // workers)
+    settings = get_settings()
+
+    if not args.no_preload:
+        # Only load the weights here. The first encode (run by each worker's
+        # warm-up) starts torch's thread pool, which does not survive fork.
+        started = time.perf_counter()
+        get_configured_model(settings)
+        memory = read_process_memory()
+        logger.info(
+            "Loaded %s in the parent in %.1fs (RSS %.0f MiB)",
+            model_label(settings),
+            time.perf_counter() - started,
+            memory.get("rss_bytes", memory.get("peak_rss_bytes", 0)) / 2**20,
+        )
+    # Move everything allocated so far out of the collector's reach so GC
+    # passes in the workers do not dirty (and so un-share) those pages.
+    gc.collect()
+    gc.freeze()
+
+    sock = bind_socket(args.host, args.port)
+    children: Dict[int, int] = {}
+    stopping = False
+
+    def spawn(slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_worker(sock, args, threads)
+            except BaseException:
+                logger.exception("Worker %s crashed", slot)
+                code = 1
+            finally:
+                os._exit(code)
+        children[pid] = slot
+        logger.info("Started worker %s (pid %s)", slot, pid)
+
+    def stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    for slot in range(workers):
+        spawn(slot)
+    logger.info(
+        "Serving on http://%s:%s with %s workers (%s, %s torch threads each)",
+        args.host,
+        args.port,
+        workers,
+        "model per worker" if args.no_preload else "shared preloaded model",
+        threads,
+    )
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        slot = children.pop(pid, None)
+        if slot is None or stopping:
+            continue
+        logger.warning("Worker %s (pid %s) exited with status %s; restarting", slot, pid, status)
+        time.sleep(RESPAWN_BACKOFF_SECONDS)
+        spawn(slot)
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()